@@ -1,15 +1,177 @@
 import os
+import sys
+import zlib
 import pytest
 
-from selenium import webdriver
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.chrome import ChromeDriverManager
-
+from src.utils.config import load_config
 from src.utils.logger import logger
+from src.api.core.session_pool import close_default_pool
+from src.api.core.cassette import DEFAULT_CASSETTE_PATH, Cassette, get_default_cassette, use_cassette
+from src.api.core.metrics import api_metrics
+from src.api.core.types import CassetteMode
+from src.api.emulator.petstore_server import FaultConfig, PetstoreEmulator
+from src.ui.driver.driver_pool import UI_DRIVER_MAX_USES, UI_DRIVER_POOL_SIZE, UI_DRIVER_PREWARM
+from src.ui.driver.factory import UI_BROWSER_PROFILE
+from src.ui.driver.types import BrowserProfile
+
+pytest_plugins = ['src.api.load.pytest_plugin']
 
 def pytest_addoption(parser):
   parser.addoption("--browser", action="store", default="chrome", help="Browser to run tests")
+  parser.addoption("--cassette-mode", action="store", default=CassetteMode.PASSTHROUGH.value,
+    choices=[mode.value for mode in CassetteMode], help="Record/replay API traffic: strict, record-missing or passthrough")
+  parser.addoption("--cassette", action="store", default=DEFAULT_CASSETTE_PATH, help="Cassette file for recorded API traffic")
   parser.addoption("--test-log-level", action="store", default="INFO", help="Set logging level")
+  parser.addoption("--api-emulator", action="store_true", default=False, help="Run API tests against the in-process Petstore emulator")
+  parser.addoption("--api-metrics-json", action="store", default=None, help="Write per-endpoint API latency metrics to this JSON file")
+  parser.addoption("--api-emulator-faults", action="store", default="", help="Emulator faults, e.g. 'latency=0.05,error_rate=0.01,stale_reads=1'")
+  parser.addoption("--driver-pool-size", action="store", type=int, default=UI_DRIVER_POOL_SIZE, help="Number of browser sessions reused across UI tests")
+  parser.addoption("--driver-max-uses", action="store", type=int, default=UI_DRIVER_MAX_USES, help="Replace a browser session after this many tests, 0 for never")
+  parser.addoption("--driver-prewarm", action="store", type=int, default=UI_DRIVER_PREWARM, help="Launch this many browser sessions in the background while tests are collected")
+  parser.addoption("--browser-profile", action="store", default=UI_BROWSER_PROFILE,
+    choices=[profile.value for profile in BrowserProfile], help="standard, or fast: headless with images, fonts, media and analytics blocked")
+  parser.addoption("--no-pet-gc", action="store_true", default=False, help="Keep pets created by the tests instead of deleting them at session end")
+
+def pytest_configure(config):
+  cassette_mode = CassetteMode(config.getoption("--cassette-mode"))
+  if cassette_mode != CassetteMode.PASSTHROUGH:
+    cassette = use_cassette(config.getoption("--cassette"), cassette_mode)
+    logger.info(f"Using {cassette_mode.value} cassette {cassette.path} with {len(cassette)} recorded interactions")
+    # Test data drawn while modules are collected (e.g. parametrize values) must match the recording too
+    _seed_test_data(0)
+
+  # Started before collection, because API clients read API_BASE_URL when test modules are imported
+  if config.getoption("--api-emulator"):
+    emulator = PetstoreEmulator(FaultConfig.parse(config.getoption("--api-emulator-faults"))).start()
+    os.environ['API_BASE_URL'] = emulator.base_url
+    config._petstore_emulator = emulator
+    logger.info(f"Petstore emulator listening on {emulator.base_url}")
+
+  # Only strict replays never reach a backend; record-missing runs create real pets for every miss.
+  # The base URL is read from the environment, as importing the API client requires all of its settings
+  if not config.getoption("--no-pet-gc") and cassette_mode != CassetteMode.STRICT:
+    load_config()
+    base_url = os.getenv('API_BASE_URL')
+    if base_url:
+      from src.api.pet.pet_tracker import CleanupReport, CreatedPetTracker, use_tracker
+      tracker = use_tracker(CreatedPetTracker(base_url))
+      config._pet_gc_report = CleanupReport()
+      if tracker.pending():
+        logger.info(f"Adopted {len(tracker.pending())} pets left over by earlier runs")
+
+  # The xdist controller runs no tests, so only its workers warm up browsers
+  prewarm = config.getoption("--driver-prewarm")
+  if prewarm > 0 and not (getattr(config.option, 'numprocesses', None) and not hasattr(config, 'workerinput')):
+    pool = _get_driver_pool(config)
+    logger.info(f"Launching {len(pool.prewarm(prewarm))} {config.getoption('--browser')} sessions in the background")
+
+def _get_driver_pool(config):
+  pool = getattr(config, '_driver_pool', None)
+  if pool is None:
+    from src.ui.driver.driver_pool import DriverPool
+    from src.ui.driver.factory import create_driver, quit_driver
+
+    browser = config.getoption("--browser")
+    profile = BrowserProfile(config.getoption("--browser-profile"))
+    pool = config._driver_pool = DriverPool(
+      lambda: create_driver(browser, profile),
+      size=config.getoption("--driver-pool-size"),
+      max_uses=config.getoption("--driver-max-uses"),
+      quit=quit_driver
+    )
+  return pool
+
+def _cleanup_pets(config):
+  from src.api.pet.pet_api import PetApi
+  from src.api.pet.pet_tracker import get_default_tracker
+  # Cleanup deletes go to the backend and are never recorded or replayed
+  report = get_default_tracker().cleanup(PetApi(cassette=Cassette()))
+  config._pet_gc_report.merge(report)
+  logger.info(f"Pet cleanup deleted {report.deleted}, found {report.absent} already gone, left {len(report.leftovers)}")
+
+@pytest.hookimpl(trylast=True)
+def pytest_runtest_teardown(item, nextitem):
+  if not hasattr(item.config, '_pet_gc_report'):
+    return
+  from src.api.pet.pet_tracker import get_default_tracker
+  if get_default_tracker().should_cleanup():
+    _cleanup_pets(item.config)
+
+def pytest_sessionfinish(session):
+  # xdist workers hand their API metrics to the controller, which reports them
+  if hasattr(session.config, 'workeroutput'):
+    session.config.workeroutput['api_metrics'] = api_metrics.export()
+
+  if not hasattr(session.config, '_pet_gc_report'):
+    return
+  from src.api.pet.pet_tracker import get_default_tracker, use_tracker
+  tracker = get_default_tracker()
+  if tracker.pending():
+    _cleanup_pets(session.config)
+    # The api_session_pool fixture has already closed the shared pool, which the cleanup client reopened
+    close_default_pool()
+  tracker.close()
+  use_tracker(None)
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+  exported = getattr(node, 'workeroutput', {}).get('api_metrics')
+  if exported:
+    api_metrics.merge(exported)
+
+def pytest_unconfigure(config):
+  emulator = getattr(config, '_petstore_emulator', None)
+  if emulator is not None:
+    emulator.stop()
+
+  pool = getattr(config, '_driver_pool', None)
+  if pool is not None:
+    logger.info(f"Closing driver pool: {pool.created} sessions launched, {pool.recycled} recycled")
+    pool.close()
+
+def pytest_terminal_summary(terminalreporter, config):
+  report = getattr(config, '_pet_gc_report', None)
+  if report is not None and (report.deleted or report.absent or report.leftovers):
+    terminalreporter.section("Pet cleanup")
+    terminalreporter.write_line(f"{report.deleted} deleted, {report.absent} already gone, {len(report.leftovers)} left over")
+    if report.leftovers:
+      terminalreporter.write_line(f"Left over, retried by the next run: {', '.join(map(str, report.leftovers))}")
+
+  pool = getattr(config, '_driver_pool', None)
+  if pool is not None and pool.created:
+    stats = pool.stats()
+    terminalreporter.section("Browser sessions")
+    terminalreporter.write_line(
+      f"{stats['created']} launched (mean {stats['launch_mean']:.2f}s, max {stats['launch_max']:.2f}s), {stats['recycled']} recycled; "
+      f"{stats['acquired']} tests waited mean {stats['wait_mean']:.2f}s, max {stats['wait_max']:.2f}s"
+    )
+
+  totals = getattr(config, '_blocking_totals', None)
+  if totals is not None:
+    terminalreporter.write_line(
+      f"Fast profile blocked {totals.blocked} requests, ~{totals.bytes_saved / 1048576:.1f} MiB saved (estimated), "
+      f"{totals.bytes_loaded / 1048576:.1f} MiB loaded"
+    )
+
+  # Only present when UI page objects were imported, and selenium with them
+  locators = sys.modules.get('src.ui.pages.core.locators')
+  if locators is not None and locators.registry.stats():
+    terminalreporter.section("Locator lookups")
+    for line in locators.registry.format_lines():
+      terminalreporter.write_line(line)
+
+  summary = api_metrics.summary()
+  if not summary:
+    return
+
+  terminalreporter.section("API latency per endpoint")
+  for line in api_metrics.format_table():
+    terminalreporter.write_line(line)
+
+  metrics_path = config.getoption("--api-metrics-json")
+  if metrics_path:
+    api_metrics.to_json(metrics_path)
+    terminalreporter.write_line(f"API metrics written to {metrics_path}")
 
 @pytest.fixture(scope='session')
 def browser(request):
@@ -28,28 +190,62 @@ def setup_logging(request):
     env_log_level = os.getenv('LOG_LEVEL', 'INFO')
     logger.info(f"Test log level set to {env_log_level} via environment variable")
 
-@pytest.fixture(scope='function')
-def driver(browser):
-  logger.info(f"Initializing {browser} driver")
-  browser = browser.lower()
-
-  if browser == 'firefox':
-    logger.debug("Setting up Firefox driver")
-    driver = webdriver.Firefox(service=webdriver.FirefoxService(service=webdriver.FirefoxService(GeckoDriverManager().install())))
-  elif browser == 'chrome':
-    logger.debug("Setting up Chrome driver")
-    driver = webdriver.Chrome(service=webdriver.ChromeService(service=webdriver.ChromeService(ChromeDriverManager().install())))
-  else:
-    logger.error(f"Unsupported browser: {browser}")
-    raise ValueError(f"Unsupported browser: {browser}")
+def _seed_test_data(seed: int):
+  from src.utils.randomize import get_faker
+  from test_data.factories.id_allocator import MAX_SESSION
+  from test_data.factories.pet_data_factory import pet_ids
 
-  logger.debug("Maximizing browser window")
-  driver.maximize_window()
-  logger.info(f"Successfully initialized {browser} driver")
+  get_faker().seed_instance(seed)
+  pet_ids.restart(seed & MAX_SESSION, worker=0)
+
+@pytest.fixture(autouse=True)
+def reproducible_test_data(request):
+  """
+  While a cassette is active, seed Faker and the pet id allocator from the test id,
+  so every run sends the same bodies and URLs as the recording, whatever the test order
+  """
+  if get_default_cassette().active:
+    _seed_test_data(zlib.crc32(request.node.nodeid.encode()))
+
+@pytest.fixture(scope='session')
+def petstore_emulator(request):
+  """The running Petstore emulator, or None when tests target a real backend"""
+  return getattr(request.config, '_petstore_emulator', None)
+
+@pytest.fixture(scope='session', autouse=True)
+def api_session_pool():
+  """Close the shared API connection pool once the test session ends"""
+  yield
+  logger.debug("Closing shared API session pool")
+  close_default_pool()
+
+@pytest.fixture(scope='session')
+def driver_pool(request):
+  """Browser sessions shared by the UI tests of this worker, closed when pytest exits"""
+  return _get_driver_pool(request.config)
+
+@pytest.fixture(scope='function')
+def driver(driver_pool, request):
+  driver = driver_pool.acquire()
+  fast = request.config.getoption("--browser-profile") == BrowserProfile.FAST.value
+  if fast:
+    from src.ui.driver.fast_profile import collect_blocking_stats
+    # Drop whatever the previous test or the reset left in the log
+    collect_blocking_stats(driver)
 
   yield driver
 
-  logger.info("Closing browser driver")
-  driver.close()
-  driver.quit()
-  logger.info("Browser driver closed successfully")
+  if fast:
+    stats = collect_blocking_stats(driver)
+    if stats is not None:
+      logger.info(f"Blocked {stats.blocked} requests, ~{stats.bytes_saved / 1024:.0f} KiB saved, {stats.bytes_loaded / 1024:.0f} KiB loaded")
+      request.node.user_properties.append(('blocked_requests', stats.blocked))
+      request.node.user_properties.append(('bytes_saved', stats.bytes_saved))
+      _blocking_totals(request.config).add(stats)
+  driver_pool.release(driver)
+
+def _blocking_totals(config):
+  from src.ui.driver.fast_profile import BlockingStats
+  if not hasattr(config, '_blocking_totals'):
+    config._blocking_totals = BlockingStats()
+  return config._blocking_totals
@@ -1,23 +1,53 @@
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from src.api.core.types import HttpMethod
-from dotenv import load_dotenv
+from src.api.core.session_pool import SessionPool, get_default_pool
+from src.api.core.cassette import Cassette, get_default_cassette
+from src.api.core.hedging import HedgePolicy, hedged_call
+from src.api.core.latency import LatencyTracker, endpoint_template
+from src.api.core.metrics import api_metrics
+from src.utils.config import load_config
+import threading
+import time
 import os
 
-load_dotenv()
+load_config()
 
 API_BASE_URL = os.getenv('API_BASE_URL')
 TIMEOUT_IN_SECS = int(os.getenv('TIMEOUT_IN_SECS'))
+API_POOL_CONNECTIONS = int(os.getenv('API_POOL_CONNECTIONS', 10))
+API_POOL_MAXSIZE = int(os.getenv('API_POOL_MAXSIZE', 10))
+API_POOL_BLOCK = os.getenv('API_POOL_BLOCK', 'false').lower() == 'true'
+API_HEDGE_WORKERS = int(os.getenv('API_HEDGE_WORKERS', 32))
 
 class BaseApi:
   """
   Base API client class for making HTTP requests.
   Attributes:
     _base_url (str): Base URL for API endpoints
-    _headers (str): Default headers for requests
+    _pool (SessionPool): Pooled keep-alive transport, shared between clients by default
+    _headers (dict): Default headers for requests
+    _hedge_policy (HedgePolicy): Opt-in hedging of GET and PUT calls
+    _cassette (Cassette): Record/replay store for requests, inactive in passthrough mode
   """
-  def __init__(self) -> None:
-    self._base_url = API_BASE_URL
-    self._headers = 'Content-Type: application/json'
+  # Recent latencies per (method, endpoint template), shared by all clients
+  latency_tracker = LatencyTracker()
+  _hedge_executor = None
+  _hedge_executor_lock = threading.Lock()
+
+  def __init__(self, pool: SessionPool = None, hedge_policy: HedgePolicy = None, cassette: Cassette = None, base_url: str = None) -> None:
+    self._base_url = base_url or API_BASE_URL
+    self._pool = pool or get_default_pool(
+      pool_connections=API_POOL_CONNECTIONS,
+      pool_maxsize=API_POOL_MAXSIZE,
+      pool_block=API_POOL_BLOCK
+    )
+    self._headers = self._pool.headers
+    self._hedge_policy = hedge_policy
+    self._cassette = cassette if cassette is not None else get_default_cassette()
+
+  @property
+  def base_url(self) -> str:
+    return self._base_url
 
   def _get(self, endpoint, **kwargs):
     """
@@ -27,7 +57,7 @@ class BaseApi:
     Returns:
       requests.Response: HTTP response object
     """
-    return self.__make_request(endpoint=endpoint, method=HttpMethod.GET, **kwargs)
+    return self.__make_idempotent_request(endpoint=endpoint, method=HttpMethod.GET, **kwargs)
 
   def _post(self, endpoint, json=None, **kwargs):
     """
@@ -49,7 +79,7 @@ class BaseApi:
     Returns:
       requests.Response: HTTP response object
     """
-    return self.__make_request(endpoint=endpoint, method=HttpMethod.PUT, json=json, **kwargs)
+    return self.__make_idempotent_request(endpoint=endpoint, method=HttpMethod.PUT, json=json, **kwargs)
 
   def _patch(self, endpoint, json=None, **kwargs):
     """
@@ -70,8 +100,53 @@ class BaseApi:
     Returns:
       requests.Response: HTTP response object
     """
+    # Not hedged: a duplicate DELETE answers 404 once the first one has deleted the resource
     return self.__make_request(endpoint=endpoint, method=HttpMethod.DELETE, **kwargs)
 
+  def _url(self, endpoint) -> str:
+    """
+    Args:
+      endpoint (str): API endpoint path (e.g., '/pets/123')
+    Returns:
+      str: Absolute request URL
+    """
+    return self._base_url + endpoint
+
+  @classmethod
+  def __get_hedge_executor(cls) -> ThreadPoolExecutor:
+    with cls._hedge_executor_lock:
+      if cls._hedge_executor is None:
+        cls._hedge_executor = ThreadPoolExecutor(max_workers=API_HEDGE_WORKERS, thread_name_prefix='hedged-api')
+      return cls._hedge_executor
+
+  def __make_idempotent_request(self, endpoint, method, json=None, **kwargs):
+    """
+    Send a request that is safe to repeat, hedging it when a HedgePolicy is set.
+    Args:
+      endpoint (str): API endpoint path
+      method (HttpMethod): HTTP method enum value
+      json (dict, optional): JSON payload for request body
+      **kwargs: Additional request parameters
+    Returns:
+      requests.Response: HTTP response object
+    """
+    if self._hedge_policy is None:
+      return self.__make_request(endpoint=endpoint, method=method, json=json, **kwargs)
+
+    template = endpoint_template(endpoint)
+    observed = BaseApi.latency_tracker.percentile(
+      method.value,
+      template,
+      self._hedge_policy.percentile,
+      self._hedge_policy.min_samples
+    )
+    return hedged_call(
+      lambda: self.__make_request(endpoint=endpoint, method=method, json=json, **kwargs),
+      self._hedge_policy.delay(observed),
+      BaseApi.__get_hedge_executor(),
+      on_hedge=lambda: api_metrics.record_retries(method.value, template)
+    )
+
   def __make_request(self, endpoint, method, json=None, **kwargs):
     """
     Args:
@@ -84,24 +159,43 @@ class BaseApi:
     Raises:
       requests.RequestException: If the HTTP request fails
       ValueError: If an unsupported HTTP method is provided
+      CassetteMissError: If a strict cassette has no recording for the request
     """
-    url = self._base_url + endpoint
-    timeout = dict(**kwargs).get('timeout')
+    if not isinstance(method, HttpMethod):
+      raise ValueError(f"Unsupported HTTP method: {method}")
+
+    url = self._url(endpoint)
+    timeout = kwargs.get('timeout')
 
     if timeout is None:
       timeout = TIMEOUT_IN_SECS
 
-    if method == HttpMethod.GET:
-      return requests.get(url=url, timeout=timeout)
-    
-    if method == HttpMethod.POST:
-      return requests.post(url=url, json=json, timeout=timeout)
-
-    if method == HttpMethod.PUT:
-      return requests.put(url=url, json=json, timeout=timeout)
+    cassette = self._cassette if self._cassette.active else None
+    if cassette is not None:
+      replayed = cassette.replay(method.value, endpoint, json, kwargs.get('params'), url)
+      if replayed is not None:
+        return replayed
 
-    if method == HttpMethod.PATCH:
-      return requests.patch(url=url, json=json, timeout=timeout)
+    template = endpoint_template(endpoint)
+    started = time.perf_counter()
+    try:
+      # Per-call headers are merged over the pool's default headers by the session
+      response = self._pool.request(
+        method.value,
+        url,
+        json=json,
+        params=kwargs.get('params'),
+        headers=kwargs.get('headers'),
+        timeout=timeout
+      )
+    except Exception:
+      api_metrics.record(method.value, template, time.perf_counter() - started, None)
+      raise
 
-    if method == HttpMethod.DELETE:
-      return requests.delete(url=url, json=json, timeout=timeout)
+    latency = time.perf_counter() - started
+    BaseApi.latency_tracker.record(method.value, template, latency)
+    body = response.request.body
+    api_metrics.record(method.value, template, latency, response.status_code, len(response.content), len(body) if body else 0)
+    if cassette is not None:
+      cassette.record(method.value, endpoint, json, response, kwargs.get('params'))
+    return response
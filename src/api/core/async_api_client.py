@@ -0,0 +1,81 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from src.api.core.api_client import BaseApi
+from src.api.core.session_pool import SessionPool
+
+DEFAULT_CONCURRENCY = 50
+
+class AsyncBaseApi:
+  """
+  Asyncio front-end for a BaseApi client.
+
+  Requests run on the client's pooled keep-alive transport through a fixed-size
+  executor, so any number of coroutines share at most `concurrency` worker
+  threads and connections. Timeouts follow the same TIMEOUT_IN_SECS semantics
+  as the blocking client and can be overridden per call with `timeout=`.
+  Attributes:
+    _client (BaseApi): Blocking client that performs the requests
+    _concurrency (int): Maximum number of in-flight requests
+  """
+  def __init__(self, client: BaseApi, concurrency: int = DEFAULT_CONCURRENCY, owns_pool: bool = False) -> None:
+    if concurrency < 1:
+      raise ValueError(f"Concurrency must be at least 1, got {concurrency}")
+
+    self._client = client
+    self._concurrency = concurrency
+    self._owns_pool = owns_pool
+    self._semaphore = asyncio.Semaphore(concurrency)
+    self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='async-api')
+
+  @staticmethod
+  def _create_pool(concurrency: int) -> SessionPool:
+    """
+    Create a pool that keeps one connection per concurrent request alive.
+    """
+    return SessionPool(pool_maxsize=concurrency)
+
+  @property
+  def concurrency(self) -> int:
+    return self._concurrency
+
+  async def _run(self, func, *args, **kwargs):
+    """
+    Run a blocking client call once a concurrency slot is free.
+    Args:
+      func (callable): Bound method of the blocking client
+      *args: Positional arguments for the call
+      **kwargs: Keyword arguments for the call
+    Returns:
+      requests.Response: HTTP response object
+    """
+    async with self._semaphore:
+      loop = asyncio.get_running_loop()
+      return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+  @staticmethod
+  async def gather(*aws):
+    """
+    Await many calls together, keeping per-call results in input order.
+    Args:
+      *aws: Awaitables, e.g. coroutines returned by the client methods
+    Returns:
+      list: Response objects, or the exception raised for that call
+    """
+    return await asyncio.gather(*aws, return_exceptions=True)
+
+  async def aclose(self):
+    """
+    Shut down the worker threads and, when owned, the connection pool.
+    """
+    # Waiting for in-flight requests blocks, so it runs off the event loop
+    await asyncio.to_thread(self._executor.shutdown, True)
+    if self._owns_pool:
+      self._client._pool.close()
+
+  async def __aenter__(self):
+    return self
+
+  async def __aexit__(self, exc_type, exc, tb):
+    await self.aclose()
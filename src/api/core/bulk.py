@@ -0,0 +1,77 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, List, Optional
+
+from requests import Response
+
+from src.api.core.types import BulkStatus
+
+@dataclass
+class BulkResult:
+  """
+  Outcome of one item of a bulk call.
+  Attributes:
+    index (int): Position of the item in the input
+    item (Any): Input payload or id
+    status (BulkStatus): OK, FAILED (non-2xx), ERROR (exception) or SKIPPED (not run)
+    response (Response, optional): HTTP response, when one was received
+    error (Exception, optional): Exception raised by the call
+    latency (float): Call duration in seconds
+  """
+  index: int
+  item: Any
+  status: BulkStatus = BulkStatus.SKIPPED
+  response: Optional[Response] = None
+  error: Optional[Exception] = None
+  latency: float = 0.0
+
+  @property
+  def ok(self) -> bool:
+    return self.status == BulkStatus.OK
+
+def _timed_call(func: Callable, result: BulkResult, stop: Optional[threading.Event]) -> BulkResult:
+  if stop is not None and stop.is_set():
+    return result
+
+  started = time.perf_counter()
+  try:
+    result.response = func(result.item)
+    result.status = BulkStatus.OK if result.response.ok else BulkStatus.FAILED
+  except Exception as e:
+    result.error = e
+    result.status = BulkStatus.ERROR
+  result.latency = time.perf_counter() - started
+
+  if stop is not None and not result.ok:
+    stop.set()
+  return result
+
+def run_bulk(func: Callable, items: Iterable, max_workers: int, stop_on_failure: bool = False) -> List[BulkResult]:
+  """
+  Run `func` for every item on a worker pool.
+  Args:
+    func (Callable): Single-item call, e.g. a bound PetApi method
+    items (Iterable): Payloads or ids to process
+    max_workers (int): Number of worker threads
+    stop_on_failure (bool): Cancel the items not yet started after the first failure
+  Returns:
+    List[BulkResult]: One result per item, in input order
+  """
+  results = [BulkResult(index=i, item=item) for i, item in enumerate(items)]
+  if not results:
+    return results
+
+  # Workers check the stop flag before starting, so no new item begins once a failure is seen
+  stop = threading.Event() if stop_on_failure else None
+  with ThreadPoolExecutor(max_workers=min(max_workers, len(results)), thread_name_prefix='bulk-api') as executor:
+    futures = [executor.submit(_timed_call, func, result, stop) for result in results]
+    if stop is not None:
+      for future in as_completed(futures):
+        if stop.is_set():
+          for pending in futures:
+            pending.cancel()
+          break
+
+  return results
@@ -0,0 +1,191 @@
+import base64
+import hashlib
+import json
+import os
+import threading
+from datetime import timedelta
+from typing import Dict, List, Optional
+from urllib.parse import urlencode
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from src.api.core.types import CassetteMode
+
+DEFAULT_CASSETTE_PATH = 'cassettes/api.jsonl'
+# Response headers worth keeping; the rest (dates, servers, cookies) only add noise
+RECORDED_HEADERS = ('Content-Type', 'Content-Encoding')
+
+class CassetteMissError(KeyError):
+  """
+  Raised in strict mode when a request has no recorded interaction.
+  """
+
+def body_hash(json_body) -> str:
+  """
+  Hash a JSON request body independently of key order and whitespace.
+  Args:
+    json_body: JSON-serializable request body, or None
+  Returns:
+    str: Short hex digest, empty for requests without a body
+  """
+  if json_body is None:
+    return ''
+  normalized = json.dumps(json_body, sort_keys=True, separators=(',', ':'), default=str)
+  return hashlib.sha1(normalized.encode()).hexdigest()[:16]
+
+def interaction_key(method: str, endpoint: str, json_body, params=None) -> str:
+  """
+  Key of a request, independent of the backend it was sent to.
+  Args:
+    method (str): HTTP method name
+    endpoint (str): Endpoint path relative to the API base URL (e.g. '/pet/123')
+    json_body: JSON request body, or None
+    params (dict, optional): Query parameters
+  Returns:
+    str: Method, endpoint with sorted query and normalized body hash
+  """
+  if params:
+    endpoint += '?' + urlencode(sorted(params.items()), doseq=True)
+  return f'{method} {endpoint} {body_hash(json_body)}'
+
+class Cassette:
+  """
+  On-disk record of request/response pairs, one compact JSON object per line.
+
+  Interactions are indexed by method, endpoint path (relative to the base URL)
+  and normalized body hash, so a cassette recorded against one backend (e.g.
+  the emulator on a random port) replays against any other. Bodies and ids
+  hold random test data, which matches between runs because conftest seeds it
+  per test while a cassette is active (see reproducible_test_data). Repeated
+  identical requests replay their recorded responses in order (so a recorded
+  404 followed by a 200 replays the same way); in strict mode the last one is
+  then replayed again, in record-missing mode further repeats are recorded.
+  Attributes:
+    path (str): Cassette file path
+    mode (CassetteMode): STRICT replays only, RECORD_MISSING replays hits and records misses,
+      PASSTHROUGH neither replays nor records
+  """
+  def __init__(self, path: str = DEFAULT_CASSETTE_PATH, mode: CassetteMode = CassetteMode.PASSTHROUGH) -> None:
+    self.path = path
+    self.mode = CassetteMode(mode)
+    self._lock = threading.Lock()
+    self._index: Dict[str, List[dict]] = {}
+    self._cursors: Dict[str, int] = {}
+    self.hits = 0
+    self.misses = 0
+    if self.mode != CassetteMode.PASSTHROUGH:
+      self._load()
+
+  @property
+  def active(self) -> bool:
+    return self.mode != CassetteMode.PASSTHROUGH
+
+  def _load(self):
+    if not os.path.exists(self.path):
+      return
+    with open(self.path, 'r', encoding='utf-8') as file:
+      for line in file:
+        if line.strip():
+          entry = json.loads(line)
+          self._index.setdefault(entry['k'], []).append(entry)
+
+  def __len__(self):
+    with self._lock:
+      return sum(len(entries) for entries in self._index.values())
+
+  def replay(self, method: str, endpoint: str, json_body=None, params=None, url: str = None) -> Optional[Response]:
+    """
+    Args:
+      method (str): HTTP method name
+      endpoint (str): Endpoint path relative to the API base URL
+      json_body: JSON request body, or None
+      params (dict, optional): Query parameters
+      url (str, optional): Absolute request URL, set on the replayed response
+    Returns:
+      Response or None: Recorded response, or None when the request was never recorded
+    Raises:
+      CassetteMissError: In strict mode, when the request was never recorded
+    """
+    key = interaction_key(method, endpoint, json_body, params)
+    with self._lock:
+      entries = self._index.get(key)
+      cursor = self._cursors.get(key, 0)
+      # When recording, a request repeated more often than recorded goes live, so 404-then-200 sequences get captured
+      if not entries or (self.mode == CassetteMode.RECORD_MISSING and cursor >= len(entries)):
+        self.misses += 1
+        if self.mode == CassetteMode.STRICT:
+          raise CassetteMissError(f"No recorded interaction for {key} in {self.path}")
+        return None
+
+      self._cursors[key] = cursor + 1
+      self.hits += 1
+      entry = entries[min(cursor, len(entries) - 1)]
+
+    return self._to_response(entry, url or endpoint)
+
+  def record(self, method: str, endpoint: str, json_body, response: Response, params=None):
+    """
+    Append an interaction to the cassette file and the in-memory index.
+    Args:
+      method (str): HTTP method name
+      endpoint (str): Endpoint path relative to the API base URL
+      json_body: JSON request body, or None
+      response (Response): Live response to record
+      params (dict, optional): Query parameters
+    """
+    key = interaction_key(method, endpoint, json_body, params)
+    entry = {'k': key, 's': response.status_code, 'r': response.reason}
+    headers = {name: response.headers[name] for name in RECORDED_HEADERS if name in response.headers}
+    if headers:
+      entry['h'] = headers
+    try:
+      entry['b'] = response.content.decode('utf-8')
+    except UnicodeDecodeError:
+      entry['b64'] = base64.b64encode(response.content).decode('ascii')
+
+    line = json.dumps(entry, separators=(',', ':')) + '\n'
+    with self._lock:
+      entries = self._index.setdefault(key, [])
+      entries.append(entry)
+      # A freshly recorded response is the one this run has just seen
+      self._cursors[key] = len(entries)
+      directory = os.path.dirname(self.path)
+      if directory:
+        os.makedirs(directory, exist_ok=True)
+      with open(self.path, 'a', encoding='utf-8') as file:
+        file.write(line)
+
+  @staticmethod
+  def _to_response(entry: dict, url: str) -> Response:
+    response = Response()
+    response.status_code = entry['s']
+    response.reason = entry.get('r')
+    response.headers = CaseInsensitiveDict(entry.get('h', {}))
+    response._content = base64.b64decode(entry['b64']) if 'b64' in entry else entry.get('b', '').encode('utf-8')
+    response.encoding = 'utf-8'
+    response.url = url
+    response.elapsed = timedelta(0)
+    return response
+
+_default_cassette = Cassette()
+
+def get_default_cassette() -> Cassette:
+  """
+  Returns:
+    Cassette: Cassette used by API clients that are not given one
+  """
+  return _default_cassette
+
+def use_cassette(path: str = DEFAULT_CASSETTE_PATH, mode: CassetteMode = CassetteMode.PASSTHROUGH) -> Cassette:
+  """
+  Replace the default cassette used by API clients created afterwards.
+  Args:
+    path (str): Cassette file path
+    mode (CassetteMode): Cassette mode
+  Returns:
+    Cassette: The new default cassette
+  """
+  global _default_cassette
+  _default_cassette = Cassette(path, mode)
+  return _default_cassette
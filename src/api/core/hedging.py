@@ -0,0 +1,92 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from requests import Response
+
+@dataclass
+class HedgePolicy:
+  """
+  Settings for hedged idempotent requests.
+  Attributes:
+    percentile (float): Latency percentile of the endpoint after which a second attempt is sent
+    min_samples (int): Samples needed before the percentile is trusted
+    fallback_delay (float, optional): Hedge delay in seconds while samples are missing; None disables hedging until then
+    min_delay (float): Lower bound for the hedge delay in seconds
+  """
+  percentile: float = 95.0
+  min_samples: int = 20
+  fallback_delay: Optional[float] = None
+  min_delay: float = 0.01
+
+  def delay(self, observed: Optional[float]) -> Optional[float]:
+    """
+    Args:
+      observed (float, optional): Percentile latency from the tracker
+    Returns:
+      float or None: Seconds to wait before hedging, or None to not hedge
+    """
+    if observed is None:
+      observed = self.fallback_delay
+    if observed is None:
+      return None
+    return max(observed, self.min_delay)
+
+def _is_good(future: Future, hedge: bool = False) -> bool:
+  # The hedge may reach the server after the primary already changed the resource,
+  # so only its success wins; its 4xx answers are kept as a last resort
+  if future.exception() is not None:
+    return False
+  return future.result().status_code < (400 if hedge else 500)
+
+def _discard(future: Future):
+  """
+  Release the connection held by a losing attempt once it finishes.
+  An attempt that has already started cannot be stopped; it still reaches the server.
+  """
+  if not future.cancel():
+    future.add_done_callback(lambda f: f.exception() is None and f.result().close())
+
+def hedged_call(send: Callable[[], Response], delay: Optional[float], executor: ThreadPoolExecutor, on_hedge: Optional[Callable[[], None]] = None) -> Response:
+  """
+  Send a request and, if it has not answered within `delay`, a second identical one.
+  The primary attempt wins with any response below 500, the hedge only with one below
+  400, so a hedge's 404 cannot hide the primary's success. The losing attempt is
+  cancelled if not started yet, otherwise it still runs to completion on the server
+  and its response is closed, so only requests that are safe to apply twice should be hedged.
+  Args:
+    send (Callable): Performs one attempt of the request
+    delay (float, optional): Seconds to wait before hedging; None sends a single attempt
+    executor (ThreadPoolExecutor): Executor running the attempts
+    on_hedge (Callable, optional): Called when the second attempt is sent
+  Returns:
+    Response: Winning response; when neither wins, the hedge's 4xx response if the primary
+      failed with a 5xx or an exception, else the primary attempt's result
+  Raises:
+    Exception: The primary attempt's exception when neither attempt has a response below 500
+  """
+  if delay is None:
+    return send()
+
+  primary = executor.submit(send)
+  done, _ = wait([primary], timeout=delay)
+  if done:
+    return primary.result()
+
+  hedge = executor.submit(send)
+  if on_hedge is not None:
+    on_hedge()
+  pending = {primary, hedge}
+  while pending:
+    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+    for future in done:
+      if _is_good(future, hedge=future is hedge):
+        _discard(hedge if future is primary else primary)
+        return future.result()
+
+  # Neither attempt won: both are done, so a hedge's 4xx beats the primary's failure
+  if _is_good(hedge):
+    _discard(primary)
+    return hedge.result()
+  _discard(hedge)
+  return primary.result()
@@ -0,0 +1,67 @@
+import re
+import threading
+from collections import deque
+from typing import Dict, Optional, Tuple
+
+DEFAULT_WINDOW_SIZE = 200
+
+_ID_SEGMENT = re.compile(r'^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})$')
+
+def endpoint_template(endpoint: str) -> str:
+  """
+  Collapse id-like path segments so calls to the same route share one key.
+  Args:
+    endpoint (str): API endpoint path (e.g., '/pet/123')
+  Returns:
+    str: Endpoint template (e.g., '/pet/{id}')
+  """
+  path = endpoint.split('?', 1)[0]
+  return '/'.join('{id}' if _ID_SEGMENT.match(segment) else segment for segment in path.split('/'))
+
+class LatencyTracker:
+  """
+  Sliding window of recent request latencies per (method, endpoint template).
+  Attributes:
+    window_size (int): Number of most recent samples kept per key
+  """
+  def __init__(self, window_size: int = DEFAULT_WINDOW_SIZE) -> None:
+    self.window_size = window_size
+    self._lock = threading.Lock()
+    self._samples: Dict[Tuple[str, str], deque] = {}
+
+  def record(self, method: str, template: str, latency: float):
+    """
+    Args:
+      method (str): HTTP method name
+      template (str): Endpoint template
+      latency (float): Request duration in seconds
+    """
+    key = (method, template)
+    with self._lock:
+      samples = self._samples.get(key)
+      if samples is None:
+        samples = self._samples[key] = deque(maxlen=self.window_size)
+      samples.append(latency)
+
+  def percentile(self, method: str, template: str, percentile: float, min_samples: int = 1) -> Optional[float]:
+    """
+    Args:
+      method (str): HTTP method name
+      template (str): Endpoint template
+      percentile (float): Percentile between 0 and 100
+      min_samples (int): Minimum number of samples required for an answer
+    Returns:
+      float or None: Latency in seconds, or None when there are too few samples
+    """
+    with self._lock:
+      samples = self._samples.get((method, template))
+      if samples is None or len(samples) < max(min_samples, 1):
+        return None
+      ordered = sorted(samples)
+
+    index = min(len(ordered) - 1, int(round(percentile / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+  def reset(self):
+    with self._lock:
+      self._samples.clear()
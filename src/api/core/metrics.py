@@ -0,0 +1,263 @@
+import json
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+# Sub-bucket precision: 2^7 linear steps per power of two keeps values within ~1.6%
+SUB_BUCKET_BITS = 7
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+SUB_BUCKET_HALF = SUB_BUCKET_COUNT >> 1
+# Highest trackable value is 2^36 microseconds (~19 hours); larger values are clamped
+MAX_VALUE_BITS = 36
+BUCKET_COUNT = SUB_BUCKET_COUNT + (MAX_VALUE_BITS - SUB_BUCKET_BITS) * SUB_BUCKET_HALF
+SUMMARY_PERCENTILES = (50, 90, 99)
+
+class LatencyHistogram:
+  """
+  Fixed-memory, HDR-style log-linear histogram of latencies in microseconds.
+
+  Values below 2^7 are counted exactly; above that, each power of two is split
+  into 64 linear sub-buckets, so any recorded value is reported within ~1.6%
+  while memory stays at a fixed ~2k counters regardless of sample count.
+  """
+  __slots__ = ('counts', 'total', 'min', 'max', 'sum')
+
+  def __init__(self) -> None:
+    self.counts = [0] * BUCKET_COUNT
+    self.total = 0
+    self.min = None
+    self.max = 0
+    self.sum = 0
+
+  @staticmethod
+  def _index(value: int) -> int:
+    if value < SUB_BUCKET_COUNT:
+      return value
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    return min(SUB_BUCKET_COUNT + (shift - 1) * SUB_BUCKET_HALF + (value >> shift) - SUB_BUCKET_HALF, BUCKET_COUNT - 1)
+
+  @staticmethod
+  def _highest_value(index: int) -> int:
+    if index < SUB_BUCKET_COUNT:
+      return index
+    shift = (index - SUB_BUCKET_COUNT) // SUB_BUCKET_HALF + 1
+    mantissa = (index - SUB_BUCKET_COUNT) % SUB_BUCKET_HALF + SUB_BUCKET_HALF
+    return ((mantissa + 1) << shift) - 1
+
+  def record(self, micros: int):
+    micros = max(int(micros), 0)
+    self.counts[self._index(micros)] += 1
+    self.total += 1
+    self.sum += micros
+    self.max = max(self.max, micros)
+    self.min = micros if self.min is None else min(self.min, micros)
+
+  def percentile(self, percentile: float) -> int:
+    """
+    Args:
+      percentile (float): Percentile between 0 and 100
+    Returns:
+      int: Latency in microseconds at or above the given share of samples, 0 when empty
+    """
+    if self.total == 0:
+      return 0
+    rank = max(1, int(round(percentile / 100 * self.total)))
+    seen = 0
+    for index, count in enumerate(self.counts):
+      seen += count
+      if seen >= rank:
+        return min(self._highest_value(index), self.max)
+    return self.max
+
+  def merge(self, other: 'LatencyHistogram'):
+    """
+    Add the samples of another histogram, e.g. one recorded by another xdist worker.
+    Args:
+      other (LatencyHistogram): Histogram to add
+    """
+    for index, count in enumerate(other.counts):
+      if count:
+        self.counts[index] += count
+    self.total += other.total
+    self.sum += other.sum
+    self.max = max(self.max, other.max)
+    if other.min is not None:
+      self.min = other.min if self.min is None else min(self.min, other.min)
+
+  def to_dict(self) -> dict:
+    """
+    Returns:
+      dict: Plain-data form with the non-empty buckets only, see from_dict
+    """
+    return {
+      'counts': {index: count for index, count in enumerate(self.counts) if count},
+      'total': self.total,
+      'min': self.min,
+      'max': self.max,
+      'sum': self.sum
+    }
+
+  @classmethod
+  def from_dict(cls, data: Dict[str, Any]) -> 'LatencyHistogram':
+    histogram = cls()
+    for index, count in data['counts'].items():
+      histogram.counts[int(index)] = count
+    histogram.total = data['total']
+    histogram.min = data['min']
+    histogram.max = data['max']
+    histogram.sum = data['sum']
+    return histogram
+
+class EndpointMetrics:
+  """
+  Counters for one (method, endpoint template) pair.
+  """
+  __slots__ = ('histogram', 'statuses', 'bytes_in', 'bytes_out', 'retries', 'errors')
+
+  def __init__(self) -> None:
+    self.histogram = LatencyHistogram()
+    self.statuses = Counter()
+    self.bytes_in = 0
+    self.bytes_out = 0
+    self.retries = 0
+    self.errors = 0
+
+class ApiMetrics:
+  """
+  Thread-safe registry of per-endpoint API call metrics.
+  """
+  def __init__(self) -> None:
+    self._lock = threading.Lock()
+    self._endpoints: Dict[Tuple[str, str], EndpointMetrics] = {}
+
+  def _endpoint(self, method: str, template: str) -> EndpointMetrics:
+    # Caller must hold the lock
+    key = (method, template)
+    metrics = self._endpoints.get(key)
+    if metrics is None:
+      metrics = self._endpoints[key] = EndpointMetrics()
+    return metrics
+
+  def record(self, method: str, template: str, latency: float, status: Optional[int], bytes_in: int = 0, bytes_out: int = 0):
+    """
+    Args:
+      method (str): HTTP method name
+      template (str): Endpoint template (e.g., '/pet/{id}')
+      latency (float): Call duration in seconds
+      status (int, optional): Response status code, None when the call raised
+      bytes_in (int): Response body size
+      bytes_out (int): Request body size
+    """
+    with self._lock:
+      metrics = self._endpoint(method, template)
+      metrics.histogram.record(latency * 1_000_000)
+      metrics.bytes_in += bytes_in
+      metrics.bytes_out += bytes_out
+      if status is None:
+        metrics.errors += 1
+      else:
+        metrics.statuses[status] += 1
+
+  def record_retries(self, method: str, template: str, count: int = 1):
+    """
+    Args:
+      method (str): HTTP method name
+      template (str): Endpoint template
+      count (int): Number of extra attempts (hedges, polling retries)
+    """
+    if count <= 0:
+      return
+    with self._lock:
+      self._endpoint(method, template).retries += count
+
+  def reset(self):
+    with self._lock:
+      self._endpoints.clear()
+
+  def export(self) -> List[dict]:
+    """
+    Returns:
+      List[dict]: Plain-data metrics per endpoint, which an xdist worker hands to the controller
+    """
+    with self._lock:
+      return [
+        {
+          'method': method,
+          'endpoint': template,
+          'histogram': metrics.histogram.to_dict(),
+          'statuses': dict(metrics.statuses),
+          'bytes_in': metrics.bytes_in,
+          'bytes_out': metrics.bytes_out,
+          'retries': metrics.retries,
+          'errors': metrics.errors
+        }
+        for (method, template), metrics in self._endpoints.items()
+      ]
+
+  def merge(self, exported: List[dict]):
+    """
+    Args:
+      exported (List[dict]): Output of export() from another process
+    """
+    with self._lock:
+      for entry in exported:
+        metrics = self._endpoint(entry['method'], entry['endpoint'])
+        metrics.histogram.merge(LatencyHistogram.from_dict(entry['histogram']))
+        metrics.statuses.update({int(status): count for status, count in entry['statuses'].items()})
+        metrics.bytes_in += entry['bytes_in']
+        metrics.bytes_out += entry['bytes_out']
+        metrics.retries += entry['retries']
+        metrics.errors += entry['errors']
+
+  def summary(self) -> List[dict]:
+    """
+    Returns:
+      List[dict]: One entry per endpoint, latencies in milliseconds, sorted by method and template
+    """
+    with self._lock:
+      items = sorted(self._endpoints.items())
+      result = []
+      for (method, template), metrics in items:
+        histogram = metrics.histogram
+        entry = {
+          'method': method,
+          'endpoint': template,
+          'count': histogram.total,
+          'errors': metrics.errors,
+          'retries': metrics.retries,
+          'statuses': {str(status): count for status, count in sorted(metrics.statuses.items())},
+          'bytes_in': metrics.bytes_in,
+          'bytes_out': metrics.bytes_out,
+          'mean_ms': round(histogram.sum / histogram.total / 1000, 3) if histogram.total else 0.0,
+          'max_ms': round(histogram.max / 1000, 3)
+        }
+        for percentile in SUMMARY_PERCENTILES:
+          entry[f'p{percentile}_ms'] = round(histogram.percentile(percentile) / 1000, 3)
+        result.append(entry)
+      return result
+
+  def to_json(self, path: str):
+    """
+    Args:
+      path (str): Output file for the summary
+    """
+    with open(path, 'w', encoding='utf-8') as file:
+      json.dump({'endpoints': self.summary()}, file, indent=2)
+
+  def format_table(self) -> List[str]:
+    """
+    Returns:
+      List[str]: Summary table lines for terminal output
+    """
+    header = f"{'endpoint':<28} {'count':>6} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9} {'errors':>6} {'retries':>7}  statuses"
+    lines = [header, '-' * len(header)]
+    for entry in self.summary():
+      statuses = ' '.join(f'{status}:{count}' for status, count in entry['statuses'].items())
+      lines.append(
+        f"{entry['method'] + ' ' + entry['endpoint']:<28} {entry['count']:>6} {entry['p50_ms']:>9.1f} {entry['p90_ms']:>9.1f} "
+        f"{entry['p99_ms']:>9.1f} {entry['max_ms']:>9.1f} {entry['errors']:>6} {entry['retries']:>7}  {statuses}"
+      )
+    return lines
+
+# Process-wide metrics fed by every BaseApi call
+api_metrics = ApiMetrics()
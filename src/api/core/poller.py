@@ -0,0 +1,128 @@
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+import requests
+from requests import Response
+
+DEFAULT_INITIAL_DELAY = 0.1
+DEFAULT_MAX_DELAY = 2.0
+DEFAULT_MULTIPLIER = 2.0
+# Weight of the newest sample in the convergence time moving average
+EWMA_ALPHA = 0.3
+
+@dataclass
+class PollResult:
+  """
+  Outcome of polling a call until the expected state is observed.
+  Attributes:
+    response (Response, optional): Last response received
+    attempts (int): Number of calls made
+    elapsed (float): Seconds from the first call until convergence or the deadline
+    converged (bool): Whether the expected state was observed before the deadline
+  """
+  response: Optional[Response]
+  attempts: int
+  elapsed: float
+  converged: bool
+
+class ConvergenceStats:
+  """
+  Running convergence statistics per operation name, e.g. 'get_pet'.
+
+  The moving average of past convergence times is used to pick the first
+  backoff delay, so a backend that usually converges in ~1s is not hammered
+  every 100ms while one that converges instantly is not slept on.
+  """
+  def __init__(self) -> None:
+    self._lock = threading.Lock()
+    self._stats: Dict[str, dict] = {}
+
+  def record(self, operation: str, result: PollResult):
+    with self._lock:
+      stats = self._stats.setdefault(operation, {'calls': 0, 'converged': 0, 'attempts': 0, 'ewma_elapsed': None, 'max_elapsed': 0.0})
+      stats['calls'] += 1
+      stats['attempts'] += result.attempts
+      if result.converged:
+        stats['converged'] += 1
+        ewma = stats['ewma_elapsed']
+        stats['ewma_elapsed'] = result.elapsed if ewma is None else EWMA_ALPHA * result.elapsed + (1 - EWMA_ALPHA) * ewma
+        stats['max_elapsed'] = max(stats['max_elapsed'], result.elapsed)
+
+  def typical_elapsed(self, operation: str) -> Optional[float]:
+    with self._lock:
+      stats = self._stats.get(operation)
+      return stats['ewma_elapsed'] if stats else None
+
+  def snapshot(self) -> Dict[str, dict]:
+    with self._lock:
+      return {operation: dict(stats) for operation, stats in self._stats.items()}
+
+def poll_until(
+  call: Callable[[], Response],
+  condition: Callable[[Response], bool],
+  deadline: float,
+  initial_delay: float = DEFAULT_INITIAL_DELAY,
+  max_delay: float = DEFAULT_MAX_DELAY,
+  multiplier: float = DEFAULT_MULTIPLIER,
+  stats: Optional[ConvergenceStats] = None,
+  operation: Optional[str] = None
+) -> PollResult:
+  """
+  Repeat `call` until `condition` holds or the overall deadline passes.
+
+  The first call is made immediately. Delays then grow exponentially with
+  equal jitter, starting from half the typical convergence time recorded in
+  `stats` when available, and never sleep past the deadline.
+  Args:
+    call (Callable): Performs one request and returns the response
+    condition (Callable): Returns True when the response shows the expected state
+    deadline (float): Overall time budget in seconds
+    initial_delay (float): Lower bound for the first backoff delay
+    max_delay (float): Upper bound for any single backoff delay
+    multiplier (float): Backoff growth factor
+    stats (ConvergenceStats, optional): Statistics to adapt from and record into
+    operation (str, optional): Statistics key for this call
+  Returns:
+    PollResult: Last response, attempt count, elapsed time and convergence flag
+  Raises:
+    requests.RequestException: If every attempt failed without a response
+  """
+  delay = initial_delay
+  if stats is not None and operation is not None:
+    typical = stats.typical_elapsed(operation)
+    if typical:
+      delay = min(max(initial_delay, typical / 2), max_delay)
+
+  started = time.monotonic()
+  end = started + deadline
+  attempts = 0
+  response = None
+  last_error = None
+
+  while True:
+    attempts += 1
+    try:
+      response = call()
+      last_error = None
+      if condition(response):
+        result = PollResult(response, attempts, time.monotonic() - started, True)
+        break
+    except requests.RequestException as e:
+      last_error = e
+
+    remaining = end - time.monotonic()
+    if remaining <= 0:
+      if response is None and last_error is not None:
+        raise last_error
+      result = PollResult(response, attempts, time.monotonic() - started, False)
+      break
+
+    time.sleep(min(delay / 2 + random.uniform(0, delay / 2), remaining))
+    delay = min(delay * multiplier, max_delay)
+
+  if stats is not None and operation is not None:
+    stats.record(operation, result)
+  return result
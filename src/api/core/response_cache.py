@@ -0,0 +1,143 @@
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Optional
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL_IN_SECS = 30.0
+
+def clone_response(response: Response, url: str = None) -> Response:
+  """
+  Build a detached copy of a response, optionally under another URL.
+  Args:
+    response (Response): Response to copy; its body is read if not already
+    url (str, optional): URL the copy reports
+  Returns:
+    Response: Copy sharing no mutable state with the original
+  """
+  clone = Response()
+  clone.status_code = response.status_code
+  clone.reason = response.reason
+  clone.headers = CaseInsensitiveDict(response.headers)
+  clone.encoding = response.encoding
+  clone._content = response.content
+  clone.url = response.url if url is None else url
+  clone.elapsed = timedelta(0)
+  return clone
+
+class ResponseCache:
+  """
+  Thread-safe LRU cache of responses keyed by URL, with per-entry TTL.
+
+  Responses are copied on the way in and out, so callers never share one
+  Response (or the view memoized on it). Every invalidation bumps a per-URL
+  generation: a response fetched before an invalidation is put with the
+  generation read before the request and then dropped, instead of bringing
+  back a body that an update or delete has made stale.
+  Attributes:
+    max_entries (int): Number of entries kept before the least recently used is evicted
+    ttl (float): Seconds an entry stays valid after it is stored
+  """
+  def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl: float = DEFAULT_TTL_IN_SECS) -> None:
+    self.max_entries = max_entries
+    self.ttl = ttl
+    self._lock = threading.Lock()
+    self._entries: OrderedDict = OrderedDict()
+    self._generations = {}
+    self.hits = 0
+    self.misses = 0
+    self.evictions = 0
+    self.expirations = 0
+    self.invalidations = 0
+    self.stale_puts = 0
+
+  def get(self, url: str) -> Optional[Response]:
+    """
+    Args:
+      url (str): Request URL
+    Returns:
+      Response or None: Copy of the cached response, or None on a miss or an expired entry
+    """
+    with self._lock:
+      entry = self._entries.get(url)
+      if entry is None:
+        self.misses += 1
+        return None
+
+      expires_at, response = entry
+      if expires_at <= time.monotonic():
+        del self._entries[url]
+        self.expirations += 1
+        self.misses += 1
+        return None
+
+      self._entries.move_to_end(url)
+      self.hits += 1
+    return clone_response(response)
+
+  def generation(self, url: str) -> int:
+    """
+    Args:
+      url (str): Request URL
+    Returns:
+      int: Number of times the URL was invalidated, to read before requesting it
+    """
+    with self._lock:
+      return self._generations.get(url, 0)
+
+  def put(self, url: str, response: Response, generation: Optional[int] = None):
+    """
+    Args:
+      url (str): Request URL
+      response (Response): Response to cache; a copy is stored
+      generation (int, optional): generation(url) read before the request was sent;
+        the response is dropped if the URL was invalidated since
+    """
+    response = clone_response(response)
+    with self._lock:
+      if generation is not None and generation != self._generations.get(url, 0):
+        self.stale_puts += 1
+        return
+      self._entries[url] = (time.monotonic() + self.ttl, response)
+      self._entries.move_to_end(url)
+      while len(self._entries) > self.max_entries:
+        self._entries.popitem(last=False)
+        self.evictions += 1
+
+  def invalidate(self, url: str):
+    """
+    Args:
+      url (str): Request URL whose entry is dropped
+    """
+    with self._lock:
+      self._generations[url] = self._generations.get(url, 0) + 1
+      if self._entries.pop(url, None) is not None:
+        self.invalidations += 1
+
+  def clear(self):
+    with self._lock:
+      self._entries.clear()
+
+  def stats(self) -> dict:
+    """
+    Returns:
+      dict: Entry count and hit/miss/eviction/expiration/invalidation/stale put counters
+    """
+    with self._lock:
+      return {
+        'entries': len(self._entries),
+        'hits': self.hits,
+        'misses': self.misses,
+        'evictions': self.evictions,
+        'expirations': self.expirations,
+        'invalidations': self.invalidations,
+        'stale_puts': self.stale_puts
+      }
+
+  def __len__(self):
+    with self._lock:
+      return len(self._entries)
@@ -0,0 +1,113 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_HEADERS = {
+  'Content-Type': 'application/json',
+  'Accept': 'application/json'
+}
+
+class SessionPool:
+  """
+  Pooled keep-alive HTTP transport shared by API clients.
+
+  A single HTTPAdapter (and therefore a single urllib3 connection pool) is
+  mounted on one requests.Session per thread. Connections are reused across
+  threads while cookies and other session state stay thread-local.
+  Attributes:
+    pool_connections (int): Number of per-host connection pools to cache
+    pool_maxsize (int): Maximum number of kept-alive connections per host
+    pool_block (bool): Block when a host pool is exhausted instead of opening extra connections
+    headers (dict): Default headers sent with every request
+  """
+  def __init__(self, pool_connections=10, pool_maxsize=10, pool_block=False, headers=None) -> None:
+    self.pool_connections = pool_connections
+    self.pool_maxsize = pool_maxsize
+    self.pool_block = pool_block
+    self.headers = dict(DEFAULT_HEADERS if headers is None else headers)
+    self._adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+    self._local = threading.local()
+    self._sessions = []
+    self._lock = threading.Lock()
+    self._closed = False
+
+  @property
+  def closed(self) -> bool:
+    return self._closed
+
+  def session(self) -> requests.Session:
+    """
+    Get the session bound to the calling thread, creating it on first use.
+    Returns:
+      requests.Session: Session sharing this pool's connection adapter
+    Raises:
+      RuntimeError: If the pool has already been closed
+    """
+    if self._closed:
+      raise RuntimeError('SessionPool is closed')
+
+    session = getattr(self._local, 'session', None)
+    if session is None:
+      session = requests.Session()
+      session.headers.update(self.headers)
+      session.mount('http://', self._adapter)
+      session.mount('https://', self._adapter)
+      with self._lock:
+        self._sessions.append(session)
+      self._local.session = session
+    return session
+
+  def request(self, method, url, **kwargs) -> requests.Response:
+    """
+    Send a request through the calling thread's pooled session.
+    Args:
+      method (str): HTTP method name
+      url (str): Absolute request URL
+      **kwargs: Parameters forwarded to requests.Session.request
+    Returns:
+      requests.Response: HTTP response object
+    """
+    return self.session().request(method, url, **kwargs)
+
+  def close(self):
+    """
+    Close every session and release pooled connections. Safe to call more than once.
+    """
+    with self._lock:
+      if self._closed:
+        return
+      self._closed = True
+      sessions, self._sessions = self._sessions, []
+
+    for session in sessions:
+      session.close()
+    self._adapter.close()
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+def get_default_pool(**kwargs) -> SessionPool:
+  """
+  Get the process-wide pool shared by API clients, creating it when missing or closed.
+  Args:
+    **kwargs: SessionPool arguments used only when a new pool is created
+  Returns:
+    SessionPool: Shared session pool
+  """
+  global _default_pool
+  with _default_pool_lock:
+    if _default_pool is None or _default_pool.closed:
+      _default_pool = SessionPool(**kwargs)
+    return _default_pool
+
+def close_default_pool():
+  """
+  Close the process-wide pool if one was created.
+  """
+  global _default_pool
+  with _default_pool_lock:
+    pool, _default_pool = _default_pool, None
+
+  if pool is not None:
+    pool.close()
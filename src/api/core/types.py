@@ -9,3 +9,22 @@ class HttpMethod(str, BaseEnum):
   PUT = 'PUT'
   PATCH = 'PATCH'
   DELETE = 'DELETE'
+
+class BulkStatus(str, BaseEnum):
+  OK = 'OK'
+  FAILED = 'FAILED'
+  ERROR = 'ERROR'
+  SKIPPED = 'SKIPPED'
+
+class ExpectedState(str, BaseEnum):
+  PRESENT = 'PRESENT'
+  ABSENT = 'ABSENT'
+
+class CassetteMode(str, BaseEnum):
+  STRICT = 'strict'
+  RECORD_MISSING = 'record-missing'
+  PASSTHROUGH = 'passthrough'
+
+class ValidationMode(str, BaseEnum):
+  FAST_FAIL = 'fast-fail'
+  EXHAUSTIVE = 'exhaustive'
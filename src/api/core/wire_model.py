@@ -0,0 +1,160 @@
+"""
+Slotted dataclass models with generated JSON wire converters.
+
+@wire_model turns a class into a dataclass with __slots__ and compiles a
+to_wire()/from_wire() pair for it once, at class creation. Field names are
+mapped to camelCase wire keys (photo_urls <-> photoUrls) unless a field sets
+metadata={'wire': ...}. Nested models and lists of models are converted
+recursively.
+"""
+
+import dataclasses
+import typing
+from typing import Any, Dict, List, Tuple
+
+WIRE_FIELDS_ATTR = '__wire_fields__'
+
+def camel_case(name: str) -> str:
+  """
+  Args:
+    name (str): snake_case field name
+  Returns:
+    str: camelCase wire key
+  """
+  head, *rest = name.split('_')
+  return head + ''.join(part.title() for part in rest)
+
+def is_wire_model(cls) -> bool:
+  return isinstance(cls, type) and hasattr(cls, WIRE_FIELDS_ATTR)
+
+def wire_keys(cls) -> Tuple[str, ...]:
+  """
+  Args:
+    cls (type): Wire model class
+  Returns:
+    Tuple[str, ...]: Wire keys of the model's fields, in field order
+  """
+  return tuple(field.metadata.get('wire', camel_case(field.name)) for field in dataclasses.fields(cls))
+
+def _unwrap_optional(tp):
+  if typing.get_origin(tp) is typing.Union:
+    args = [arg for arg in typing.get_args(tp) if arg is not type(None)]
+    if len(args) == 1:
+      return args[0]
+  return tp
+
+def _field_kind(tp) -> Tuple[str, Any]:
+  """
+  Classify a field annotation for code generation.
+  Returns:
+    Tuple[str, Any]: ('model', cls), ('model_list', cls), ('list', item type) or ('scalar', type)
+  """
+  tp = _unwrap_optional(tp)
+  origin = typing.get_origin(tp)
+  if origin in (list, List):
+    (item,) = typing.get_args(tp) or (Any,)
+    item = _unwrap_optional(item)
+    return ('model_list', item) if is_wire_model(item) else ('list', item)
+  if is_wire_model(tp):
+    return 'model', tp
+  return 'scalar', tp
+
+def check_type(value, expected, path: str):
+  """
+  Raise ValueError when a decoded wire value does not have the expected type.
+  Args:
+    value: Decoded value
+    expected: Expected python type (Any accepts everything)
+    path (str): Field path used in the error message
+  """
+  if value is None or expected is Any or not isinstance(expected, type):
+    return
+  # bool is an int subclass but never a valid id or count on the wire
+  if isinstance(value, bool) and expected is not bool:
+    raise ValueError(f"Field {path} expected {expected.__name__}, got bool")
+  if expected is float and isinstance(value, int):
+    return
+  if not isinstance(value, expected):
+    raise ValueError(f"Field {path} expected {expected.__name__}, got {type(value).__name__}")
+
+def _generate(cls):
+  hints = typing.get_type_hints(cls)
+  fields = dataclasses.fields(cls)
+  namespace: Dict[str, Any] = {'check_type': check_type, 'cls': cls}
+
+  to_wire = ['def to_wire(self):', '  data = {}']
+  from_wire = [
+    'def from_wire(data, validate=True):',
+    '  if validate and not isinstance(data, dict):',
+    f"    raise ValueError(f'{cls.__name__} expected an object, got {{type(data).__name__}}')",
+    '  get = data.get'
+  ]
+  arguments = []
+
+  for index, field in enumerate(fields):
+    name = field.name
+    wire = field.metadata.get('wire', camel_case(name))
+    kind, tp = _field_kind(hints[name])
+    type_ref = f'type_{index}'
+    namespace[type_ref] = tp
+    value = f'value_{index}'
+
+    to_wire.append(f'  {value} = self.{name}')
+    to_wire.append(f'  if {value} is not None:')
+    if kind == 'model':
+      to_wire.append(f'    data[{wire!r}] = {value}.to_wire()')
+    elif kind == 'model_list':
+      to_wire.append(f'    data[{wire!r}] = [item.to_wire() for item in {value}]')
+    elif kind == 'list':
+      to_wire.append(f'    data[{wire!r}] = list({value})')
+    else:
+      to_wire.append(f'    data[{wire!r}] = {value}')
+
+    from_wire.append(f'  {value} = get({wire!r})')
+    if kind == 'model':
+      from_wire.append(f'  if {value} is not None:')
+      from_wire.append(f'    {value} = {type_ref}.from_wire({value}, validate)')
+    elif kind in ('model_list', 'list'):
+      from_wire.append(f'  if {value} is not None:')
+      from_wire.append('    if validate:')
+      from_wire.append(f'      check_type({value}, list, {cls.__name__ + "." + wire!r})')
+      if kind == 'model_list':
+        from_wire.append(f'    {value} = [{type_ref}.from_wire(item, validate) for item in {value}]')
+      else:
+        from_wire.append('    if validate:')
+        from_wire.append(f'      for item in {value}:')
+        from_wire.append(f'        check_type(item, {type_ref}, {cls.__name__ + "." + wire + "[]"!r})')
+        from_wire.append(f'      {value} = list({value})')
+      if field.default_factory is not dataclasses.MISSING:
+        from_wire.append('  else:')
+        from_wire.append(f'    {value} = []')
+    else:
+      from_wire.append('  if validate:')
+      from_wire.append(f'    check_type({value}, {type_ref}, {cls.__name__ + "." + wire!r})')
+    arguments.append(value)
+
+  to_wire.append('  return data')
+  from_wire.append(f'  return cls({", ".join(arguments)})')
+
+  exec('\n'.join(to_wire), namespace)
+  exec('\n'.join(from_wire), namespace)
+  return namespace['to_wire'], namespace['from_wire']
+
+def wire_model(cls):
+  """
+  Class decorator creating a slotted dataclass with compiled wire converters.
+  The generated methods are:
+    to_wire(self) -> dict: wire representation, None fields omitted
+    from_wire(data, validate=True) -> model: build from a decoded JSON object;
+      validate=False skips type checks and list copies for trusted input
+  Args:
+    cls (type): Class with annotated fields and defaults
+  Returns:
+    type: Slotted dataclass version of the class
+  """
+  cls = dataclasses.dataclass(slots=True)(cls)
+  setattr(cls, WIRE_FIELDS_ATTR, tuple(field.name for field in dataclasses.fields(cls)))
+  to_wire, from_wire = _generate(cls)
+  cls.to_wire = to_wire
+  cls.from_wire = staticmethod(from_wire)
+  return cls
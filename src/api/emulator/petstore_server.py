@@ -0,0 +1,287 @@
+"""
+In-process Petstore stand-in for offline and high-speed API runs.
+
+This module serves the /pet and /pet/{id} routes used by PetApi from an
+in-memory store on a background thread, with optional latency, error and
+eventual-consistency fault injection.
+"""
+
+import argparse
+import itertools
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass, fields
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+PET_URI = '/pet'
+
+@dataclass
+class FaultConfig:
+  """
+  Faults injected by the emulator.
+  Attributes:
+    latency (float): Seconds added to every response
+    latency_jitter (float): Extra random seconds, uniformly drawn, added to every response
+    error_rate (float): Probability of answering 500 instead of handling the request
+    visibility_delay (float): Seconds a created or updated pet answers 404 to GET, PUT and DELETE
+    stale_reads (int): Number of GET/PUT/DELETE calls answering 404 after a pet is created or updated
+    seed (int, optional): Seed for the jitter and error draws
+  """
+  latency: float = 0.0
+  latency_jitter: float = 0.0
+  error_rate: float = 0.0
+  visibility_delay: float = 0.0
+  stale_reads: int = 0
+  seed: Optional[int] = None
+
+  @classmethod
+  def parse(cls, spec: str) -> 'FaultConfig':
+    """
+    Build a config from a 'key=value,key=value' string.
+    Args:
+      spec (str): Fault spec, e.g. 'latency=0.05,error_rate=0.01,stale_reads=1'
+    Returns:
+      FaultConfig: Parsed config
+    Raises:
+      ValueError: If a key is unknown or a value cannot be converted
+    """
+    types = {field.name: field.type for field in fields(cls)}
+    values = {}
+    for item in filter(None, (part.strip() for part in (spec or '').split(','))):
+      key, _, value = item.partition('=')
+      key = key.strip()
+      if key not in types:
+        raise ValueError(f"Unknown emulator fault: {key}")
+      values[key] = int(value) if key in ('stale_reads', 'seed') else float(value)
+    return cls(**values)
+
+class _PetRecord:
+  __slots__ = ('pet', 'visible_at', 'stale_reads')
+
+  def __init__(self, pet: dict, visible_at: float, stale_reads: int) -> None:
+    self.pet = pet
+    self.visible_at = visible_at
+    self.stale_reads = stale_reads
+
+class PetstoreEmulator:
+  """
+  Loopback Petstore server.
+  Example:
+    >>> with PetstoreEmulator(FaultConfig(stale_reads=1)) as emulator:
+    ...   os.environ['API_BASE_URL'] = emulator.base_url
+  """
+  def __init__(self, faults: FaultConfig = None, host='127.0.0.1', port=0) -> None:
+    self.faults = faults or FaultConfig()
+    self._address = (host, port)
+    self._random = random.Random(self.faults.seed)
+    self._lock = threading.Lock()
+    self._pets: Dict[int, _PetRecord] = {}
+    self._ids = itertools.count(1)
+    self._server = None
+    self._thread = None
+    self.request_count = 0
+
+  @property
+  def base_url(self) -> str:
+    if self._server is None:
+      raise RuntimeError('PetstoreEmulator is not running')
+    host, port = self._server.server_address[:2]
+    return f'http://{host}:{port}'
+
+  def start(self) -> 'PetstoreEmulator':
+    """
+    Bind the server and start serving on a daemon thread.
+    Returns:
+      PetstoreEmulator: This emulator
+    """
+    if self._server is not None:
+      return self
+
+    self._server = ThreadingHTTPServer(self._address, _make_handler(self))
+    self._server.daemon_threads = True
+    self._thread = threading.Thread(target=self._server.serve_forever, name='petstore-emulator', daemon=True)
+    self._thread.start()
+    return self
+
+  def stop(self):
+    if self._server is None:
+      return
+    self._server.shutdown()
+    self._server.server_close()
+    self._thread.join()
+    self._server = None
+    self._thread = None
+
+  def reset(self):
+    """
+    Drop every stored pet.
+    """
+    with self._lock:
+      self._pets.clear()
+
+  def __enter__(self):
+    return self.start()
+
+  def __exit__(self, exc_type, exc, tb):
+    self.stop()
+
+  # Fault injection
+  def _delay(self):
+    with self._lock:
+      jitter = self._random.uniform(0, self.faults.latency_jitter) if self.faults.latency_jitter else 0.0
+    if self.faults.latency or jitter:
+      time.sleep(self.faults.latency + jitter)
+
+  def _should_fail(self) -> bool:
+    if not self.faults.error_rate:
+      return False
+    with self._lock:
+      return self._random.random() < self.faults.error_rate
+
+  # Pet store
+  def _store(self, pet: dict) -> dict:
+    with self._lock:
+      if pet.get('id') is None:
+        pet['id'] = next(self._ids)
+      self._pets[pet['id']] = _PetRecord(
+        pet,
+        visible_at=time.monotonic() + self.faults.visibility_delay,
+        stale_reads=self.faults.stale_reads
+      )
+      return pet
+
+  def _visible(self, pet_id: int) -> Optional[_PetRecord]:
+    """
+    Look a pet up the way an eventually consistent replica would.
+    Caller must hold the lock.
+    """
+    record = self._pets.get(pet_id)
+    if record is None:
+      return None
+    if record.stale_reads > 0:
+      record.stale_reads -= 1
+      return None
+    if record.visible_at > time.monotonic():
+      return None
+    return record
+
+  def create_pet(self, body: dict):
+    pet = {'photoUrls': [], 'tags': [], **body}
+    return HTTPStatus.OK, self._store(pet)
+
+  def get_pet(self, pet_id: int):
+    with self._lock:
+      record = self._visible(pet_id)
+      if record is None:
+        return HTTPStatus.NOT_FOUND, {'code': 1, 'type': 'error', 'message': 'Pet not found'}
+      return HTTPStatus.OK, record.pet
+
+  def update_pet(self, pet_id: int, body: dict):
+    with self._lock:
+      record = self._visible(pet_id)
+      if record is None:
+        return HTTPStatus.NOT_FOUND, {'code': 1, 'type': 'error', 'message': 'Pet not found'}
+      pet = {**record.pet, **body, 'id': pet_id}
+    return HTTPStatus.OK, self._store(pet)
+
+  def delete_pet(self, pet_id: int):
+    with self._lock:
+      if self._visible(pet_id) is None:
+        return HTTPStatus.NOT_FOUND, {'code': 404, 'type': 'unknown', 'message': 'Pet not found'}
+      del self._pets[pet_id]
+      return HTTPStatus.OK, {'code': 200, 'type': 'unknown', 'message': str(pet_id)}
+
+  def handle(self, method: str, path: str, body: bytes):
+    """
+    Route one request.
+    Args:
+      method (str): HTTP method name
+      path (str): Request path, query string included
+      body (bytes): Raw request body
+    Returns:
+      tuple: (HTTPStatus, JSON-serializable body)
+    """
+    with self._lock:
+      self.request_count += 1
+
+    self._delay()
+    if self._should_fail():
+      return HTTPStatus.INTERNAL_SERVER_ERROR, {'code': 500, 'type': 'unknown', 'message': 'something bad happened'}
+
+    segments = path.split('?', 1)[0].rstrip('/').split('/')
+    if '/'.join(segments[:2]) != PET_URI or len(segments) > 3:
+      return HTTPStatus.NOT_FOUND, {'code': 404, 'type': 'unknown', 'message': f'Route {method} {path} not found'}
+
+    payload = None
+    if method in ('POST', 'PUT'):
+      try:
+        payload = json.loads(body or b'null')
+      except ValueError:
+        payload = None
+      if not isinstance(payload, dict):
+        return HTTPStatus.BAD_REQUEST, {'code': 400, 'type': 'unknown', 'message': 'bad input'}
+
+    if len(segments) == 2:
+      if method == 'POST':
+        return self.create_pet(payload)
+      return HTTPStatus.METHOD_NOT_ALLOWED, {'code': 405, 'type': 'unknown', 'message': f'{method} not allowed'}
+
+    raw_id = segments[2]
+    try:
+      pet_id = int(raw_id)
+    except ValueError:
+      return HTTPStatus.NOT_FOUND, {'code': 404, 'type': 'unknown', 'message': f'java.lang.NumberFormatException: For input string: "{raw_id}"'}
+
+    if method == 'GET':
+      return self.get_pet(pet_id)
+    if method == 'PUT':
+      return self.update_pet(pet_id, payload)
+    if method == 'DELETE':
+      return self.delete_pet(pet_id)
+    return HTTPStatus.METHOD_NOT_ALLOWED, {'code': 405, 'type': 'unknown', 'message': f'{method} not allowed'}
+
+def _make_handler(emulator: PetstoreEmulator):
+  class PetstoreHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Buffer headers and body into one write and skip Nagle, so keep-alive clients don't stall
+    wbufsize = -1
+    disable_nagle_algorithm = True
+
+    def _dispatch(self):
+      length = int(self.headers.get('Content-Length') or 0)
+      body = self.rfile.read(length) if length else b''
+      status, data = emulator.handle(self.command, self.path, body)
+      content = json.dumps(data).encode()
+      self.send_response(status)
+      self.send_header('Content-Type', 'application/json')
+      self.send_header('Content-Length', str(len(content)))
+      self.end_headers()
+      self.wfile.write(content)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _dispatch
+
+    def log_message(self, format, *args):
+      pass
+
+  return PetstoreHandler
+
+def main():
+  parser = argparse.ArgumentParser(description='Run the Petstore emulator in the foreground')
+  parser.add_argument('--host', default='127.0.0.1')
+  parser.add_argument('--port', type=int, default=0)
+  parser.add_argument('--faults', default='', help="Fault spec, e.g. 'latency=0.05,error_rate=0.01'")
+  args = parser.parse_args()
+
+  emulator = PetstoreEmulator(FaultConfig.parse(args.faults), host=args.host, port=args.port).start()
+  print(f'Petstore emulator listening on {emulator.base_url}', flush=True)
+  try:
+    emulator._thread.join()
+  except KeyboardInterrupt:
+    emulator.stop()
+
+if __name__ == '__main__':
+  main()
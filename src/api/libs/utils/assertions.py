@@ -3,6 +3,7 @@ from requests import Response
 from assertpy import assert_that
 
 from src.api.libs.utils.data_types import is_valid_json
+from src.api.libs.utils.response_view import view
 
 class Assertions:
   """
@@ -35,11 +36,25 @@ class Assertions:
     Raises:
       KeyError: If the key is not found in the response
     """
-    data = response.json()
+    data = view(response).json
     if key not in data:
       raise KeyError(f"Key {key} not found in response: {data}")
     return data[key]
 
+  @staticmethod
+  def get_value(response: Response, path: str):
+    """
+    Extract a field from the JSON response by path.
+    Args:
+      response (Response): HTTP response object
+      path (str): Field path, e.g. 'category.name' or 'tags[0].name'
+    Returns:
+      Any: Value at the path
+    Raises:
+      KeyError: If the path is not found in the response
+    """
+    return view(response).get(path)
+
   @staticmethod
   def status_ok(response):
     """
@@ -56,10 +71,12 @@ class Assertions:
     """
     Assert that the status code is 404 Not Found.
     Args:
-      actual_code (int): Actual status code to verify
+      actual_code (int | Response): Actual status code, or the response carrying it
     Raises:
       AssertionError: If status code is not 404
     """
+    if isinstance(actual_code, Response):
+      actual_code = actual_code.status_code
     assert_that(404).is_equal_to(actual_code)
 
   # Assertions
@@ -85,7 +102,7 @@ class Assertions:
     Raises:
       AssertionError: If the key is not found
     """
-    assert_that(response.json()).contains_key(key)
+    assert_that(view(response).json).contains_key(key)
 
   @staticmethod
   def contains_text(expected_text, actual_text: str):
@@ -1,7 +1,9 @@
 from requests import Response
 
+from src.api.libs.utils.response_view import view
+
 def is_valid_json(response: Response):
-  if not response.json():
+  if not view(response).json:
     raise TypeError(f"Response is not a valid JSON format. Response text: {response.text}")
 
   return True
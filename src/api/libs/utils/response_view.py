@@ -0,0 +1,102 @@
+import re
+from functools import lru_cache
+from typing import Any, Tuple, Union
+
+from requests import Response
+
+_PATH_TOKEN = re.compile(r'([^.\[\]]+)|\[(-?\d+)\]')
+_MISSING = object()
+
+@lru_cache(maxsize=256)
+def parse_path(path: str) -> Tuple[Union[str, int], ...]:
+  """
+  Split a field path into keys and list indexes.
+  Args:
+    path (str): Path such as 'tags[0].name' or 'category.id'
+  Returns:
+    tuple: Path steps, str for object keys and int for list indexes
+  Raises:
+    ValueError: If the path is empty or malformed
+  """
+  steps = []
+  position = 0
+  for match in _PATH_TOKEN.finditer(path):
+    separator = path[position:match.start()]
+    if separator not in ('', '.') or (separator == '.' and match.group(2) is not None):
+      raise ValueError(f"Invalid field path: {path}")
+    steps.append(match.group(1) if match.group(1) is not None else int(match.group(2)))
+    position = match.end()
+  if not steps or position != len(path):
+    raise ValueError(f"Invalid field path: {path}")
+  return tuple(steps)
+
+class ResponseView:
+  """
+  Read-only view of a response whose JSON body is decoded at most once.
+  Use view(response) to get the view shared by every helper for that response.
+  """
+  __slots__ = ('_response', '_data')
+
+  def __init__(self, response: Response) -> None:
+    self._response = response
+    self._data = _MISSING
+
+  @property
+  def response(self) -> Response:
+    return self._response
+
+  @property
+  def status_code(self) -> int:
+    return self._response.status_code
+
+  @property
+  def text(self) -> str:
+    return self._response.text
+
+  @property
+  def json(self) -> Any:
+    """
+    Returns:
+      Any: Decoded JSON body, parsed on first access only
+    Raises:
+      requests.JSONDecodeError: If the body is not valid JSON
+    """
+    if self._data is _MISSING:
+      self._data = self._response.json()
+    return self._data
+
+  def get(self, path: str, default=_MISSING) -> Any:
+    """
+    Get a field of the JSON body by path.
+    Args:
+      path (str): Field path such as 'tags[0].name'
+      default (Any, optional): Value returned when the path does not exist
+    Returns:
+      Any: Field value
+    Raises:
+      KeyError: If the path does not exist and no default is given
+    """
+    value = self.json
+    for step in parse_path(path):
+      try:
+        value = value[step]
+      except (KeyError, IndexError, TypeError):
+        if default is not _MISSING:
+          return default
+        raise KeyError(f"Path {path} not found in response: {self.json}")
+    return value
+
+def view(response: Union[Response, ResponseView]) -> ResponseView:
+  """
+  Get the view attached to a response, creating it on first use.
+  Args:
+    response (Response | ResponseView): HTTP response object, or a view of one
+  Returns:
+    ResponseView: View shared by all callers for this response
+  """
+  if isinstance(response, ResponseView):
+    return response
+  response_view = response.__dict__.get('_response_view')
+  if response_view is None:
+    response_view = response.__dict__['_response_view'] = ResponseView(response)
+  return response_view
@@ -0,0 +1,110 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Tuple
+
+if TYPE_CHECKING:
+  from jsonschema.protocols import Validator
+
+DEFAULT_CHECK_INTERVAL_IN_SECS = 1.0
+
+class SchemaRegistry:
+  """
+  Loads, checks and compiles every JSON schema in a directory once.
+
+  Each schema is registered under its file URI (and its $id, when set), so
+  relative $ref values such as "category.json#/definitions/category" resolve
+  across files. Compiled validators are cached and the whole directory is
+  reloaded when any schema file is added, removed or modified.
+  Attributes:
+    schema_dir (Path): Directory containing *.json schema files
+    check_interval (float): Minimum seconds between two checks for changed files
+  """
+  def __init__(self, schema_dir, check_interval: float = DEFAULT_CHECK_INTERVAL_IN_SECS) -> None:
+    self.schema_dir = Path(schema_dir).resolve()
+    self.check_interval = check_interval
+    self._lock = threading.Lock()
+    self._signature: Tuple = ()
+    self._checked_at = float('-inf')
+    self._validators: Dict[str, 'Validator'] = {}
+    self.loads = 0
+
+  def _scan(self) -> Tuple:
+    """
+    Returns:
+      Tuple: (relative path, mtime) of every schema file, used to detect changes
+    """
+    return tuple(sorted(
+      (str(path.relative_to(self.schema_dir)), os.stat(path).st_mtime_ns)
+      for path in self.schema_dir.rglob('*.json')
+    ))
+
+  def _load(self, signature: Tuple):
+    # Caller must hold the lock. jsonschema is imported here, on the first lookup, not at import time
+    from jsonschema import Draft7Validator
+    from jsonschema.validators import validator_for
+    from referencing import Registry, Resource
+    from referencing.jsonschema import DRAFT7
+
+    schemas = {}
+    registry = Registry()
+    for name, _ in signature:
+      path = self.schema_dir / name
+      with open(path, 'r') as file:
+        schema = json.load(file)
+      resource = Resource.from_contents(schema, default_specification=DRAFT7)
+      registry = registry.with_resource(path.as_uri(), resource)
+      if isinstance(schema, dict) and schema.get('$id'):
+        registry = registry.with_resource(schema['$id'], resource)
+      schemas[name] = (path.as_uri(), schema)
+
+    validators = {}
+    for name, (uri, schema) in schemas.items():
+      cls = validator_for(schema, default=Draft7Validator)
+      # Metaschema check happens here, once per load, instead of on every validation
+      cls.check_schema(schema)
+      # Schemas without their own $id resolve relative refs against their file URI
+      contents = schema if '$id' in schema else {**schema, '$id': uri}
+      validators[name] = cls(contents, registry=registry)
+
+    self._validators = validators
+    self._signature = signature
+    self.loads += 1
+
+  def _refresh(self):
+    now = time.monotonic()
+    if now - self._checked_at < self.check_interval:
+      return
+    with self._lock:
+      if now - self._checked_at < self.check_interval:
+        return
+      signature = self._scan()
+      if signature != self._signature:
+        self._load(signature)
+      self._checked_at = now
+
+  def validator(self, file_name: str) -> 'Validator':
+    """
+    Args:
+      file_name (str): Schema file name relative to the schema directory, e.g. 'pet.json'
+    Returns:
+      Validator: Compiled validator for the schema
+    Raises:
+      KeyError: If no such schema file exists
+      jsonschema.SchemaError: If a schema is not valid against its metaschema
+    """
+    self._refresh()
+    validator = self._validators.get(str(Path(file_name)))
+    if validator is None:
+      raise KeyError(f"Schema {file_name} not found in {self.schema_dir}")
+    return validator
+
+  def invalidate(self):
+    """
+    Force the next lookup to rescan and reload the schema directory.
+    """
+    with self._lock:
+      self._signature = ()
+      self._checked_at = float('-inf')
@@ -1,20 +1,165 @@
 import json
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, List, Optional, Tuple
 from requests import Response
-from jsonschema import validate, ValidationError
+
+from src.api.core.types import ValidationMode
+from src.api.libs.utils.response_view import view
+from src.api.libs.utils.schema_registry import SchemaRegistry
+
+if TYPE_CHECKING:
+  from jsonschema import ValidationError
+
+DEFAULT_CHUNK_SIZE = 256
+
+@dataclass
+class RecordValidationResult:
+  """
+  Schema validation outcome of one record.
+  Attributes:
+    index (int): Position of the record in the input (line number - 1 for JSONL files)
+    errors (List[Tuple[str, str]]): (JSON pointer, message) per error; empty when valid
+  """
+  index: int
+  errors: List[Tuple[str, str]] = field(default_factory=list)
+
+  @property
+  def valid(self) -> bool:
+    return not self.errors
+
+def _json_pointer(error: 'ValidationError') -> str:
+  return ''.join('/' + str(part).replace('~', '~0').replace('/', '~1') for part in error.absolute_path)
+
+def _record_errors(validator, instance, mode: ValidationMode) -> List[Tuple[str, str]]:
+  errors = validator.iter_errors(instance)
+  if mode == ValidationMode.FAST_FAIL:
+    first = next(errors, None)
+    return [] if first is None else [(_json_pointer(first), first.message)]
+  return sorted((_json_pointer(error), error.message) for error in errors)
+
+# Set in each worker process by _init_worker
+_worker_registry: Optional[SchemaRegistry] = None
+
+def _init_worker(schema_dir: str):
+  global _worker_registry
+  _worker_registry = SchemaRegistry(schema_dir)
+
+def _validate_chunk(chunk: List[Tuple[int, str]], file_name: str, mode: ValidationMode) -> List[RecordValidationResult]:
+  """
+  Parse and validate raw JSON documents inside a worker process.
+  """
+  validator = _worker_registry.validator(file_name)
+  results = []
+  for index, document in chunk:
+    try:
+      instance = json.loads(document)
+    except ValueError as e:
+      results.append(RecordValidationResult(index, [('', f'Invalid JSON: {e}')]))
+      continue
+    results.append(RecordValidationResult(index, _record_errors(validator, instance, mode)))
+  return results
 
 class SchemaValidator:
-  SCHEMA_PATH = 'src/api/libs/schemas'
+  SCHEMA_PATH = str(Path(__file__).resolve().parent.parent / 'schemas')
+  registry = SchemaRegistry(SCHEMA_PATH)
 
   @staticmethod
   def validate_response(response: Response, file_name):
+    from jsonschema import ValidationError
     try:
-      with open(f"{SchemaValidator.SCHEMA_PATH}/{file_name}", 'r') as file:
-        schema = json.load(file)
-      response_data = response.json()
-      validate(instance=response_data, schema=schema)
+      validator = SchemaValidator.registry.validator(file_name)
+      response_data = view(response).json
+      validator.validate(response_data)
 
       return True
     except ValidationError as e:
       raise AssertionError(f"Schema validation failed: {e.message}")
     except Exception as e:
       raise AssertionError(f"Oops! Something went wrong: {str(e)}")
+
+  @staticmethod
+  def validate_many(
+    records: Iterable[Any],
+    file_name,
+    mode: ValidationMode = ValidationMode.FAST_FAIL,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+  ) -> Iterator[RecordValidationResult]:
+    """
+    Validate many records against a schema on a process pool.
+    Records are read lazily and sent to workers in chunks; results are yielded
+    as chunks finish, so they are not in input order (use `index`).
+    Args:
+      records (Iterable[Any]): Responses, raw JSON strings/bytes, or already decoded documents
+      file_name (str): Schema file name, e.g. 'pet.json'
+      mode (ValidationMode): FAST_FAIL reports the first error per record, EXHAUSTIVE all of them
+      workers (int, optional): Number of worker processes, defaults to the CPU count
+      chunk_size (int): Records sent to a worker at once
+    Returns:
+      Iterator[RecordValidationResult]: One result per record
+    """
+    def documents():
+      for index, record in enumerate(records):
+        if isinstance(record, Response):
+          record = record.text
+        elif isinstance(record, bytes):
+          record = record.decode('utf-8')
+        elif not isinstance(record, str):
+          record = json.dumps(record)
+        yield index, record
+
+    return SchemaValidator._validate_documents(documents(), file_name, ValidationMode(mode), workers, chunk_size)
+
+  @staticmethod
+  def validate_jsonl(
+    path,
+    file_name,
+    mode: ValidationMode = ValidationMode.FAST_FAIL,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+  ) -> Iterator[RecordValidationResult]:
+    """
+    Validate every line of a JSONL file of captured bodies against a schema.
+    Args:
+      path (str): JSONL file, one JSON document per line; blank lines are skipped
+      file_name (str): Schema file name, e.g. 'pet.json'
+      mode (ValidationMode): FAST_FAIL reports the first error per record, EXHAUSTIVE all of them
+      workers (int, optional): Number of worker processes, defaults to the CPU count
+      chunk_size (int): Lines sent to a worker at once
+    Returns:
+      Iterator[RecordValidationResult]: One result per non-blank line, index being the 0-based line number
+    """
+    def documents():
+      with open(path, 'r', encoding='utf-8') as file:
+        for index, line in enumerate(file):
+          if line.strip():
+            yield index, line
+
+    return SchemaValidator._validate_documents(documents(), file_name, ValidationMode(mode), workers, chunk_size)
+
+  @staticmethod
+  def _validate_documents(documents: Iterator[Tuple[int, str]], file_name, mode: ValidationMode, workers, chunk_size) -> Iterator[RecordValidationResult]:
+    # Fail fast on an unknown or broken schema, before any worker starts
+    SchemaValidator.registry.validator(file_name)
+    workers = workers or os.cpu_count() or 1
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(SchemaValidator.SCHEMA_PATH,)) as executor:
+      pending = set()
+      exhausted = False
+      while True:
+        # Keep two chunks per worker queued so reading the input never blocks workers
+        while not exhausted and len(pending) < workers * 2:
+          chunk = list(islice(documents, chunk_size))
+          if not chunk:
+            exhausted = True
+            break
+          pending.add(executor.submit(_validate_chunk, chunk, file_name, mode))
+        if not pending:
+          return
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+          yield from future.result()
@@ -0,0 +1,318 @@
+"""
+Open-loop load generator built on PetApi CRUD flows.
+
+Flows start on a fixed schedule derived from the target request rate,
+independently of how fast earlier flows complete. The first request of each
+flow is timed from its scheduled start, so queueing behind a slow backend
+shows up in the latencies instead of silently lowering the offered load
+(coordinated omission).
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from src.api.core.metrics import LatencyHistogram
+from src.api.core.session_pool import SessionPool
+from src.api.emulator.petstore_server import FaultConfig, PetstoreEmulator
+from src.api.pet.pet_api import PetApi
+from test_data.factories.pet_data_factory import create_random_pet_body, update_pet_body
+from src.utils.randomize import rand_unique_str
+
+DEFAULT_MAX_IN_FLIGHT = 256
+DEFAULT_WINDOW_IN_SECS = 5.0
+REPORT_PERCENTILES = (50, 90, 99)
+
+# Each step performs one request from the flow state: {'payload': ..., 'id': ...}
+STEPS: Dict[str, Callable] = {
+  'create_pet': lambda pet_api, state: pet_api.create_pet(state['payload']),
+  'get_pet': lambda pet_api, state: pet_api.get_pet(state['id']),
+  'update_pet': lambda pet_api, state: pet_api.update_pet(
+    state['id'], update_pet_body(state['payload'], {'name': rand_unique_str('load_pet')})
+  ),
+  'delete_pet': lambda pet_api, state: pet_api.delete_pet(state['id'])
+}
+
+FLOWS: Dict[str, List[str]] = {
+  'crud': ['create_pet', 'get_pet', 'update_pet', 'delete_pet'],
+  'create_get': ['create_pet', 'get_pet'],
+  'create_delete': ['create_pet', 'delete_pet'],
+  'create': ['create_pet']
+}
+
+def parse_mix(spec: str) -> Dict[str, float]:
+  """
+  Parse a weighted flow mix.
+  Args:
+    spec (str): Comma separated 'flow=weight' pairs, e.g. 'crud=3,create_get=1'
+  Returns:
+    Dict[str, float]: Weight per flow name
+  Raises:
+    ValueError: If a flow is unknown or no weight is positive
+  """
+  mix = {}
+  for item in filter(None, (part.strip() for part in spec.split(','))):
+    name, _, weight = item.partition('=')
+    name = name.strip()
+    if name not in FLOWS:
+      raise ValueError(f"Unknown flow: {name}. Available flows: {', '.join(FLOWS)}")
+    mix[name] = float(weight) if weight else 1.0
+  if not any(weight > 0 for weight in mix.values()):
+    raise ValueError(f"Flow mix has no positive weight: {spec}")
+  return mix
+
+@dataclass
+class _Window:
+  requests: int = 0
+  errors: int = 0
+  histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+class LoadReport:
+  """
+  Thread-safe results of one load run.
+  Attributes:
+    target_rps (float): Requested request rate
+    duration (float): Scheduling duration in seconds
+    window (float): Width of the timeline windows in seconds
+  """
+  def __init__(self, target_rps: float, duration: float, window: float = DEFAULT_WINDOW_IN_SECS) -> None:
+    self.target_rps = target_rps
+    self.duration = duration
+    self.window = window
+    self.flows_started = 0
+    self.flows_completed = 0
+    self.elapsed = 0.0
+    self.errors = Counter()
+    self._steps: Dict[str, LatencyHistogram] = {}
+    self._windows: Dict[int, _Window] = {}
+    self._lock = threading.Lock()
+
+  def record(self, step: str, offset: float, latency: float, error: Optional[str]):
+    """
+    Args:
+      step (str): Step name, e.g. 'get_pet'
+      offset (float): Completion time in seconds since the run started
+      latency (float): Response time in seconds
+      error (str, optional): Error category, None for a successful request
+    """
+    micros = latency * 1_000_000
+    with self._lock:
+      histogram = self._steps.get(step)
+      if histogram is None:
+        histogram = self._steps[step] = LatencyHistogram()
+      histogram.record(micros)
+
+      window = self._windows.get(int(offset // self.window))
+      if window is None:
+        window = self._windows[int(offset // self.window)] = _Window()
+      window.requests += 1
+      window.histogram.record(micros)
+      if error is not None:
+        window.errors += 1
+        self.errors[f'{step} {error}'] += 1
+
+  def flow_completed(self):
+    with self._lock:
+      self.flows_completed += 1
+
+  @property
+  def requests(self) -> int:
+    with self._lock:
+      return sum(histogram.total for histogram in self._steps.values())
+
+  @property
+  def achieved_rps(self) -> float:
+    return self.requests / self.elapsed if self.elapsed else 0.0
+
+  def to_dict(self) -> dict:
+    with self._lock:
+      steps = {
+        step: {'count': histogram.total, **{f'p{p}_ms': round(histogram.percentile(p) / 1000, 3) for p in REPORT_PERCENTILES}, 'max_ms': round(histogram.max / 1000, 3)}
+        for step, histogram in sorted(self._steps.items())
+      }
+      timeline = [
+        {
+          'start_s': index * self.window,
+          'requests': window.requests,
+          # The last window may be cut short by the end of the run
+          'rps': round(window.requests / max(min(self.window, self.elapsed - index * self.window), 1e-9), 2),
+          'errors': window.errors,
+          **{f'p{p}_ms': round(window.histogram.percentile(p) / 1000, 3) for p in REPORT_PERCENTILES}
+        }
+        for index, window in sorted(self._windows.items())
+      ]
+      errors = dict(self.errors.most_common())
+
+    return {
+      'target_rps': self.target_rps,
+      'duration_s': self.duration,
+      'elapsed_s': round(self.elapsed, 3),
+      'requests': sum(step['count'] for step in steps.values()),
+      'achieved_rps': round(self.achieved_rps, 2),
+      'flows_started': self.flows_started,
+      'flows_completed': self.flows_completed,
+      'errors': errors,
+      'steps': steps,
+      'timeline': timeline
+    }
+
+  def format_lines(self) -> List[str]:
+    """
+    Returns:
+      List[str]: Human readable report
+    """
+    report = self.to_dict()
+    lines = [
+      f"target {report['target_rps']:.1f} req/s, achieved {report['achieved_rps']:.1f} req/s "
+      f"({report['requests']} requests in {report['elapsed_s']:.1f}s, {report['flows_completed']}/{report['flows_started']} flows completed)",
+      f"{'step':<12} {'count':>7} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9}"
+    ]
+    for step, stats in report['steps'].items():
+      lines.append(f"{step:<12} {stats['count']:>7} {stats['p50_ms']:>9.1f} {stats['p90_ms']:>9.1f} {stats['p99_ms']:>9.1f} {stats['max_ms']:>9.1f}")
+    lines.append(f"{'window':<12} {'req/s':>7} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'errors':>9}")
+    for window in report['timeline']:
+      lines.append(f"{window['start_s']:>10.0f}s {window['rps']:>7.1f} {window['p50_ms']:>9.1f} {window['p90_ms']:>9.1f} {window['p99_ms']:>9.1f} {window['errors']:>9}")
+    if report['errors']:
+      lines.append('errors: ' + ', '.join(f'{name}: {count}' for name, count in report['errors'].items()))
+    return lines
+
+class LoadRunner:
+  """
+  Open-loop runner for weighted PetApi flow mixes.
+  Example:
+    >>> report = LoadRunner(rate=50, duration=30, mix={'crud': 3, 'create_get': 1}).run()
+    >>> print('\\n'.join(report.format_lines()))
+  """
+  def __init__(
+    self,
+    rate: float,
+    duration: float,
+    mix: Dict[str, float] = None,
+    base_url: str = None,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    poisson: bool = False,
+    window: float = DEFAULT_WINDOW_IN_SECS,
+    seed: int = None
+  ) -> None:
+    if rate <= 0 or duration <= 0:
+      raise ValueError(f"Rate and duration must be positive, got rate={rate}, duration={duration}")
+
+    self.rate = rate
+    self.duration = duration
+    self.mix = mix or {'crud': 1.0}
+    self.max_in_flight = max_in_flight
+    self.poisson = poisson
+    self.window = window
+    self._random = random.Random(seed)
+    self._pool = SessionPool(pool_maxsize=max_in_flight)
+    self._pet_api = PetApi(pool=self._pool, base_url=base_url)
+
+    self._flow_names = list(self.mix)
+    self._flow_weights = [self.mix[name] for name in self._flow_names]
+    total_weight = sum(self._flow_weights)
+    # Flows are scheduled so that the requests they issue add up to the target rate
+    mean_steps = sum(len(FLOWS[name]) * weight for name, weight in self.mix.items()) / total_weight
+    self.flow_rate = rate / mean_steps
+
+  def _run_flow(self, flow_name: str, scheduled_at: float, started: float, report: LoadReport):
+    state = {'payload': create_random_pet_body()}
+    state['id'] = state['payload']['id']
+    step_start = scheduled_at
+    for step in FLOWS[flow_name]:
+      error = None
+      try:
+        response = STEPS[step](self._pet_api, state)
+        if not response.ok:
+          error = str(response.status_code)
+      except Exception as e:
+        error = type(e).__name__
+
+      finished = time.perf_counter()
+      report.record(step, finished - started, finished - step_start, error)
+      if error is not None:
+        return
+      step_start = finished
+
+    report.flow_completed()
+
+  def _schedule(self):
+    """
+    Yield flow start offsets in seconds, evenly spaced or as a Poisson process.
+    """
+    offset = 0.0
+    while offset < self.duration:
+      yield offset
+      offset += self._random.expovariate(self.flow_rate) if self.poisson else 1.0 / self.flow_rate
+
+  def run(self) -> LoadReport:
+    """
+    Returns:
+      LoadReport: Throughput, errors and latency percentiles per step and over time
+    """
+    report = LoadReport(self.rate, self.duration, self.window)
+    executor = ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix='load-flow')
+    started = time.perf_counter()
+    try:
+      for offset in self._schedule():
+        scheduled_at = started + offset
+        delay = scheduled_at - time.perf_counter()
+        if delay > 0:
+          time.sleep(delay)
+        flow_name = self._random.choices(self._flow_names, self._flow_weights)[0]
+        report.flows_started += 1
+        executor.submit(self._run_flow, flow_name, scheduled_at, started, report)
+    finally:
+      executor.shutdown(wait=True)
+      report.elapsed = time.perf_counter() - started
+      self._pool.close()
+    return report
+
+def main():
+  parser = argparse.ArgumentParser(description='Run an open-loop load test of PetApi CRUD flows')
+  parser.add_argument('--rate', type=float, required=True, help='Target requests per second')
+  parser.add_argument('--duration', type=float, default=30, help='Seconds to keep starting flows')
+  parser.add_argument('--mix', default='crud=1', help=f"Weighted flows, e.g. 'crud=3,create_get=1'. Flows: {', '.join(FLOWS)}")
+  parser.add_argument('--base-url', default=None, help='API base URL, defaults to API_BASE_URL')
+  parser.add_argument('--emulator', action='store_true', help='Run against an in-process Petstore emulator')
+  parser.add_argument('--emulator-faults', default='', help="Emulator faults, e.g. 'latency=0.05,error_rate=0.01'")
+  parser.add_argument('--max-in-flight', type=int, default=DEFAULT_MAX_IN_FLIGHT, help='Maximum concurrently running flows')
+  parser.add_argument('--poisson', action='store_true', help='Use Poisson arrivals instead of evenly spaced ones')
+  parser.add_argument('--window', type=float, default=DEFAULT_WINDOW_IN_SECS, help='Timeline window in seconds')
+  parser.add_argument('--seed', type=int, default=None, help='Seed for flow selection and arrivals')
+  parser.add_argument('--json', default=None, help='Write the report to this JSON file')
+  args = parser.parse_args()
+
+  emulator = None
+  base_url = args.base_url
+  if args.emulator:
+    emulator = PetstoreEmulator(FaultConfig.parse(args.emulator_faults)).start()
+    base_url = emulator.base_url
+
+  try:
+    report = LoadRunner(
+      rate=args.rate,
+      duration=args.duration,
+      mix=parse_mix(args.mix),
+      base_url=base_url,
+      max_in_flight=args.max_in_flight,
+      poisson=args.poisson,
+      window=args.window,
+      seed=args.seed
+    ).run()
+  finally:
+    if emulator is not None:
+      emulator.stop()
+
+  print('\n'.join(report.format_lines()))
+  if args.json:
+    with open(args.json, 'w', encoding='utf-8') as file:
+      json.dump(report.to_dict(), file, indent=2)
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,67 @@
+"""
+Pytest plugin exposing the open-loop load runner to tests.
+
+Tests request the `pet_load` fixture and call it with a rate, duration and
+flow mix; every report produced during the session is printed in the
+terminal summary and can be exported with --load-report-json. Tests marked
+`load` only run against the emulator (--api-emulator) or when selected with
+`-m load`, so a default run never sends load to API_BASE_URL.
+"""
+
+import json
+import re
+
+import pytest
+
+_REPORTS_KEY = pytest.StashKey[list]()
+
+def pytest_addoption(parser):
+  parser.addoption("--load-report-json", action="store", default=None, help="Write load test reports to this JSON file")
+
+def pytest_configure(config):
+  config.addinivalue_line("markers", "load: open-loop load test built on PetApi flows")
+  config.stash[_REPORTS_KEY] = []
+
+def pytest_collection_modifyitems(config, items):
+  if config.getoption("--api-emulator", default=False) or 'load' in re.findall(r'\w+', config.getoption("markexpr") or ''):
+    return
+  skip = pytest.mark.skip(reason="load test against a real backend: select it with -m load or run with --api-emulator")
+  for item in items:
+    if item.get_closest_marker('load') is not None:
+      item.add_marker(skip)
+
+@pytest.fixture
+def pet_load(request):
+  """
+  Factory running a load test against API_BASE_URL (or the emulator when enabled).
+  Example:
+    >>> report = pet_load(rate=20, duration=5, mix='crud=3,create_get=1')
+  """
+  # Imported here so loading the plugin doesn't import the API client before API_BASE_URL is final
+  from src.api.load.load_runner import LoadRunner, parse_mix
+
+  def run(rate: float, duration: float, mix='crud=1', **kwargs):
+    if isinstance(mix, str):
+      mix = parse_mix(mix)
+    report = LoadRunner(rate=rate, duration=duration, mix=mix, **kwargs).run()
+    request.config.stash[_REPORTS_KEY].append((request.node.nodeid, report))
+    return report
+
+  return run
+
+def pytest_terminal_summary(terminalreporter, config):
+  reports = config.stash.get(_REPORTS_KEY, [])
+  if not reports:
+    return
+
+  terminalreporter.section("Load test reports")
+  for node_id, report in reports:
+    terminalreporter.write_line(node_id)
+    for line in report.format_lines():
+      terminalreporter.write_line(f"  {line}")
+
+  report_path = config.getoption("--load-report-json")
+  if report_path:
+    with open(report_path, 'w', encoding='utf-8') as file:
+      json.dump({node_id: report.to_dict() for node_id, report in reports}, file, indent=2)
+    terminalreporter.write_line(f"Load test reports written to {report_path}")
@@ -0,0 +1,62 @@
+from src.api.core.async_api_client import AsyncBaseApi, DEFAULT_CONCURRENCY
+from src.api.core.session_pool import SessionPool
+from src.api.pet.pet_api import PetApi
+from src.api.pet.types import Pet
+
+class AsyncPetApi(AsyncBaseApi):
+  """
+  Coroutine version of PetApi.
+  Example:
+    >>> async with AsyncPetApi(concurrency=100) as pet_api:
+    ...   responses = await pet_api.gather(*(pet_api.create_pet(p) for p in payloads))
+  """
+  def __init__(self, concurrency: int = DEFAULT_CONCURRENCY, pool: SessionPool = None):
+    owns_pool = pool is None
+    if owns_pool:
+      pool = AsyncBaseApi._create_pool(concurrency)
+    super().__init__(PetApi(pool=pool), concurrency=concurrency, owns_pool=owns_pool)
+
+  async def create_pet(self, payload: Pet, **kwargs):
+    """
+    Create a new pet in the system.
+    Args:
+      payload (Pet): Pet data containing name, status, and other attributes
+      **kwargs: Additional request parameters (timeout, headers, etc.)
+    Returns:
+      requests.Response: API response object with status code and response data
+    """
+    return await self._run(self._client.create_pet, payload, **kwargs)
+
+  async def get_pet(self, id: str, **kwargs):
+    """
+    Retrieve a pet by its ID.
+    Args:
+      id (str): Unique identifier of the pet to retrieve
+      **kwargs: Additional request parameters (timeout, headers, etc.)
+    Returns:
+      requests.Response: API response object containing pet data
+    """
+    return await self._run(self._client.get_pet, id, **kwargs)
+
+  async def update_pet(self, id: str, json=None, **kwargs):
+    """
+    Update an existing pet's information.
+    Args:
+      id (str): Unique identifier of the pet to update
+      json (dict, optional): Updated pet data to send in request body
+      **kwargs: Additional request parameters (timeout, headers, etc.)
+    Returns:
+      requests.Response: API response object with status code and response data
+    """
+    return await self._run(self._client.update_pet, id, json=json, **kwargs)
+
+  async def delete_pet(self, id: int, **kwargs):
+    """
+    Delete a pet from the system.
+    Args:
+      id (int): Unique identifier of the pet to delete
+      **kwargs: Additional request parameters (timeout, headers, etc.)
+    Returns:
+      requests.Response: API response object with status code
+    """
+    return await self._run(self._client.delete_pet, id, **kwargs)
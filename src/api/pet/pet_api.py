@@ -1,56 +1,127 @@
-from src.api.core.api_client import BaseApi
+from http import HTTPStatus
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.api.core.api_client import BaseApi, API_POOL_MAXSIZE, TIMEOUT_IN_SECS
+from src.api.core.bulk import BulkResult, run_bulk
+from src.api.core.cassette import Cassette
+from src.api.core.hedging import HedgePolicy
+from src.api.core.metrics import api_metrics
+from src.api.core.poller import ConvergenceStats, PollResult, poll_until
+from src.api.core.response_cache import ResponseCache, clone_response
+from src.api.core.types import ExpectedState
+from src.api.core.wire_model import is_wire_model
+from src.api.libs.utils.response_view import view
+from src.api.core.session_pool import SessionPool
+from src.api.pet.pet_tracker import get_default_tracker
 from src.api.pet.types import Pet
 
 class PetApi(BaseApi):
   PET_URI = '/pet'
+  # Shared by all clients so the backoff adapts to the backend, not to one instance
+  convergence_stats = ConvergenceStats()
+
+  def __init__(self, pool: SessionPool = None, hedge_policy: HedgePolicy = None, cache: ResponseCache = None, cassette: Cassette = None, base_url: str = None):
+    super().__init__(pool=pool, hedge_policy=hedge_policy, cassette=cassette, base_url=base_url)
+    self._cache = cache
+
+  @property
+  def cache(self) -> Optional[ResponseCache]:
+    return self._cache
 
-  def __init__(self):
-    super().__init__()
+  @staticmethod
+  def _to_wire(payload):
+    return payload.to_wire() if is_wire_model(type(payload)) else payload
 
-  def create_pet(self, payload: Pet, **kwargs):
+  @staticmethod
+  def _to_model(response):
+    response.raise_for_status()
+    return Pet.from_wire(view(response).json)
+
+  def _pet_url(self, id) -> str:
+    return self._url(f'{PetApi.PET_URI}/{id}')
+
+  def create_pet(self, payload: Pet, as_model=False, **kwargs):
     """
     Create a new pet in the system.
     Args:
-      payload (Pet): Pet data containing name, status, and other attributes
+      payload (Pet | dict): Pet model or wire-format dict containing name, status, and other attributes
+      as_model (bool): Return the created pet as a Pet model instead of the response
       **kwargs: Additional request parameters (timeout, headers, etc.)
     Returns:
       requests.Response: API response object with status code and response data
+      Pet: Created pet, when as_model is set
+    Raises:
+      requests.HTTPError: If as_model is set and the request failed
     Example:
       >>> pet_data = {"name": "Buddy", "status": "available", "category": {"name": "Dogs"}}
       >>> response = pet_api.create_pet(pet_data)
       >>> print(response.status_code)
       200
     """
-    return self._post(PetApi.PET_URI, json=payload, **kwargs)
+    response = self._post(PetApi.PET_URI, json=self._to_wire(payload), **kwargs)
+    # Set when created pets are cleaned up at session end (see conftest)
+    tracker = get_default_tracker()
+    if response.status_code == HTTPStatus.OK and (self._cache is not None or tracker is not None):
+      pet_id = view(response).get('id', None)
+      if pet_id is not None and tracker is not None:
+        tracker.track(pet_id, self._base_url)
+      if pet_id is not None and self._cache is not None:
+        # The created pet is returned as-is by GET /pet/{id}, so seed the cache with it
+        pet_url = self._pet_url(pet_id)
+        self._cache.put(pet_url, clone_response(response, url=pet_url))
+    return self._to_model(response) if as_model else response
 
-  def get_pet(self, id: str, **kwargs):
+  def get_pet(self, id: str, bypass_cache=False, as_model=False, **kwargs):
     """
     Retrieve a pet by its ID.
     Args:
       id (str): Unique identifier of the pet to retrieve
+      bypass_cache (bool): Always go to the wire, even when a cached response exists
+      as_model (bool): Return the pet as a Pet model instead of the response
       **kwargs: Additional request parameters (timeout, headers, etc.)
     Returns:
       requests.Response: API response object containing pet data
+      Pet: Retrieved pet, when as_model is set
+    Raises:
+      requests.HTTPError: If as_model is set and the request failed
     Example:
       >>> response = pet_api.get_pet("123")
       >>> pet_data = response.json()
     """
-    return self._get(f'{PetApi.PET_URI}/{id}', **kwargs)
+    if self._cache is None or bypass_cache:
+      response = self._get(f'{PetApi.PET_URI}/{id}', **kwargs)
+    else:
+      pet_url = self._pet_url(id)
+      response = self._cache.get(pet_url)
+      if response is None:
+        # An update or delete finishing while this GET is in flight makes its body stale
+        generation = self._cache.generation(pet_url)
+        response = self._get(f'{PetApi.PET_URI}/{id}', **kwargs)
+        if response.status_code == HTTPStatus.OK:
+          self._cache.put(pet_url, response, generation)
+    return self._to_model(response) if as_model else response
   
-  def update_pet(self, id: str, json=None, **kwargs):
+  def update_pet(self, id: str, json=None, as_model=False, **kwargs):
     """
     Update an existing pet's information.
     Args:
       id (str): Unique identifier of the pet to update
-      json (dict, optional): Updated pet data to send in request body
+      json (Pet | dict, optional): Updated pet model or wire-format data to send in request body
+      as_model (bool): Return the updated pet as a Pet model instead of the response
       **kwargs: Additional request parameters (timeout, headers, etc.)
     Returns:
       requests.Response: API response object with status code and response data
+      Pet: Updated pet, when as_model is set
+    Raises:
+      requests.HTTPError: If as_model is set and the request failed
     Example:
       >>> update_data = {"name": "Buddy Updated", "status": "sold"}
       >>> response = pet_api.update_pet("123", json=update_data)
     """
-    return self._put(f'{PetApi.PET_URI}/{id}', json=json, **kwargs)
+    response = self._put(f'{PetApi.PET_URI}/{id}', json=self._to_wire(json), **kwargs)
+    if self._cache is not None:
+      self._cache.invalidate(self._pet_url(id))
+    return self._to_model(response) if as_model else response
 
   def delete_pet(self, id: int, **kwargs):
     """
@@ -65,4 +136,125 @@ class PetApi(BaseApi):
       >>> print(response.status_code)
       200
     """
-    return self._delete(f'{PetApi.PET_URI}/{id}', **kwargs)
+    response = self._delete(f'{PetApi.PET_URI}/{id}', **kwargs)
+    if self._cache is not None:
+      self._cache.invalidate(self._pet_url(id))
+    tracker = get_default_tracker()
+    if tracker is not None and response.status_code == HTTPStatus.OK:
+      tracker.untrack(int(id), self._base_url)
+    return response
+
+  # Eventually consistent operations
+  @staticmethod
+  def _pet_in_state(response, expected: ExpectedState, fields: Optional[Dict[str, Any]]) -> bool:
+    if expected == ExpectedState.ABSENT:
+      return response.status_code == HTTPStatus.NOT_FOUND
+    if response.status_code != HTTPStatus.OK:
+      return False
+    if not fields:
+      return True
+    response_view = view(response)
+    return all(response_view.get(path, None) == value for path, value in fields.items())
+
+  def get_pet_eventually(self, id: str, expected=ExpectedState.PRESENT, fields: Optional[Dict[str, Any]] = None, deadline=TIMEOUT_IN_SECS, **kwargs) -> PollResult:
+    """
+    Poll a pet until the backend converges to the expected state.
+    Args:
+      id (str): Unique identifier of the pet to retrieve
+      expected (ExpectedState): PRESENT (200) or ABSENT (404)
+      fields (Dict[str, Any], optional): Field values by path the present pet must have, e.g. {'status': 'sold', 'tags[0].name': 'dog'}
+      deadline (float): Overall time budget in seconds
+      **kwargs: Additional request parameters (timeout, headers, etc.)
+    Returns:
+      PollResult: Last response plus attempts, elapsed time and convergence flag
+    Example:
+      >>> result = pet_api.get_pet_eventually(pet_id, fields={'name': 'Buddy'})
+      >>> assert result.converged, f"Pet not visible after {result.attempts} attempts"
+    """
+    result = poll_until(
+      lambda: self.get_pet(id, bypass_cache=True, **kwargs),
+      lambda response: self._pet_in_state(response, expected, fields),
+      deadline=deadline,
+      stats=PetApi.convergence_stats,
+      operation=f'get_pet:{ExpectedState(expected).value.lower()}'
+    )
+    api_metrics.record_retries('GET', f'{PetApi.PET_URI}/{{id}}', result.attempts - 1)
+    return result
+
+  def delete_pet_eventually(self, id: int, deadline=TIMEOUT_IN_SECS, **kwargs) -> PollResult:
+    """
+    Retry deleting a pet until the backend acknowledges it with 200 OK.
+    A pet that was just created may answer 404 until it becomes visible;
+    a pet that never existed keeps answering 404 until the deadline.
+    Args:
+      id (int): Unique identifier of the pet to delete
+      deadline (float): Overall time budget in seconds
+      **kwargs: Additional request parameters (timeout, headers, etc.)
+    Returns:
+      PollResult: Last response plus attempts, elapsed time and convergence flag
+    """
+    result = poll_until(
+      lambda: self.delete_pet(id, **kwargs),
+      lambda response: response.status_code == HTTPStatus.OK,
+      deadline=deadline,
+      stats=PetApi.convergence_stats,
+      operation='delete_pet'
+    )
+    api_metrics.record_retries('DELETE', f'{PetApi.PET_URI}/{{id}}', result.attempts - 1)
+    return result
+
+  # Bulk operations
+  def create_pets(self, payloads: Iterable[Pet], max_workers=API_POOL_MAXSIZE, stop_on_failure=False, **kwargs) -> List[BulkResult]:
+    """
+    Create many pets in parallel over this client's pooled transport.
+    Args:
+      payloads (Iterable[Pet]): Pet payloads to create
+      max_workers (int): Number of worker threads
+      stop_on_failure (bool): Skip the remaining payloads after the first failed call
+      **kwargs: Additional request parameters (timeout, headers, etc.)
+    Returns:
+      List[BulkResult]: Per-payload status, response and latency, in input order
+    Example:
+      >>> results = pet_api.create_pets(create_random_pet_body() for _ in range(100))
+      >>> pet_ids = [PetAssertions.get_pet_id(r.response) for r in results if r.ok]
+    """
+    return run_bulk(lambda payload: self.create_pet(payload, **kwargs), payloads, max_workers, stop_on_failure)
+
+  def get_pets(self, ids: Iterable[str], max_workers=API_POOL_MAXSIZE, stop_on_failure=False, **kwargs) -> List[BulkResult]:
+    """
+    Retrieve many pets in parallel.
+    Args:
+      ids (Iterable[str]): Pet ids to retrieve
+      max_workers (int): Number of worker threads
+      stop_on_failure (bool): Skip the remaining ids after the first failed call
+      **kwargs: Additional request parameters (timeout, headers, etc.)
+    Returns:
+      List[BulkResult]: Per-id status, response and latency, in input order
+    """
+    return run_bulk(lambda id: self.get_pet(id, **kwargs), ids, max_workers, stop_on_failure)
+
+  def update_pets(self, updates: Iterable[Tuple[str, dict]], max_workers=API_POOL_MAXSIZE, stop_on_failure=False, **kwargs) -> List[BulkResult]:
+    """
+    Update many pets in parallel.
+    Args:
+      updates (Iterable[Tuple[str, dict]]): (pet id, updated pet data) pairs
+      max_workers (int): Number of worker threads
+      stop_on_failure (bool): Skip the remaining updates after the first failed call
+      **kwargs: Additional request parameters (timeout, headers, etc.)
+    Returns:
+      List[BulkResult]: Per-update status, response and latency, in input order
+    """
+    return run_bulk(lambda update: self.update_pet(update[0], json=update[1], **kwargs), updates, max_workers, stop_on_failure)
+
+  def delete_pets(self, ids: Iterable[int], max_workers=API_POOL_MAXSIZE, stop_on_failure=False, **kwargs) -> List[BulkResult]:
+    """
+    Delete many pets in parallel.
+    Args:
+      ids (Iterable[int]): Pet ids to delete
+      max_workers (int): Number of worker threads
+      stop_on_failure (bool): Skip the remaining ids after the first failed call
+      **kwargs: Additional request parameters (timeout, headers, etc.)
+    Returns:
+      List[BulkResult]: Per-id status, response and latency, in input order
+    """
+    return run_bulk(lambda id: self.delete_pet(id, **kwargs), ids, max_workers, stop_on_failure)
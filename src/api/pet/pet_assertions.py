@@ -7,6 +7,7 @@ pet-related API responses and data extraction.
 
 from requests import Response
 from src.api.libs.utils.assertions import Assertions
+from src.api.libs.utils.response_view import view
 
 class PetAssertions(Assertions):
   @staticmethod
@@ -73,7 +74,7 @@ class PetAssertions(Assertions):
     Returns:
       list: List of tag names
     """
-    tags = response.json()['tags']
+    tags = view(response).json['tags']
     return [tag['name'] for tag in tags] if tags else []
 
   @staticmethod
@@ -0,0 +1,268 @@
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from pathlib import Path
+from typing import List, Optional, Set, Tuple
+
+from src.api.core.bulk import run_bulk
+
+PET_GC_DIR = os.getenv('PET_GC_DIR', '.pet_gc')
+# Clean up between tests once this many pets are tracked, 0 to clean up at session end only
+PET_GC_THRESHOLD = int(os.getenv('PET_GC_THRESHOLD', '0'))
+PET_GC_BATCH_SIZE = int(os.getenv('PET_GC_BATCH_SIZE', '100'))
+PET_GC_WORKERS = int(os.getenv('PET_GC_WORKERS', '10'))
+# Budget for retrying a 404 on a pet that may not be visible yet
+PET_GC_RETRY_IN_SECS = float(os.getenv('PET_GC_RETRY_IN_SECS', '2'))
+
+def _pid_alive(pid: int) -> bool:
+  if os.name == 'nt':
+    # Signal 0 is not a probe on Windows: os.kill would terminate the process
+    return _windows_pid_alive(pid)
+  try:
+    os.kill(pid, 0)
+  except ProcessLookupError:
+    return False
+  except PermissionError:
+    return True
+  return True
+
+def _windows_pid_alive(pid: int) -> bool:
+  import ctypes
+  from ctypes import wintypes
+
+  PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+  ERROR_ACCESS_DENIED = 5
+  STILL_ACTIVE = 259
+  kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+  handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+  if not handle:
+    # The process exists but belongs to another user
+    return ctypes.get_last_error() == ERROR_ACCESS_DENIED
+  try:
+    exit_code = wintypes.DWORD()
+    if not kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code)):
+      return True
+    return exit_code.value == STILL_ACTIVE
+  finally:
+    kernel32.CloseHandle(handle)
+
+@dataclass
+class CleanupReport:
+  """
+  Outcome of one cleanup pass.
+  Attributes:
+    deleted (int): Pets deleted with 200 OK
+    absent (int): Pets still answering 404 after retries, i.e. already gone
+    leftovers (List[int]): Pets that could not be deleted and stay tracked for a later run
+  """
+  deleted: int = 0
+  absent: int = 0
+  leftovers: List[int] = field(default_factory=list)
+
+  def merge(self, other: 'CleanupReport'):
+    self.deleted += other.deleted
+    self.absent += other.absent
+    self.leftovers.extend(other.leftovers)
+
+class CreatedPetTracker:
+  """
+  Records ids of pets created through PetApi so they can be deleted later.
+
+  Every change is appended to a per-process journal, <directory>/pets-<pid>.jsonl,
+  so the tracked set survives an aborted run; the directory and journal are
+  only created once a pet is tracked. Each entry records the backend the pet
+  was created on. Journals whose process is no longer alive are adopted by the
+  next tracker started in the same directory: pets of its own backend are
+  cleaned up with its own, pets of other backends are carried over untouched
+  until a run against their backend picks them up.
+  Attributes:
+    directory (Path): Directory holding the journals
+    base_url (str): Backend of this run; pending() and cleanup() only cover its pets
+    threshold (int): Number of tracked pets at which should_cleanup() turns true, 0 to disable
+  """
+  def __init__(self, base_url: str, directory: str = PET_GC_DIR, threshold: int = PET_GC_THRESHOLD) -> None:
+    self.directory = Path(directory)
+    self.base_url = base_url
+    self.threshold = threshold
+    self.path = self.directory / f'pets-{os.getpid()}.jsonl'
+    self._lock = threading.Lock()
+    # (base_url, id) pairs of every backend
+    self._pending: Set[Tuple[str, int]] = set()
+    self._file = None
+    if self.directory.is_dir():
+      self._adopt_orphans()
+      self._compact()
+
+  @staticmethod
+  def _replay(path: Path) -> Set[Tuple[str, int]]:
+    pending = set()
+    with open(path, 'r', encoding='utf-8') as file:
+      for line in file:
+        try:
+          entry = json.loads(line)
+        except json.JSONDecodeError:
+          # Last line of a journal cut off mid-write
+          continue
+        key = (entry.get('base_url'), entry['id'])
+        if entry['op'] == 'add':
+          pending.add(key)
+        else:
+          pending.discard(key)
+    return pending
+
+  def _adopt_orphans(self):
+    if self.path.exists():
+      self._pending |= self._replay(self.path)
+    for journal in self.directory.glob('pets-*.jsonl'):
+      pid = journal.stem.split('-', 1)[1]
+      if journal == self.path or not pid.isdigit() or _pid_alive(int(pid)):
+        continue
+      # Renaming claims the journal, so concurrent trackers never adopt it twice
+      claimed = journal.with_suffix(f'.adopted-{os.getpid()}')
+      try:
+        journal.rename(claimed)
+      except FileNotFoundError:
+        continue
+      self._pending |= self._replay(claimed)
+      claimed.unlink()
+
+  @staticmethod
+  def _entry(op: str, key: Tuple[str, int]) -> str:
+    return json.dumps({'op': op, 'id': key[1], 'base_url': key[0]}) + '\n'
+
+  def _compact(self):
+    # Rewrite the journal with only the pending pets, or remove it when there are none
+    with self._lock:
+      if self._file is not None:
+        self._file.close()
+        self._file = None
+      if not self._pending:
+        self.path.unlink(missing_ok=True)
+        return
+      temp_path = self.path.with_suffix('.tmp')
+      with open(temp_path, 'w', encoding='utf-8') as file:
+        for key in sorted(self._pending, key=lambda key: (key[0] or '', key[1])):
+          file.write(self._entry('add', key))
+      os.replace(temp_path, self.path)
+
+  def _append(self, op: str, key: Tuple[str, int]):
+    # Caller must hold the lock
+    if self._file is None:
+      self.directory.mkdir(parents=True, exist_ok=True)
+      self._file = open(self.path, 'a', encoding='utf-8')
+    self._file.write(self._entry(op, key))
+    self._file.flush()
+
+  def track(self, id: int, base_url: Optional[str] = None):
+    """
+    Args:
+      id (int): Id of the created pet
+      base_url (str, optional): Backend the pet was created on, defaults to this run's
+    """
+    key = (base_url or self.base_url, id)
+    with self._lock:
+      if key not in self._pending:
+        self._pending.add(key)
+        self._append('add', key)
+
+  def untrack(self, id: int, base_url: Optional[str] = None):
+    """
+    Args:
+      id (int): Id of the deleted pet
+      base_url (str, optional): Backend the pet was deleted from, defaults to this run's
+    """
+    key = (base_url or self.base_url, id)
+    with self._lock:
+      if key in self._pending:
+        self._pending.discard(key)
+        self._append('del', key)
+
+  def pending(self) -> List[int]:
+    """
+    Returns:
+      List[int]: Ids of tracked pets on this run's backend not deleted yet
+    """
+    with self._lock:
+      return sorted(id for base_url, id in self._pending if base_url == self.base_url)
+
+  def should_cleanup(self) -> bool:
+    return self.threshold > 0 and len(self.pending()) >= self.threshold
+
+  def cleanup(self, pet_api, batch_size: int = PET_GC_BATCH_SIZE, max_workers: int = PET_GC_WORKERS,
+              retry_deadline: float = PET_GC_RETRY_IN_SECS) -> CleanupReport:
+    """
+    Delete every tracked pet of this run's backend in concurrent batches.
+    A 404 is retried until retry_deadline, since a pet created moments ago may
+    not be visible yet; a pet still answering 404 afterwards is already gone.
+    Args:
+      pet_api (PetApi): Client used for the deletes, targeting this run's backend
+      batch_size (int): Pets deleted per batch
+      max_workers (int): Concurrent deletes per batch
+      retry_deadline (float): Time budget in seconds for retrying a 404
+    Returns:
+      CleanupReport: Deleted, absent and leftover pets
+    Raises:
+      ValueError: If pet_api targets another backend
+    """
+    if pet_api.base_url != self.base_url:
+      raise ValueError(f"Tracker cleans up pets of {self.base_url}, but the client targets {pet_api.base_url}")
+    report = CleanupReport()
+    ids = self.pending()
+    for start in range(0, len(ids), batch_size):
+      results = pet_api.delete_pets(ids[start:start + batch_size], max_workers=max_workers)
+      not_found = []
+      for result in results:
+        if result.ok:
+          report.deleted += 1
+          self.untrack(result.item)
+        elif result.response is not None and result.response.status_code == HTTPStatus.NOT_FOUND:
+          not_found.append(result.item)
+        else:
+          report.leftovers.append(result.item)
+
+      retries = run_bulk(lambda id: pet_api.delete_pet_eventually(id, deadline=retry_deadline).response, not_found, max_workers)
+      for result in retries:
+        if result.ok:
+          report.deleted += 1
+          self.untrack(result.item)
+        elif result.response is not None and result.response.status_code == HTTPStatus.NOT_FOUND:
+          report.absent += 1
+          self.untrack(result.item)
+        else:
+          report.leftovers.append(result.item)
+    self._compact()
+    return report
+
+  def close(self):
+    """
+    Close the journal, removing it when nothing is left to clean up.
+    """
+    with self._lock:
+      if self._file is not None:
+        self._file.close()
+        self._file = None
+      if not self._pending:
+        self.path.unlink(missing_ok=True)
+
+_default_tracker: Optional[CreatedPetTracker] = None
+
+def get_default_tracker() -> Optional[CreatedPetTracker]:
+  """
+  Returns:
+    CreatedPetTracker or None: Tracker PetApi records created pets with, None when pet cleanup is off
+  """
+  return _default_tracker
+
+def use_tracker(tracker: Optional[CreatedPetTracker]) -> Optional[CreatedPetTracker]:
+  """
+  Replace the tracker PetApi records created pets with.
+  Args:
+    tracker (CreatedPetTracker, optional): New tracker, None to stop tracking
+  Returns:
+    CreatedPetTracker or None: The new default tracker
+  """
+  global _default_tracker
+  _default_tracker = tracker
+  return _default_tracker
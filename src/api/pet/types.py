@@ -1,7 +1,9 @@
-from dataclasses import dataclass, field
+from dataclasses import field
 from typing import List, Optional
 from enum import Enum
 
+from src.api.core.wire_model import wire_model
+
 class PetStatus(str, Enum):
   AVAILABLE = "available"
   PENDING = "pending"
@@ -13,17 +15,17 @@ class PetStatus(str, Enum):
   def __repr__(self):
     return self.value
 
-@dataclass
+@wire_model
 class Category:
   id: Optional[int] = None
   name: Optional[str] = None
 
-@dataclass
+@wire_model
 class Tag:
   id: Optional[int] = None
   name: Optional[str] = None
 
-@dataclass
+@wire_model
 class Pet:
   id: Optional[int] = None
   category: Optional[Category] = None
@@ -0,0 +1,266 @@
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Set
+from urllib.parse import urlsplit
+
+from src.utils.logger import logger
+
+UI_DRIVER_POOL_SIZE = int(os.getenv('UI_DRIVER_POOL_SIZE', 1))
+# Sessions are replaced after this many tests, to bound leaks in long-lived browsers
+UI_DRIVER_MAX_USES = int(os.getenv('UI_DRIVER_MAX_USES', 20))
+# Sessions launched in the background as soon as the pool is created, 0 to launch on demand only
+UI_DRIVER_PREWARM = int(os.getenv('UI_DRIVER_PREWARM', 0))
+RESET_URL = 'about:blank'
+
+_CLEAR_STORAGE_SCRIPT = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+# Origins of the current document and of everything it loaded, e.g. iframes and widgets
+_RESOURCE_ORIGINS_SCRIPT = """
+var origins = [location.origin];
+performance.getEntriesByType('resource').forEach(function (entry) {
+  try { origins.push(new URL(entry.name).origin); } catch (e) {}
+});
+return origins;
+"""
+
+def _origin(url: str) -> str:
+  parts = urlsplit(url)
+  return f'{parts.scheme}://{parts.netloc}'
+
+def _visited_origins(driver) -> Set[str]:
+  # Every page in the current window's history, plus the origins its current page loaded from
+  history = driver.execute_cdp_cmd('Page.getNavigationHistory', {})
+  origins = {_origin(entry['url']) for entry in history.get('entries', [])}
+  origins.update(driver.execute_script(_RESOURCE_ORIGINS_SCRIPT) or [])
+  return {origin for origin in origins if origin.startswith(('http://', 'https://'))}
+
+def reset_driver(driver):
+  """
+  Bring a session back to a blank state between tests.
+  Extra windows are closed, browser storage and all cookies are cleared, and
+  the remaining window is left on about:blank.
+  On Chromium, every storage type (local/session storage, IndexedDB, cache
+  storage, service workers) is cleared with CDP for each origin in the history
+  of the windows still open, and for the origins their current pages loaded
+  from. Other browsers have no such command: only localStorage and
+  sessionStorage of the origin open in each window and the current domain's
+  cookies are cleared, so data of other origins, or of windows a test closed
+  itself, survives; use max_uses=1 where a test needs a clean profile there.
+  Args:
+    driver (WebDriver): Session to reset
+  Raises:
+    WebDriverException: If the browser does not respond, so the session must be replaced
+  """
+  cdp = hasattr(driver, 'execute_cdp_cmd')
+  origins = set()
+  handles = driver.window_handles
+  for handle in handles[1:]:
+    driver.switch_to.window(handle)
+    if cdp:
+      origins |= _visited_origins(driver)
+    else:
+      driver.execute_script(_CLEAR_STORAGE_SCRIPT)
+    driver.close()
+  driver.switch_to.window(handles[0])
+  if cdp:
+    origins |= _visited_origins(driver)
+    for origin in sorted(origins):
+      driver.execute_cdp_cmd('Storage.clearDataForOrigin', {'origin': origin, 'storageTypes': 'all'})
+    # Cookies are cleared for every domain, including those set by pages of windows closed during the test
+    driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+  else:
+    driver.execute_script(_CLEAR_STORAGE_SCRIPT)
+    driver.delete_all_cookies()
+  driver.get(RESET_URL)
+
+@dataclass
+class PooledDriver:
+  """
+  Attributes:
+    driver (WebDriver): Browser session
+    uses (int): Number of tests that used the session
+  """
+  driver: Any
+  uses: int = 0
+
+class DriverPool:
+  """
+  Pool of browser sessions reused across tests.
+
+  Sessions are created on demand up to `size`, or ahead of time on background
+  threads with prewarm(); acquire() blocks while all of them are in use or
+  still launching. A released session is reset before it goes back to the
+  pool, and it is quit instead when it reached `max_uses` or the reset failed.
+  Attributes:
+    size (int): Maximum number of live sessions
+    max_uses (int): Tests per session before it is replaced, 0 for no limit
+    launch_times (List[float]): Seconds each session took to launch
+    wait_times (List[float]): Seconds each acquire() waited for a session
+  """
+  def __init__(self, factory: Callable[[], Any], size: int = UI_DRIVER_POOL_SIZE, max_uses: int = UI_DRIVER_MAX_USES,
+               reset: Callable[[Any], None] = reset_driver, quit: Callable[[Any], None] = None) -> None:
+    if size < 1:
+      raise ValueError(f"Driver pool size must be at least 1, got {size}")
+    self.size = size
+    self.max_uses = max_uses
+    self._factory = factory
+    self._reset = reset
+    self._quit = quit or (lambda driver: driver.quit())
+    self._condition = threading.Condition()
+    self._idle: List[PooledDriver] = []
+    self._in_use = {}
+    self._live = 0
+    self._closed = False
+    self.created = 0
+    self.recycled = 0
+    self.launch_times: List[float] = []
+    self.wait_times: List[float] = []
+
+  def acquire(self, timeout: float = None):
+    """
+    Args:
+      timeout (float, optional): Seconds to wait for a free session, None to wait forever
+    Returns:
+      WebDriver: Session reserved for the caller until release()
+    Raises:
+      RuntimeError: If the pool is closed
+      TimeoutError: If no session became free in time
+    """
+    started = time.perf_counter()
+    with self._condition:
+      while True:
+        if self._closed:
+          raise RuntimeError("Driver pool is closed")
+        if self._idle:
+          entry = self._idle.pop()
+          break
+        if self._live < self.size:
+          # Reserve the slot, then launch the browser outside the lock
+          self._live += 1
+          entry = None
+          break
+        if not self._condition.wait(timeout):
+          raise TimeoutError(f"No browser session became free within {timeout}s")
+
+    if entry is None:
+      entry = self._launch()
+
+    entry.uses += 1
+    with self._condition:
+      self._in_use[id(entry.driver)] = entry
+      self.wait_times.append(time.perf_counter() - started)
+    return entry.driver
+
+  def _launch(self) -> PooledDriver:
+    # Caller must have reserved a slot in self._live
+    started = time.perf_counter()
+    try:
+      entry = PooledDriver(self._factory())
+    except BaseException:
+      with self._condition:
+        self._live -= 1
+        self._condition.notify()
+      raise
+    with self._condition:
+      self.created += 1
+      self.launch_times.append(time.perf_counter() - started)
+    return entry
+
+  def _launch_idle(self):
+    try:
+      entry = self._launch()
+    except Exception as e:
+      logger.warning(f"Background browser launch failed, sessions will be launched on demand: {e}")
+      return
+    with self._condition:
+      if not self._closed:
+        self._idle.append(entry)
+        self._condition.notify()
+        return
+    self._discard(entry)
+
+  def prewarm(self, count: int) -> List[threading.Thread]:
+    """
+    Launch sessions on background threads so tests find them ready.
+    Args:
+      count (int): Number of sessions to launch, capped at the free slots of the pool
+    Returns:
+      List[threading.Thread]: Launcher threads, daemonic so they never block interpreter exit
+    """
+    with self._condition:
+      count = max(0, min(count, self.size - self._live))
+      self._live += count
+    threads = [threading.Thread(target=self._launch_idle, name=f'driver-prewarm-{i}', daemon=True) for i in range(count)]
+    for thread in threads:
+      thread.start()
+    return threads
+
+  def stats(self) -> Dict[str, float]:
+    """
+    Returns:
+      Dict[str, float]: Session counts plus mean/max launch and wait times in seconds
+    """
+    with self._condition:
+      launch_times, wait_times = list(self.launch_times), list(self.wait_times)
+      created, recycled = self.created, self.recycled
+    return {
+      'created': created,
+      'recycled': recycled,
+      'acquired': len(wait_times),
+      'launch_mean': sum(launch_times) / len(launch_times) if launch_times else 0.0,
+      'launch_max': max(launch_times, default=0.0),
+      'wait_mean': sum(wait_times) / len(wait_times) if wait_times else 0.0,
+      'wait_max': max(wait_times, default=0.0)
+    }
+
+  def release(self, driver, healthy: bool = True):
+    """
+    Return a session to the pool.
+    Args:
+      driver (WebDriver): Session obtained from acquire()
+      healthy (bool): False to replace the session regardless of its state, e.g. after a browser crash
+    """
+    with self._condition:
+      entry = self._in_use.pop(id(driver))
+      keep = healthy and not self._closed and (self.max_uses <= 0 or entry.uses < self.max_uses)
+
+    if keep:
+      try:
+        self._reset(driver)
+      except Exception as e:
+        logger.warning(f"Browser session reset failed, replacing it: {e}")
+        keep = False
+
+    with self._condition:
+      if keep and not self._closed:
+        self._idle.append(entry)
+        self._condition.notify()
+        return
+      if not self._closed:
+        self.recycled += 1
+    self._discard(entry)
+
+  def _discard(self, entry: PooledDriver):
+    try:
+      self._quit(entry.driver)
+    except Exception as e:
+      logger.warning(f"Failed to quit browser session: {e}")
+    with self._condition:
+      self._live -= 1
+      self._condition.notify()
+
+  def close(self):
+    """
+    Quit every idle session; sessions still in use are quit when released.
+    """
+    with self._condition:
+      self._closed = True
+      idle, self._idle = self._idle, []
+      self._condition.notify_all()
+    for entry in idle:
+      self._discard(entry)
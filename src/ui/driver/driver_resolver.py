@@ -0,0 +1,166 @@
+"""
+Resolve the chromedriver/geckodriver binary once per machine and browser version.
+
+Resolved paths are kept in an on-disk JSON index shared by every process on the
+machine and guarded by a file lock, so parallel workers neither repeat the
+version lookup nor download the same driver concurrently. In offline mode the
+index is the only source and nothing is fetched over the network.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from src.utils.logger import logger
+
+DRIVER_CACHE_DIR = os.getenv('DRIVER_CACHE_DIR', str(Path.home() / '.cache' / 'ui-drivers'))
+# Never touch the network; resolve from the index or from CHROMEDRIVER_PATH/GECKODRIVER_PATH only
+DRIVER_OFFLINE = os.getenv('DRIVER_OFFLINE', 'false').lower() == 'true'
+DRIVER_PATH_ENV = {'chrome': 'CHROMEDRIVER_PATH', 'firefox': 'GECKODRIVER_PATH'}
+INDEX_FILE = 'index.json'
+LOCK_FILE = 'index.lock'
+
+# Per-process memo keyed on (browser, cache_dir, offline): the installed browser does not change during a run
+_resolved: Dict[Tuple[str, str, bool], str] = {}
+_resolved_lock = threading.Lock()
+
+@contextmanager
+def _file_lock(path: Path):
+  """
+  Exclusive inter-process lock held for the duration of the block.
+  """
+  path.parent.mkdir(parents=True, exist_ok=True)
+  with open(path, 'a+') as file:
+    if os.name == 'nt':
+      import msvcrt
+      file.seek(0)
+      while True:
+        try:
+          msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+          break
+        except OSError:
+          # LK_LOCK gives up after ~10 seconds; keep waiting like flock does
+          continue
+      try:
+        yield
+      finally:
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+      import fcntl
+      fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+      try:
+        yield
+      finally:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+def browser_version(browser: str) -> Optional[str]:
+  """
+  Read the installed browser version from the OS, without network access.
+  Args:
+    browser (str): 'chrome' or 'firefox'
+  Returns:
+    str or None: Version such as '131.0.6778.85', None when it cannot be detected
+  """
+  from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+
+  browser_type = ChromeType.GOOGLE if browser == 'chrome' else browser
+  try:
+    return OperationSystemManager().get_browser_version_from_os(browser_type)
+  except Exception as e:
+    logger.debug(f"Could not detect the {browser} version: {e}")
+    return None
+
+def _index_key(browser: str, version: Optional[str]) -> str:
+  from webdriver_manager.core.os_manager import OperationSystemManager
+  # Drivers match the browser's major version
+  major = version.split('.')[0] if version else 'unknown'
+  return f'{OperationSystemManager().get_os_type()}/{browser}/{major}'
+
+def _read_index(path: Path) -> dict:
+  try:
+    with open(path, 'r', encoding='utf-8') as file:
+      return json.load(file)
+  except (FileNotFoundError, json.JSONDecodeError):
+    return {}
+
+def _write_index(path: Path, index: dict):
+  temp_path = path.with_suffix('.tmp')
+  with open(temp_path, 'w', encoding='utf-8') as file:
+    json.dump(index, file, indent=2, sort_keys=True)
+  os.replace(temp_path, path)
+
+def _download(browser: str) -> str:
+  if browser == 'chrome':
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+  from webdriver_manager.firefox import GeckoDriverManager
+  return GeckoDriverManager().install()
+
+def _from_index(index: dict, browser: str, key: str, offline: bool) -> Optional[str]:
+  entry = index.get(key)
+  if entry and os.path.exists(entry['path']):
+    return entry['path']
+  if offline:
+    # Best effort on air-gapped machines: the most recently resolved driver for this browser
+    candidates = [
+      entry for name, entry in index.items()
+      if name.split('/')[1:2] == [browser] and os.path.exists(entry['path'])
+    ]
+    if candidates:
+      return max(candidates, key=lambda entry: entry['resolved_at'])['path']
+  return None
+
+def resolve_driver_path(browser: str, offline: bool = DRIVER_OFFLINE, cache_dir: str = DRIVER_CACHE_DIR) -> str:
+  """
+  Get the driver binary for the installed browser, downloading it only when no
+  process on this machine has resolved it before.
+  Args:
+    browser (str): 'chrome' or 'firefox', case-insensitive
+    offline (bool): Resolve from the environment and the index only
+    cache_dir (str): Directory of the shared index
+  Returns:
+    str: Path of the driver executable
+  Raises:
+    ValueError: If the browser is not supported
+    RuntimeError: If offline and no driver is known for the browser
+  """
+  browser = browser.lower()
+  if browser not in DRIVER_PATH_ENV:
+    raise ValueError(f"Unsupported browser: {browser}")
+
+  explicit_path = os.getenv(DRIVER_PATH_ENV[browser])
+  if explicit_path:
+    return explicit_path
+
+  memo_key = (browser, str(cache_dir), offline)
+  with _resolved_lock:
+    path = _resolved.get(memo_key)
+  if path is not None:
+    return path
+
+  version = browser_version(browser)
+  key = _index_key(browser, version)
+  index_path = Path(cache_dir) / INDEX_FILE
+  with _file_lock(Path(cache_dir) / LOCK_FILE):
+    index = _read_index(index_path)
+    path = _from_index(index, browser, key, offline)
+    if path is None:
+      if offline:
+        raise RuntimeError(
+          f"No cached {browser} driver in {index_path} and offline mode is on; "
+          f"set {DRIVER_PATH_ENV[browser]} or resolve once with network access"
+        )
+      started = time.perf_counter()
+      path = _download(browser)
+      logger.info(f"Resolved {browser} driver {path} in {time.perf_counter() - started:.1f}s")
+      index[key] = {'path': path, 'browser_version': version, 'resolved_at': time.time()}
+      _write_index(index_path, index)
+
+  with _resolved_lock:
+    _resolved[memo_key] = path
+  return path
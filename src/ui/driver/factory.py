@@ -0,0 +1,68 @@
+import os
+
+from src.ui.driver import fast_profile
+from src.ui.driver.driver_resolver import resolve_driver_path
+from src.ui.driver.types import BrowserProfile
+from src.utils.logger import logger
+
+SUPPORTED_BROWSERS = ('chrome', 'firefox')
+UI_BROWSER_PROFILE = os.getenv('UI_BROWSER_PROFILE', BrowserProfile.STANDARD.value)
+
+def create_driver(browser: str, profile: BrowserProfile = BrowserProfile.STANDARD):
+  """
+  Launch a new local browser session.
+  Args:
+    browser (str): 'chrome' or 'firefox', case-insensitive
+    profile (BrowserProfile): STANDARD for a maximized window, FAST for a headless,
+      fixed-size window with images, fonts, media and analytics blocked
+  Returns:
+    WebDriver: Started session
+  Raises:
+    ValueError: If the browser is not supported
+  """
+  # Imported here so API-only runs never load selenium
+  from selenium import webdriver
+
+  profile = BrowserProfile(profile)
+  logger.info(f"Initializing {browser} driver with the {profile.value} profile")
+  browser = browser.lower()
+  fast = profile == BrowserProfile.FAST
+
+  if browser == 'firefox':
+    logger.debug("Setting up Firefox driver")
+    options = webdriver.FirefoxOptions()
+    if fast:
+      fast_profile.apply_firefox_options(options)
+    driver = webdriver.Firefox(options=options, service=webdriver.FirefoxService(executable_path=resolve_driver_path(browser)))
+  elif browser == 'chrome':
+    logger.debug("Setting up Chrome driver")
+    options = webdriver.ChromeOptions()
+    if fast:
+      fast_profile.apply_chrome_options(options)
+    driver = webdriver.Chrome(options=options, service=webdriver.ChromeService(executable_path=resolve_driver_path(browser)))
+  else:
+    logger.error(f"Unsupported browser: {browser}")
+    raise ValueError(f"Unsupported browser: {browser}")
+
+  if fast:
+    driver.set_window_size(*fast_profile.FAST_WINDOW_SIZE)
+    if not fast_profile.install_request_blocking(driver):
+      logger.debug(f"{browser} has no CDP, only image and font preferences are applied")
+  else:
+    logger.debug("Maximizing browser window")
+    driver.maximize_window()
+  logger.info(f"Successfully initialized {browser} driver")
+  return driver
+
+def quit_driver(driver):
+  """
+  Close the browser session, ignoring errors from a session that already died.
+  Args:
+    driver (WebDriver): Session to close
+  """
+  logger.info("Closing browser driver")
+  try:
+    driver.quit()
+  except Exception as e:
+    logger.warning(f"Failed to quit browser driver: {e}")
+  logger.info("Browser driver closed successfully")
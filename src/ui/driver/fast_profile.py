@@ -0,0 +1,130 @@
+"""
+Headless "fast browse" profile: no images, fonts, media or third-party analytics.
+
+On Chromium, requests are blocked with CDP Network.setBlockedURLs and counted
+from the performance log. Firefox has no CDP in Selenium, so it falls back to
+preferences that stop images and web fonts from loading, and its blocked
+requests are not counted.
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from src.utils.logger import logger
+
+BLOCKED_URL_PATTERNS = (
+  # Images
+  '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.avif', '*.svg', '*.ico',
+  # Fonts
+  '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+  # Media
+  '*.mp4', '*.webm', '*.mov', '*.mp3', '*.ogg', '*.wav',
+  # Third-party analytics and tag managers
+  '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*', '*facebook.net*',
+  '*hotjar.com*', '*hs-analytics.net*', '*hs-scripts.com*', '*clarity.ms*', '*linkedin.com/px*',
+  '*segment.io*', '*mixpanel.com*', '*cookielaw.org*'
+)
+# Comma-separated patterns added to the defaults, e.g. '*.pdf,*intercom*'
+UI_BLOCKED_URLS = [pattern for pattern in os.getenv('UI_BLOCKED_URLS', '').split(',') if pattern]
+FAST_WINDOW_SIZE: Tuple[int, int] = tuple(int(size) for size in os.getenv('UI_WINDOW_SIZE', '1920x1080').split('x'))
+# 'eager' returns once the DOM is ready instead of waiting for every subresource
+FAST_PAGE_LOAD_STRATEGY = os.getenv('UI_PAGE_LOAD_STRATEGY', 'eager')
+# Blocked responses never arrive, so their size is estimated from typical sizes per resource type
+ESTIMATED_RESOURCE_BYTES = {
+  'Image': 40_000,
+  'Font': 30_000,
+  'Media': 500_000,
+  'Script': 50_000,
+  'Stylesheet': 20_000
+}
+DEFAULT_ESTIMATED_BYTES = 10_000
+
+def blocked_url_patterns() -> List[str]:
+  return list(BLOCKED_URL_PATTERNS) + UI_BLOCKED_URLS
+
+def apply_chrome_options(options):
+  """
+  Args:
+    options (ChromeOptions): Options to configure for the fast profile
+  """
+  options.add_argument('--headless=new')
+  options.add_argument(f'--window-size={FAST_WINDOW_SIZE[0]},{FAST_WINDOW_SIZE[1]}')
+  options.page_load_strategy = FAST_PAGE_LOAD_STRATEGY
+  # Network events are read back from the performance log to count blocked requests
+  options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
+def apply_firefox_options(options):
+  """
+  Args:
+    options (FirefoxOptions): Options to configure for the fast profile
+  """
+  options.add_argument('-headless')
+  options.add_argument(f'--width={FAST_WINDOW_SIZE[0]}')
+  options.add_argument(f'--height={FAST_WINDOW_SIZE[1]}')
+  options.page_load_strategy = FAST_PAGE_LOAD_STRATEGY
+  options.set_preference('permissions.default.image', 2)
+  options.set_preference('gfx.downloadable_fonts.enabled', False)
+  options.set_preference('media.autoplay.default', 5)
+
+def install_request_blocking(driver) -> bool:
+  """
+  Block the fast-profile URL patterns in the driver's current tab.
+  Args:
+    driver (WebDriver): Started session
+  Returns:
+    bool: True if blocking is active, False when the browser has no CDP
+  """
+  if not hasattr(driver, 'execute_cdp_cmd'):
+    return False
+  driver.execute_cdp_cmd('Network.enable', {})
+  driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked_url_patterns()})
+  return True
+
+@dataclass
+class BlockingStats:
+  """
+  Attributes:
+    blocked (int): Requests blocked by URL pattern
+    bytes_saved (int): Estimated bytes those requests would have transferred
+    bytes_loaded (int): Bytes actually transferred by the requests that were allowed
+  """
+  blocked: int = 0
+  bytes_saved: int = 0
+  bytes_loaded: int = 0
+
+  def add(self, other: 'BlockingStats'):
+    self.blocked += other.blocked
+    self.bytes_saved += other.bytes_saved
+    self.bytes_loaded += other.bytes_loaded
+
+def collect_blocking_stats(driver) -> Optional[BlockingStats]:
+  """
+  Count requests blocked since the previous call, draining the performance log.
+  Args:
+    driver (WebDriver): Session created with the fast profile
+  Returns:
+    BlockingStats or None: Counts since the last call, None when the browser cannot report them
+  """
+  try:
+    entries = driver.get_log('performance')
+  except Exception as e:
+    logger.debug(f"Performance log not available: {e}")
+    return None
+
+  stats = BlockingStats()
+  resource_types = {}
+  for entry in entries:
+    message = json.loads(entry['message'])['message']
+    method, params = message.get('method'), message.get('params', {})
+    if method == 'Network.requestWillBeSent':
+      resource_types[params['requestId']] = params.get('type')
+    elif method == 'Network.loadingFailed' and params.get('blockedReason') == 'inspector':
+      # 'inspector' is the reason Chromium reports for Network.setBlockedURLs matches
+      stats.blocked += 1
+      resource_type = params.get('type') or resource_types.get(params['requestId'])
+      stats.bytes_saved += ESTIMATED_RESOURCE_BYTES.get(resource_type, DEFAULT_ESTIMATED_BYTES)
+    elif method == 'Network.loadingFinished':
+      stats.bytes_loaded += int(params.get('encodedDataLength', 0))
+  return stats
@@ -0,0 +1,5 @@
+from enum import Enum
+
+class BrowserProfile(str, Enum):
+  STANDARD = 'standard'
+  FAST = 'fast'
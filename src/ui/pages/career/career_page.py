@@ -1,6 +1,7 @@
 from selenium.webdriver.common.by import By
 
 from src.ui.pages.core.base_page import BasePage
+from src.ui.pages.core.locators import locator, locator_template
 from urllib.parse import urlparse
 
 class CareerPage(BasePage):
@@ -24,30 +25,37 @@ class CareerPage(BasePage):
     super().__init__(driver)
 
   # Locators using global constants
-  _FIND_YOUR_DREAM_JOB_LINK = (By.XPATH, f"//a[contains(text(), '{FIND_YOUR_DREAM_JOB_TEXT}')]")
-  _SEE_ALL_QA_JOBS_LINK = (By.XPATH, f"//a[contains(text(), '{SEE_ALL_QA_JOBS_TEXT}')]")
-  _QA_LANDING_PAGE_HEADING = (By.XPATH, f"//h1[contains(text(), '{QUALITY_ASSURANCE_TEXT}')]")
-  _QB_JOBS_PAGE_HEADING = (By.XPATH, f"//h3[contains(text(), '{ALL_OPEN_POSITIONS_TEXT}')]")
-  _LOCATION_HEADING = (By.XPATH, f".//h3[contains(text(), '{OUR_LOCATIONS_TEXT}')]")
-  _LOCATION_RESULTS_DROPDOWN = (By.XPATH, "//ul[@id='select2-filter-by-location-results']")
-  _TEAM_LINK = (By.XPATH, f"//a[contains(text(), '{SEE_ALL_TEAMS_TEXT}')]")
-  _LIFE_HEADING = (By.XPATH, f"//h2[contains(text(), '{LIFE_AT_INSIDER_TEXT}')]")
-  _LOCATION_DROPDOWN_FIELD = (By.XPATH, "//span[@id='select2-filter-by-location-container']")
-  _LIST_JOBS = (By.XPATH, "//section[@id='career-position-list']")
-  _VIEW_ROLE_BUTTON = (By.XPATH, f"//a[contains(text(), '{VIEW_ROLE_TEXT}')]")
-  _POSITION_DEPARTMENT = (By.XPATH, "//span[@class='position-department']")
-  _POSITION_LOCATION = (By.XPATH, "//div[@class='position-location']")
-  _TOTAL_RESULT = (By.XPATH, "//span[@class='totalResult']")
-  _QA_JOBS_PAGE_HEADING = (By.XPATH, f"//h3[contains(text(), '{ALL_OPEN_POSITIONS_TEXT}')]")
-  _FILTER_SECTION = (By.XPATH, f"//div[contains(text(), '{FILTER_BY_LOCATION_TEXT}') or contains(text(), '{FILTER_BY_DEPARTMENT_TEXT}')]")
-  _DEPARTMENT_FILTER = (By.XPATH, "//span[@id='select2-filter-by-department-container']")
-  _JOB_CARDS = (By.XPATH, "//div[@class='position-list-item']")
+  _FIND_YOUR_DREAM_JOB_LINK = locator(By.XPATH, f"//a[contains(text(), '{FIND_YOUR_DREAM_JOB_TEXT}')]")
+  _SEE_ALL_QA_JOBS_LINK = locator(By.XPATH, f"//a[contains(text(), '{SEE_ALL_QA_JOBS_TEXT}')]")
+  _QA_LANDING_PAGE_HEADING = locator(By.XPATH, f"//h1[contains(text(), '{QUALITY_ASSURANCE_TEXT}')]")
+  _QB_JOBS_PAGE_HEADING = locator(By.XPATH, f"//h3[contains(text(), '{ALL_OPEN_POSITIONS_TEXT}')]")
+  _LOCATION_HEADING = locator(By.XPATH, f".//h3[contains(text(), '{OUR_LOCATIONS_TEXT}')]")
+  _LOCATION_RESULTS_DROPDOWN = locator(By.XPATH, "//ul[@id='select2-filter-by-location-results']")
+  _TEAM_LINK = locator(By.XPATH, f"//a[contains(text(), '{SEE_ALL_TEAMS_TEXT}')]")
+  _LIFE_HEADING = locator(By.XPATH, f"//h2[contains(text(), '{LIFE_AT_INSIDER_TEXT}')]")
+  _LOCATION_DROPDOWN_FIELD = locator(By.XPATH, "//span[@id='select2-filter-by-location-container']")
+  _LIST_JOBS = locator(By.XPATH, "//section[@id='career-position-list']")
+  _VIEW_ROLE_BUTTON = locator(By.XPATH, f"//a[contains(text(), '{VIEW_ROLE_TEXT}')]")
+  _POSITION_DEPARTMENT = locator(By.XPATH, "//span[@class='position-department']")
+  _POSITION_LOCATION = locator(By.XPATH, "//div[@class='position-location']")
+  _TOTAL_RESULT = locator(By.XPATH, "//span[@class='totalResult']")
+  _QA_JOBS_PAGE_HEADING = locator(By.XPATH, f"//h3[contains(text(), '{ALL_OPEN_POSITIONS_TEXT}')]")
+  _FILTER_SECTION = locator(By.XPATH, f"//div[contains(text(), '{FILTER_BY_LOCATION_TEXT}') or contains(text(), '{FILTER_BY_DEPARTMENT_TEXT}')]")
+  _DEPARTMENT_FILTER = locator(By.XPATH, "//span[@id='select2-filter-by-department-container']")
+  _JOB_CARDS = locator(By.XPATH, "//div[@class='position-list-item']")
+  # Relative to a job card
+  _CARD_DEPARTMENT = locator(By.XPATH, ".//span[@class='position-department']")
+  _CARD_LOCATION = locator(By.XPATH, ".//div[@class='position-location']")
+  _CARD_VIEW_ROLE_BUTTON = locator(By.XPATH, f".//a[contains(text(), '{VIEW_ROLE_TEXT}')]")
+
+  _DEPARTMENT_DROPDOWN_FIELD = locator_template(By.XPATH, "//span[@id='select2-filter-by-department-container' and text()='{}']")
+  _LOCATION_OPTION = locator_template(By.XPATH, "//li[contains(text(), '{}')]")
 
   def department_dropdown_field(self, department_text: str):
-    return (By.XPATH, f"//span[@id='select2-filter-by-department-container' and text()='{department_text}']")
+    return self._DEPARTMENT_DROPDOWN_FIELD(department_text)
   
   def select_location_dropdown_field(self, location_text: str):
-    return (By.XPATH, f"//li[contains(text(), '{location_text}')]")
+    return self._LOCATION_OPTION(location_text)
 
   # Actions
   def click_see_all_qa_jobs(self):
@@ -119,34 +127,33 @@ class CareerPage(BasePage):
 
   def verify_job_records(self, expected_department: str, expected_location: str):
     try:
-      job_cards = self._wait_for_elements_visible(self._JOB_CARDS)
-      if not job_cards:
+      if not self._wait_for_elements_visible(self._JOB_CARDS):
         print(self.NO_JOB_CARDS_MESSAGE)
         return True
+      # One round trip for all cards, checked in Python
+      job_cards = self._snapshot_elements(self._JOB_CARDS, fields={
+        'department': self._CARD_DEPARTMENT,
+        'location': self._CARD_LOCATION
+      })
       print(f"Found {len(job_cards)} job records to verify")
-      for i, job_card in enumerate(job_cards):
-        self.scroll_element_into_view(job_card)
-        try:
-          position_element = job_card.find_element(*self._POSITION_LOCATION)
-          position_text = position_element.text.lower()
-          location_valid = expected_location.lower() in position_text
-          department_valid = expected_department.lower() in position_text
-          if not location_valid:
-            return False
-          if not department_valid:
-            return False
-        except Exception as e:
+      for job_card in job_cards:
+        department_text = (job_card.fields['department'] or '').lower()
+        location_text = (job_card.fields['location'] or '').lower()
+        if expected_location.lower() not in location_text:
+          return False
+        if expected_department.lower() not in department_text:
           return False
       return True
     except Exception as e:
       return False
 
   def hover_and_click_view_role(self, job_index=0):
-    actual_records = self._wait_for_elements_visible(self._JOB_CARDS)
-    job_card = actual_records[job_index]
-    self.hover_element(job_card)
-    view_role_link = job_card.find_element(*self._VIEW_ROLE_BUTTON)
-    view_role_link.click()
+    def open_role(job_card):
+      self._AC.move_to_element(job_card).perform()
+      job_card.find_element(*self._CARD_VIEW_ROLE_BUTTON).click()
+
+    self._retry_stale(self._JOB_CARDS, open_role, index=job_index)
+    self._invalidate_elements()
 
   def verify_job_opened_in_new_page(self, expected_hostname):
     try:
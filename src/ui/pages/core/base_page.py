@@ -4,25 +4,36 @@ from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import *
 from pathlib import Path
 from datetime import datetime
-from dotenv import load_dotenv
 import os
+import time
+import weakref
+from src.utils.config import load_config
+from src.ui.pages.core.dom_wait import DomWaiter
+from src.ui.pages.core.dom_snapshot import snapshot_elements
+from src.ui.pages.core.locators import registry
 from src.utils.logger import logger
 
-load_dotenv()
+load_config()
 
 TIMEOUT_IN_SECS = int(os.getenv('TIMEOUT_IN_SECS'))
 BASE_URL = os.getenv('BASE_URL')
 
+# Page changes per driver, shared by every page object on it: cached elements from an older generation are dropped
+_page_generations = weakref.WeakKeyDictionary()
+
 class BasePage(object):
   def __init__(self, driver) -> None:
     self._driver = driver
     self._wait = self.__init_wait()
+    self._waiter = DomWaiter(self._driver, TIMEOUT_IN_SECS)
+    self._elements = {}
     self._AC = ActionChains(self._driver)
     logger.debug(f"BasePage initialized with driver: {type(driver).__name__}")
 
   def __init_wait(self):
     """
     Initialize WebDriverWait with common exception handling.
+    Kept for custom conditions; the common waits below go through self._waiter.
     Returns:
       WebDriverWait: Configured wait instance with timeout and ignored exceptions
     """
@@ -40,6 +51,81 @@ class BasePage(object):
       ignored_exceptions = ignored_exceptions
     )
 
+  # Element lookups
+  def _lookup(self, locator, resolve, cache=False):
+    """
+    Resolve a locator and record the lookup in the locator registry.
+    Args:
+      locator (tuple): Selenium locator tuple (By, value)
+      resolve (Callable): Performs the lookup
+      cache (bool): Reuse the single element found earlier on the same page while it is still
+        attached and displayed, and keep a found element
+    Returns:
+      Any: Result of resolve, or the cached element
+    """
+    started = time.perf_counter()
+    generation = _page_generations.get(self._driver, 0)
+    if cache:
+      cached = self._elements.pop(locator, None)
+      if cached is not None and cached[0] == generation and self._still_displayed(cached[1]):
+        self._elements[locator] = cached
+        registry.record(locator, time.perf_counter() - started, cache_hit=True)
+        return cached[1]
+    try:
+      result = resolve()
+    finally:
+      registry.record(locator, time.perf_counter() - started)
+    if cache and result:
+      self._elements[locator] = (generation, result)
+    return result
+
+  @staticmethod
+  def _still_displayed(element) -> bool:
+    try:
+      return element.is_displayed()
+    except StaleElementReferenceException:
+      return False
+
+  def _invalidate_elements(self, locator=None):
+    """
+    Drop cached elements.
+    Args:
+      locator (tuple, optional): Locator whose elements went stale; None after the page
+        navigated or changed, which invalidates every page object on this driver
+    """
+    if locator is not None:
+      self._elements.pop(locator, None)
+    else:
+      _page_generations[self._driver] = _page_generations.get(self._driver, 0) + 1
+      self._elements.clear()
+
+  def _retry_stale(self, locator, action, index=None):
+    """
+    Run an action on a visible element, looking it up again once if it went stale.
+    Args:
+      locator (tuple): Selenium locator tuple (By, value)
+      action (Callable): Called with the element
+      index (int, optional): Act on this element among all visible matches instead of the first one
+    Returns:
+      Any: Result of the action
+    Raises:
+      AssertionError: If the element is not visible within timeout
+    """
+    for attempt in range(2):
+      if index is None:
+        element = self._wait_for_element_visible(locator)
+      else:
+        elements = self._wait_for_elements_visible(locator)
+        element = elements[index] if index < len(elements) else None
+      if element is None:
+        raise AssertionError(f"Element with locator {locator} not found")
+      try:
+        return action(element)
+      except StaleElementReferenceException:
+        if attempt:
+          raise
+        self._invalidate_elements(locator)
+
   # Common functions
   def _wait_for_page_loaded(self):
     """
@@ -47,7 +133,7 @@ class BasePage(object):
     Uses JavaScript to check if the document ready state is 'complete'.
     This ensures all resources (images, stylesheets, scripts) are loaded.
     """
-    self._wait.until(
+    self._waiter.ready(
       lambda driver: driver.execute_script("return document.readyState") == 'complete'
     )
 
@@ -62,7 +148,7 @@ class BasePage(object):
     logger.debug(f"Waiting for element to be visible: {locator}")
     _element = None
     try:
-      _element = self._wait.until(EC.visibility_of_element_located(locator))
+      _element = self._lookup(locator, lambda: self._waiter.visible(locator, EC.visibility_of_element_located(locator)), cache=True)
       logger.debug(f"Element found and visible: {locator}")
     except TimeoutException:
       logger.warning(f'Element not found with locator: {locator} within timeout {TIMEOUT_IN_SECS}s')
@@ -81,7 +167,8 @@ class BasePage(object):
     logger.debug(f"Waiting for multiple elements to be visible: {locator}")
     _elements = []
     try:
-      _elements = self._wait.until(EC.visibility_of_all_elements_located(locator))
+      # Not cached: a list may re-render or grow without its first element going stale
+      _elements = self._lookup(locator, lambda: self._waiter.all_visible(locator, EC.visibility_of_all_elements_located(locator)))
       logger.debug(f"Found {len(_elements)} elements: {locator}")
     except TimeoutException:
       logger.warning(f'No elements found with locator: {locator} within timeout {TIMEOUT_IN_SECS}s')
@@ -89,6 +176,20 @@ class BasePage(object):
 
     return _elements
 
+  def _snapshot_elements(self, locator, attributes=(), fields=None):
+    """
+    Read every element matching a locator in a single round trip.
+    Args:
+      locator (tuple): Selenium locator tuple (By, value)
+      attributes (Iterable[str]): Attribute names to read from each element
+      fields (dict, optional): Named descendant locators whose text is read from each element
+    Returns:
+      List[ElementSnapshot]: Text, visibility, attributes and field texts per element
+    """
+    snapshots = self._lookup(locator, lambda: snapshot_elements(self._driver, locator, attributes, fields))
+    logger.debug(f"Snapshot of {len(snapshots)} elements: {locator}")
+    return snapshots
+
   def __element_to_be_clickable(self, locator):
     """
     Wait for an element to become clickable.
@@ -99,7 +200,7 @@ class BasePage(object):
     """
     _element = None
     try:
-      _element = self._wait.until(EC.element_to_be_clickable(locator))
+      _element = self._lookup(locator, lambda: self._waiter.clickable(locator, EC.element_to_be_clickable(locator)))
     except ElementNotVisibleException:
       print(f'Not found element with locator: {locator} within givin time, {TIMEOUT_IN_SECS}')
     except ElementNotInteractableException:
@@ -121,6 +222,7 @@ class BasePage(object):
       logger.error(f"Element not found or not clickable: {locator}")
       raise AssertionError(f"Element with locator {locator} not found or not clickable")
     element.click()
+    self._invalidate_elements()
     logger.debug(f"Successfully clicked element: {locator}")
 
   def take_screenshot(self):
@@ -166,10 +268,10 @@ class BasePage(object):
     Raises:
       AssertionError: If element is not found or not visible
     """
-    element = self._wait_for_element_visible(locator)
-    if element is None:
+    try:
+      return self._retry_stale(locator, lambda element: self._AC.move_to_element(element).perform())
+    except AssertionError:
       raise AssertionError(f"Element with locator {locator} not found for hovering")
-    return self._AC.move_to_element(element).perform()
 
   def enter_text(self, locator, text):
     """
@@ -178,10 +280,13 @@ class BasePage(object):
       locator (tuple): Selenium locator tuple (By, value)
       text (str): Text to enter into the field
     """
-    element = self._wait_for_element_visible(locator)
-    element.clear()
-    if text is not None:
-      element.send_keys(text)
+    def type_text(element):
+      element.clear()
+      if text is not None:
+        element.send_keys(text)
+
+    self._retry_stale(locator, type_text)
+    self._invalidate_elements()
 
   def navigate_to(self, url):
     """
@@ -201,6 +306,7 @@ class BasePage(object):
         url = BASE_URL + url
 
     self._driver.get(url)
+    self._invalidate_elements()
     logger.info(f"Successfully navigated to: {url}")
 
   # Common assertions
@@ -216,7 +322,7 @@ class BasePage(object):
     """
     logger.debug(f"Asserting element is visible: {locator}")
     try:
-      element = self._wait.until(EC.visibility_of_element_located(locator))
+      element = self._lookup(locator, lambda: self._waiter.visible(locator, EC.visibility_of_element_located(locator)))
       logger.debug(f"Element is visible: {locator}")
       return element
     except TimeoutException:
@@ -236,7 +342,7 @@ class BasePage(object):
       AssertionError: If text is not present within timeout
     """
     try:
-      element = self._wait.until(EC.text_to_be_present_in_element(locator, text))
+      element = self._lookup(locator, lambda: self._waiter.text_present(locator, text, EC.text_to_be_present_in_element(locator, text)))
       return element
     except TimeoutException:
       raise AssertionError(f"Element with locator {locator} is not visible")
@@ -249,4 +355,4 @@ class BasePage(object):
     Raises:
       TimeoutException: If the number of windows doesn't match within timeout
     """
-    self._wait.until(EC.number_of_windows_to_be(total))
\ No newline at end of file
+    self._waiter.poll(EC.number_of_windows_to_be(total), message=f"Expected {total} windows")
\ No newline at end of file
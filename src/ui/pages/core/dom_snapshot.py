@@ -0,0 +1,71 @@
+"""
+Bulk extraction of element data in a single WebDriver round trip.
+
+Reading text or attributes through WebElements costs one round trip per
+element and per property, and any element re-rendered in between raises
+StaleElementReferenceException. snapshot_elements() instead runs one script
+that collects everything for every element matching a locator, so checks on
+long lists run in Python on plain data.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.ui.pages.core.dom_wait import DOM_HELPERS, JS_STRATEGIES
+
+_SNAPSHOT_SCRIPT = DOM_HELPERS + """
+var locator = arguments[0], attributes = arguments[1], fields = arguments[2];
+function text(el) { return (el.innerText !== undefined ? el.innerText : el.textContent || '').trim(); }
+return find(locator[0], locator[1]).map(function (el) {
+  var values = {}, fieldTexts = {};
+  attributes.forEach(function (name) { values[name] = el.getAttribute(name); });
+  Object.keys(fields).forEach(function (name) {
+    var match = find(fields[name][0], fields[name][1], el)[0];
+    fieldTexts[name] = match ? text(match) : null;
+  });
+  return { text: text(el), visible: visible(el), attributes: values, fields: fieldTexts };
+});
+"""
+
+@dataclass
+class ElementSnapshot:
+  """
+  Attributes:
+    index (int): Position among the elements matching the locator
+    text (str): Rendered text, stripped
+    visible (bool): Whether the element is displayed
+    attributes (Dict[str, Optional[str]]): Requested attributes, None when absent
+    fields (Dict[str, Optional[str]]): Text of the first descendant matching each field locator, None when absent
+  """
+  index: int
+  text: str
+  visible: bool
+  attributes: Dict[str, Optional[str]] = field(default_factory=dict)
+  fields: Dict[str, Optional[str]] = field(default_factory=dict)
+
+def snapshot_elements(driver, locator: Tuple[str, str], attributes: Iterable[str] = (),
+                      fields: Optional[Dict[str, Tuple[str, str]]] = None) -> List[ElementSnapshot]:
+  """
+  Collect text, visibility, attributes and descendant texts of every element matching a locator.
+  Args:
+    driver (WebDriver): Browser session
+    locator (tuple): Selenium locator tuple (By, value)
+    attributes (Iterable[str]): Attribute names to read from each element
+    fields (Dict[str, tuple], optional): Named descendant locators, evaluated relative to each element
+      (XPath ones must start with '.')
+  Returns:
+    List[ElementSnapshot]: One snapshot per matching element, in document order
+  Raises:
+    ValueError: If a locator strategy cannot be evaluated in the page
+  """
+  fields = fields or {}
+  for name, field_locator in [('locator', locator)] + list(fields.items()):
+    if field_locator[0] not in JS_STRATEGIES:
+      raise ValueError(f"Unsupported locator strategy for {name}: {field_locator[0]}")
+  rows = driver.execute_script(
+    _SNAPSHOT_SCRIPT, list(locator), list(attributes), {name: list(value) for name, value in fields.items()}
+  )
+  return [
+    ElementSnapshot(index, row['text'], row['visible'], row['attributes'], row['fields'])
+    for index, row in enumerate(rows or [])
+  ]
@@ -0,0 +1,213 @@
+"""
+Event-driven element waits.
+
+A wait is one blocking execute_async_script call: the page checks the
+condition, and when it does not hold yet installs a MutationObserver (plus a
+short in-page interval for changes no mutation reports, such as layout or
+readyState) and calls back the moment it does. Where scripts cannot run, or
+the page navigates mid-wait, the waiter falls back to polling with an
+adaptive interval that starts short and backs off to the old fixed interval.
+"""
+
+import os
+import time
+from typing import Any, Callable, Dict, Optional
+
+from selenium.common.exceptions import (
+  ElementNotInteractableException,
+  ElementNotVisibleException,
+  NoSuchElementException,
+  StaleElementReferenceException,
+  TimeoutException,
+  WebDriverException
+)
+from selenium.webdriver.common.by import By
+
+from src.utils.logger import logger
+
+UI_EVENT_WAITS = os.getenv('UI_EVENT_WAITS', 'true').lower() == 'true'
+MIN_POLL_IN_SECS = 0.05
+POLL_BACKOFF = 1.5
+# Event waits are turned off for a waiter after this many script failures in a row
+MAX_SCRIPT_FAILURES = 3
+IGNORED_EXCEPTIONS = (
+  NoSuchElementException,
+  ElementNotVisibleException,
+  ElementNotInteractableException,
+  StaleElementReferenceException
+)
+
+# Locator strategies the page script can evaluate itself
+JS_STRATEGIES = {By.XPATH, By.CSS_SELECTOR, By.ID, By.CLASS_NAME, By.NAME, By.TAG_NAME}
+
+# Shared by in-page scripts: find(by, value, root) evaluates a locator relative to root (default: document)
+DOM_HELPERS = """
+function find(by, value, root) {
+  root = root || document;
+  switch (by) {
+    case 'xpath':
+      var snapshot = document.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+      var nodes = [];
+      for (var i = 0; i < snapshot.snapshotLength; i++) nodes.push(snapshot.snapshotItem(i));
+      return nodes;
+    case 'css selector': return Array.prototype.slice.call(root.querySelectorAll(value));
+    case 'id':
+      if (root === document) { var node = document.getElementById(value); return node ? [node] : []; }
+      return Array.prototype.slice.call(root.querySelectorAll('#' + CSS.escape(value)));
+    case 'class name': return Array.prototype.slice.call(root.getElementsByClassName(value));
+    case 'name': return Array.prototype.slice.call(root.querySelectorAll('[name="' + CSS.escape(value) + '"]'));
+    case 'tag name': return Array.prototype.slice.call(root.getElementsByTagName(value));
+  }
+  return [];
+}
+function visible(el) {
+  if (!el.isConnected) return false;
+  if (el.checkVisibility && !el.checkVisibility({ opacityProperty: true, visibilityProperty: true })) return false;
+  var style = window.getComputedStyle(el);
+  if (style.display === 'none' || style.visibility === 'hidden' || style.opacity === '0') return false;
+  var rect = el.getBoundingClientRect();
+  return rect.width > 0 && rect.height > 0;
+}
+"""
+
+_WAIT_TEMPLATE = """
+var args = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+%s
+function check() {
+  try { %s } catch (e) { return null; }
+}
+var value = check();
+if (value) { done({ ok: true, value: value }); return; }
+var finished = false, observer, interval, timer;
+function finish(result) {
+  if (finished) return;
+  finished = true;
+  observer.disconnect();
+  clearInterval(interval);
+  clearTimeout(timer);
+  done(result);
+}
+function recheck() {
+  var value = check();
+  if (value) finish({ ok: true, value: value });
+}
+observer = new MutationObserver(recheck);
+observer.observe(document, { subtree: true, childList: true, attributes: true, characterData: true });
+interval = setInterval(recheck, 100);
+timer = setTimeout(function () { finish({ ok: false }); }, timeoutMs);
+"""
+
+# Condition bodies; `args` holds the locator (`by`, `value`) and extra parameters
+CONDITIONS = {
+  'visible': "var els = find(args.by, args.value); return els.length && visible(els[0]) ? els[0] : null;",
+  'all_visible': "var els = find(args.by, args.value); return els.length && els.every(visible) ? els : null;",
+  'clickable': "var els = find(args.by, args.value); return els.length && visible(els[0]) && !els[0].disabled ? els[0] : null;",
+  'text_present': "var els = find(args.by, args.value); return els.length && (els[0].innerText || els[0].textContent || '').indexOf(args.text) >= 0 ? true : null;",
+  'ready': "return document.readyState === 'complete' ? true : null;"
+}
+_SCRIPTS = {name: _WAIT_TEMPLATE % (DOM_HELPERS, body) for name, body in CONDITIONS.items()}
+
+class DomWaiter:
+  """
+  Waits for page conditions with in-page observers, falling back to adaptive polling.
+  Attributes:
+    timeout (float): Default wait timeout in seconds
+    max_poll (float): Longest interval between two polls in fallback mode
+    event_driven (bool): Whether in-page observers are used
+  """
+  def __init__(self, driver, timeout: float, max_poll: float = 0.5, event_driven: bool = UI_EVENT_WAITS) -> None:
+    self._driver = driver
+    self.timeout = timeout
+    self.max_poll = max_poll
+    self.event_driven = event_driven
+    self._script_failures = 0
+    self._script_timeout = None
+
+  def _ensure_script_timeout(self, timeout: float):
+    # The async script must be allowed to block for the whole wait, so a longer wait raises the limit
+    needed = timeout + 5
+    if self._script_timeout is None or needed > self._script_timeout:
+      self._driver.set_script_timeout(needed)
+      self._script_timeout = needed
+
+  def poll(self, predicate: Callable[[Any], Any], timeout: Optional[float] = None, message: str = '') -> Any:
+    """
+    Poll a Python predicate with an interval growing from 50ms up to max_poll.
+    Args:
+      predicate (Callable): Called with the driver, e.g. an expected_conditions instance
+      timeout (float, optional): Seconds to wait, defaults to the waiter's timeout
+      message (str): TimeoutException message
+    Returns:
+      Any: First truthy predicate result
+    Raises:
+      TimeoutException: If the predicate did not hold in time
+    """
+    deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+    delay = MIN_POLL_IN_SECS
+    while True:
+      try:
+        value = predicate(self._driver)
+        if value:
+          return value
+      except IGNORED_EXCEPTIONS:
+        pass
+      remaining = deadline - time.monotonic()
+      if remaining <= 0:
+        raise TimeoutException(message)
+      time.sleep(min(delay, remaining))
+      delay = min(delay * POLL_BACKOFF, self.max_poll)
+
+  def until(self, condition: str, fallback: Callable[[Any], Any], args: Dict[str, Any] = None,
+            timeout: Optional[float] = None, message: str = '') -> Any:
+    """
+    Wait for a named condition from CONDITIONS.
+    Args:
+      condition (str): Condition name, e.g. 'visible'
+      fallback (Callable): Equivalent Python predicate used when scripts cannot run
+      args (Dict[str, Any], optional): Condition arguments (locator `by`/`value`, `text`)
+      timeout (float, optional): Seconds to wait, defaults to the waiter's timeout
+      message (str): TimeoutException message
+    Returns:
+      Any: Condition result (an element, a list of elements or True)
+    Raises:
+      TimeoutException: If the condition did not hold in time
+    """
+    timeout = self.timeout if timeout is None else timeout
+    args = args or {}
+    if not self.event_driven or ('by' in args and args['by'] not in JS_STRATEGIES):
+      return self.poll(fallback, timeout, message)
+
+    deadline = time.monotonic() + timeout
+    try:
+      self._ensure_script_timeout(timeout)
+      result = self._driver.execute_async_script(_SCRIPTS[condition], args, int(timeout * 1000))
+      self._script_failures = 0
+    except TimeoutException:
+      raise TimeoutException(message)
+    except WebDriverException as e:
+      # Navigation mid-wait, or a page where scripts cannot run: poll for the time left
+      self._script_failures += 1
+      if self._script_failures >= MAX_SCRIPT_FAILURES:
+        logger.warning(f"Event-driven waits failed {self._script_failures} times in a row, polling from now on: {e.msg}")
+        self.event_driven = False
+      return self.poll(fallback, max(deadline - time.monotonic(), 0), message)
+
+    if result and result.get('ok'):
+      return result['value']
+    raise TimeoutException(message)
+
+  # Element conditions
+  def visible(self, locator, fallback, timeout: Optional[float] = None) -> Any:
+    return self.until('visible', fallback, {'by': locator[0], 'value': locator[1]}, timeout, f"Element {locator} not visible")
+
+  def all_visible(self, locator, fallback, timeout: Optional[float] = None) -> Any:
+    return self.until('all_visible', fallback, {'by': locator[0], 'value': locator[1]}, timeout, f"Elements {locator} not visible")
+
+  def clickable(self, locator, fallback, timeout: Optional[float] = None) -> Any:
+    return self.until('clickable', fallback, {'by': locator[0], 'value': locator[1]}, timeout, f"Element {locator} not clickable")
+
+  def text_present(self, locator, text: str, fallback, timeout: Optional[float] = None) -> Any:
+    return self.until('text_present', fallback, {'by': locator[0], 'value': locator[1], 'text': str(text)}, timeout, f"Text '{text}' not in {locator}")
+
+  def ready(self, fallback, timeout: Optional[float] = None) -> Any:
+    return self.until('ready', fallback, None, timeout, "Page did not finish loading")
@@ -0,0 +1,246 @@
+"""
+Locator registry for page objects.
+
+Locators declared with locator() are compiled once at class definition: XPath
+expressions that are plain tag/attribute paths are rewritten to the equivalent
+CSS selector, which browsers match natively instead of through the XPath
+engine; anything CSS cannot express (text(), contains(), axes, positions, or)
+stays XPath. locator_template() memoizes parameterized locators per argument
+set. Every lookup made through BasePage is recorded per locator, so the
+slowest and most repeated lookups show up in the "Locator lookups" summary.
+"""
+
+import re
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from selenium.webdriver.common.by import By
+
+DEFAULT_TOP = 15
+
+_TAG = r"(?:[a-z][a-z0-9-]*|\*)"
+_STEP = re.compile(rf"(//|/)({_TAG})((?:\[[^\[\]]*\])*)")
+_PREDICATE = re.compile(r"\[([^\[\]]*)\]")
+_CONDITION = re.compile(r"""\s*@([A-Za-z_][\w-]*)\s*(?:=\s*(?:'([^']*)'|"([^"]*)"))?\s*""")
+_AND = re.compile(r"and\b")
+# Attributes whose values HTML selectors compare ASCII case-insensitively, unlike XPath
+# (HTML Standard, "Case-sensitivity of selectors"); conditions on their values stay XPath
+_CASE_INSENSITIVE_ATTRIBUTES = frozenset((
+  'accept', 'accept-charset', 'align', 'alink', 'axis', 'bgcolor', 'charset', 'checked', 'clear',
+  'codetype', 'color', 'compact', 'declare', 'defer', 'dir', 'direction', 'disabled', 'enctype',
+  'face', 'frame', 'hreflang', 'http-equiv', 'lang', 'language', 'link', 'media', 'method',
+  'multiple', 'nohref', 'noresize', 'noshade', 'nowrap', 'readonly', 'rel', 'rev', 'rules',
+  'scope', 'scrolling', 'selected', 'shape', 'target', 'text', 'type', 'valign', 'valuetype', 'vlink'
+))
+
+def _css_string(value: str) -> str:
+  return '"' + value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\a ') + '"'
+
+def _predicate_to_css(predicate: str) -> Optional[str]:
+  # Conditions joined by `and`; anything else, including a dangling `and`, has no CSS equivalent here
+  css, position = '', 0
+  while True:
+    match = _CONDITION.match(predicate, position)
+    if not match:
+      return None
+    name, single, double = match.groups()
+    value = single if single is not None else double
+    # HTML matches attribute names case-insensitively in CSS only
+    if name != name.lower() or (value is not None and name in _CASE_INSENSITIVE_ATTRIBUTES):
+      return None
+    css += f'[{name}]' if value is None else f'[{name}={_css_string(value)}]'
+    position = match.end()
+    if position == len(predicate):
+      return css
+    conjunction = _AND.match(predicate, position)
+    if not conjunction:
+      return None
+    position = conjunction.end()
+
+def xpath_to_css(xpath: str) -> Optional[str]:
+  """
+  Rewrite an XPath to an equivalent CSS selector, when there is one.
+  Supported: descendant (//) and child (/) steps on a tag or *, with predicates made
+  of @attr and @attr='value' conditions joined by `and`. Relative expressions
+  (.//) are only rewritten when they have a single step, since CSS evaluated
+  from an element may match ancestors outside of it. Conditions CSS would match
+  case-insensitively in HTML, on attribute names with capitals or on the values
+  of attributes such as type, lang or dir, are not rewritten.
+  Args:
+    xpath (str): XPath expression
+  Returns:
+    str or None: CSS selector matching the same elements of an HTML document, None if not expressible
+  """
+  relative = xpath.startswith('.//')
+  path = xpath[1:] if relative else xpath
+  if not path.startswith('//'):
+    return None
+
+  parts, position = [], 0
+  while position < len(path):
+    match = _STEP.match(path, position)
+    if not match:
+      return None
+    axis, tag, predicates = match.groups()
+    selector = tag if tag != '*' or not predicates else ''
+    for predicate in _PREDICATE.findall(predicates):
+      condition = _predicate_to_css(predicate)
+      if condition is None:
+        return None
+      selector += condition
+    if parts:
+      parts.append(' > ' if axis == '/' else ' ')
+    parts.append(selector or '*')
+    position = match.end()
+
+  if relative and len(parts) > 1:
+    return None
+  return ''.join(parts)
+
+class Locator(tuple):
+  """
+  Compiled (by, value) locator, usable anywhere Selenium takes a locator tuple.
+  Attributes:
+    source (tuple): Locator as written in the page object
+    names (List[str]): Page object attributes it was assigned to
+  """
+  def __new__(cls, by: str, value: str, source: Tuple[str, str]):
+    self = super().__new__(cls, (by, value))
+    self.source = source
+    self.names = []
+    return self
+
+  def __set_name__(self, owner, name):
+    self.names.append(f'{owner.__name__}.{name}')
+
+  @property
+  def label(self) -> str:
+    return ', '.join(self.names) or f'{self.source[0]}={self.source[1]}'
+
+  @property
+  def compiled(self) -> bool:
+    return tuple(self) != tuple(self.source)
+
+class LocatorTemplate:
+  """
+  Parameterized locator; calling it formats the value and returns the memoized compiled Locator.
+  Attributes:
+    by (str): Locator strategy
+    template (str): Value with str.format placeholders
+  """
+  def __init__(self, registry: 'LocatorRegistry', by: str, template: str) -> None:
+    self._registry = registry
+    self.by = by
+    self.template = template
+    self.name = None
+    self._memo: Dict[tuple, Locator] = {}
+
+  def __set_name__(self, owner, name):
+    self.name = f'{owner.__name__}.{name}'
+
+  def __call__(self, *args, **kwargs) -> Locator:
+    key = (args, tuple(sorted(kwargs.items())))
+    compiled = self._memo.get(key)
+    if compiled is None:
+      compiled = self._registry.compile(self.by, self.template.format(*args, **kwargs))
+      if self.name and not compiled.names:
+        compiled.names.append(f"{self.name}({', '.join(map(repr, args))})")
+      self._memo[key] = compiled
+    return compiled
+
+@dataclass
+class LookupStats:
+  """
+  Attributes:
+    lookups (int): Number of lookups, including cache hits
+    cache_hits (int): Lookups answered from a page's element cache
+    total_secs (float): Time spent in lookups
+    max_secs (float): Slowest single lookup
+  """
+  lookups: int = 0
+  cache_hits: int = 0
+  total_secs: float = 0.0
+  max_secs: float = 0.0
+
+class LocatorRegistry:
+  """
+  Compiles locators once and collects per-locator lookup statistics.
+  """
+  def __init__(self) -> None:
+    self._lock = threading.Lock()
+    self._compiled: Dict[Tuple[str, str], Locator] = {}
+    self._stats: Dict[Locator, LookupStats] = {}
+
+  def compile(self, by: str, value: str) -> Locator:
+    """
+    Args:
+      by (str): Locator strategy, e.g. By.XPATH
+      value (str): Locator value
+    Returns:
+      Locator: Shared compiled locator, CSS when the XPath has an equivalent selector
+    """
+    source = (by, value)
+    with self._lock:
+      compiled = self._compiled.get(source)
+      if compiled is None:
+        css = xpath_to_css(value) if by == By.XPATH else None
+        compiled = Locator(By.CSS_SELECTOR, css, source) if css else Locator(by, value, source)
+        self._compiled[source] = compiled
+    return compiled
+
+  def template(self, by: str, template: str) -> LocatorTemplate:
+    return LocatorTemplate(self, by, template)
+
+  def record(self, locator, elapsed: float, cache_hit: bool = False):
+    """
+    Args:
+      locator (tuple): Locator that was looked up; plain tuples are compiled first
+      elapsed (float): Seconds the lookup took
+      cache_hit (bool): Whether the element came from a page's element cache
+    """
+    if not isinstance(locator, Locator):
+      locator = self.compile(*locator)
+    with self._lock:
+      stats = self._stats.setdefault(locator, LookupStats())
+      stats.lookups += 1
+      stats.cache_hits += cache_hit
+      stats.total_secs += elapsed
+      stats.max_secs = max(stats.max_secs, elapsed)
+
+  def stats(self) -> Dict[Locator, LookupStats]:
+    with self._lock:
+      return {locator: LookupStats(**vars(stats)) for locator, stats in self._stats.items()}
+
+  def reset(self):
+    with self._lock:
+      self._stats.clear()
+
+  def format_lines(self, top: int = DEFAULT_TOP) -> List[str]:
+    """
+    Returns:
+      List[str]: Locators with the most lookup time, one per line
+    """
+    rows = sorted(self.stats().items(), key=lambda item: item[1].total_secs, reverse=True)[:top]
+    lines = [f"{'lookups':>7} {'cached':>6} {'total s':>8} {'max s':>6}  locator"]
+    for locator, stats in rows:
+      kind = 'css' if locator.compiled else locator[0]
+      lines.append(
+        f"{stats.lookups:>7} {stats.cache_hits:>6} {stats.total_secs:>8.2f} {stats.max_secs:>6.2f}  "
+        f"{locator.label} [{kind}]"
+      )
+    return lines
+
+registry = LocatorRegistry()
+
+def locator(by: str, value: str) -> Locator:
+  """
+  Declare a page object locator, compiled through the default registry.
+  """
+  return registry.compile(by, value)
+
+def locator_template(by: str, template: str) -> LocatorTemplate:
+  """
+  Declare a parameterized page object locator, e.g. locator_template(By.XPATH, "//li[text()='{}']").
+  """
+  return registry.template(by, template)
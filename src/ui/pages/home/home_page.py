@@ -1,6 +1,7 @@
 from selenium.webdriver.common.by import By
 
 from src.ui.pages.core.base_page import BasePage
+from src.ui.pages.core.locators import locator
 
 class HomePage(BasePage):
   # Global constants for text values
@@ -16,11 +17,11 @@ class HomePage(BasePage):
     super().__init__(driver)
 
   # Locators
-  __BRAND = (By.CLASS_NAME, 'navbar-brand')
-  _COMPANY_MENU = (By.XPATH, f"//ul[@class='navbar-nav']//a[contains(normalize-space(text()), '{COMPANY_MENU_TEXT}')]")
-  _CAREERS_LINK = (By.XPATH, f"//div[@class='new-menu-dropdown-layout-6-mid-container']//a[contains(text(), '{CAREERS_LINK_TEXT}')]")
-  _FIND_YOUR_DREAM_JOB_LINK = (By.XPATH, f"//a[contains(text(), '{FIND_YOUR_DREAM_JOB_TEXT}')]")
-  _SEE_ALL_QA_JOBS_LINK = (By.XPATH, f"//a[contains(text(), '{SEE_ALL_QA_JOBS_TEXT}')]")
+  __BRAND = locator(By.CLASS_NAME, 'navbar-brand')
+  _COMPANY_MENU = locator(By.XPATH, f"//ul[@class='navbar-nav']//a[contains(normalize-space(text()), '{COMPANY_MENU_TEXT}')]")
+  _CAREERS_LINK = locator(By.XPATH, f"//div[@class='new-menu-dropdown-layout-6-mid-container']//a[contains(text(), '{CAREERS_LINK_TEXT}')]")
+  _FIND_YOUR_DREAM_JOB_LINK = locator(By.XPATH, f"//a[contains(text(), '{FIND_YOUR_DREAM_JOB_TEXT}')]")
+  _SEE_ALL_QA_JOBS_LINK = locator(By.XPATH, f"//a[contains(text(), '{SEE_ALL_QA_JOBS_TEXT}')]")
 
   # Actions
   def open(self):
@@ -0,0 +1,19 @@
+import threading
+
+_loaded = False
+_lock = threading.Lock()
+
+def load_config():
+  """
+  Load variables from the .env file into os.environ, once per process.
+  Modules read their settings with os.getenv right after calling this, so
+  python-dotenv is imported and the file parsed only on the first call.
+  """
+  global _loaded
+  if _loaded:
+    return
+  with _lock:
+    if not _loaded:
+      from dotenv import load_dotenv
+      load_dotenv()
+      _loaded = True
@@ -0,0 +1,126 @@
+"""
+Import-time report for the test framework, checked against a budget.
+
+Runs a fresh interpreter with `python -X importtime`, so the numbers match what
+every pytest worker pays at startup before collecting a single test.
+
+Usage:
+  python -m src.utils.import_time --budget-ms 400
+  python -m src.utils.import_time src.api.pet.pet_api tests.api.test_get_pet --top 20
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+# Written to stderr before the measured imports, to leave out interpreter startup
+START_MARKER = 'import-time-report: start'
+# What an API-only worker imports before its first test
+DEFAULT_MODULES = ('conftest', 'src.api.pet.pet_api', 'src.api.pet.pet_assertions', 'test_data.factories.pet_data_factory')
+DEFAULT_TOP = 15
+
+@dataclass
+class ImportTiming:
+  """
+  Attributes:
+    module (str): Imported module name
+    self_us (int): Time spent in the module itself, in microseconds
+    cumulative_us (int): Time including the module's own imports, in microseconds
+    depth (int): Nesting level, 0 for modules imported directly by the measured code
+  """
+  module: str
+  self_us: int
+  cumulative_us: int
+  depth: int
+
+@dataclass
+class ImportReport:
+  modules: List[str]
+  timings: List[ImportTiming] = field(default_factory=list)
+
+  @property
+  def total_ms(self) -> float:
+    return sum(timing.cumulative_us for timing in self.timings if timing.depth == 0) / 1000
+
+  def slowest(self, top: int = DEFAULT_TOP) -> List[ImportTiming]:
+    """
+    Returns:
+      List[ImportTiming]: Modules with the highest self time
+    """
+    return sorted(self.timings, key=lambda timing: timing.self_us, reverse=True)[:top]
+
+  def loaded(self, module: str) -> bool:
+    return any(timing.module == module for timing in self.timings)
+
+  def format_lines(self, top: int = DEFAULT_TOP, budget_ms: Optional[float] = None) -> List[str]:
+    lines = [f"Import time of {', '.join(self.modules)}: {self.total_ms:.1f} ms"]
+    if budget_ms is not None:
+      verdict = 'within' if self.total_ms <= budget_ms else 'OVER'
+      lines[0] += f" ({verdict} budget of {budget_ms:.0f} ms)"
+    lines.append(f"{'self ms':>9} {'cumul. ms':>10}  module")
+    for timing in self.slowest(top):
+      lines.append(f"{timing.self_us / 1000:>9.1f} {timing.cumulative_us / 1000:>10.1f}  {timing.module}")
+    return lines
+
+def parse_importtime(output: str) -> List[ImportTiming]:
+  """
+  Args:
+    output (str): stderr of `python -X importtime`
+  Returns:
+    List[ImportTiming]: One entry per imported module after START_MARKER (or all of them), in import order
+  """
+  timings = []
+  _, marker, measured = output.partition(START_MARKER)
+  for line in (measured if marker else output).splitlines():
+    if not line.startswith('import time:'):
+      continue
+    parts = line[len('import time:'):].split('|')
+    if len(parts) != 3 or not parts[0].strip().isdigit():
+      # Header line
+      continue
+    name = parts[2].rstrip()
+    # Every nesting level adds two spaces after the single separator space
+    depth = (len(name) - len(name.lstrip()) - 1) // 2
+    timings.append(ImportTiming(name.strip(), int(parts[0]), int(parts[1]), depth))
+  return timings
+
+def measure_imports(modules=DEFAULT_MODULES, python: str = sys.executable, cwd: Optional[str] = None) -> ImportReport:
+  """
+  Import modules in a fresh interpreter and collect per-module import times.
+  Args:
+    modules (Iterable[str]): Modules to import, in order
+    python (str): Interpreter to run
+    cwd (str, optional): Working directory, defaults to the current one
+  Returns:
+    ImportReport: Timings of every module loaded
+  Raises:
+    RuntimeError: If the modules fail to import
+  """
+  modules = list(modules)
+  code = '; '.join([f'import sys; sys.stderr.write({START_MARKER + chr(10)!r})'] + [f'import {module}' for module in modules])
+  completed = subprocess.run(
+    [python, '-X', 'importtime', '-c', code],
+    cwd=cwd, env=os.environ.copy(), capture_output=True, text=True
+  )
+  if completed.returncode != 0:
+    raise RuntimeError(f"Importing {', '.join(modules)} failed:\n{completed.stderr[-2000:]}")
+  return ImportReport(modules, parse_importtime(completed.stderr))
+
+def main(argv=None) -> int:
+  parser = argparse.ArgumentParser(description="Report test framework import time against a budget")
+  parser.add_argument('modules', nargs='*', default=list(DEFAULT_MODULES), help="Modules to import")
+  parser.add_argument('--budget-ms', type=float, default=None, help="Fail when the total import time exceeds this")
+  parser.add_argument('--top', type=int, default=DEFAULT_TOP, help="Number of slowest modules to list")
+  args = parser.parse_args(argv)
+
+  report = measure_imports(args.modules)
+  print('\n'.join(report.format_lines(args.top, args.budget_ms)))
+  if args.budget_ms is not None and report.total_ms > args.budget_ms:
+    return 1
+  return 0
+
+if __name__ == '__main__':
+  sys.exit(main())
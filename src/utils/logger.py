@@ -1,8 +1,9 @@
 import logging
 import os
-from dotenv import load_dotenv
 
-load_dotenv()
+from src.utils.config import load_config
+
+load_config()
 
 class Logger:
   _instance = None
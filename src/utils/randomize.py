@@ -1,5 +1,7 @@
-from faker import Faker
-fake = Faker()
+import threading
+
+_faker = None
+_faker_lock = threading.Lock()
 
 # Global constants for default values
 DEFAULT_MIN_CHARS = 15
@@ -9,6 +11,28 @@ DEFAULT_MIN_INT = 100000000
 DEFAULT_MAX_INT = 99999999999
 DEFAULT_DELIMITER = '_'
 
+def get_faker():
+  """
+  Get the Faker instance shared by all test data helpers.
+  Faker is imported and created on first use, so modules that never generate
+  random data do not pay for loading it.
+  Returns:
+    Faker: Shared Faker instance
+  """
+  global _faker
+  if _faker is None:
+    with _faker_lock:
+      if _faker is None:
+        from faker import Faker
+        _faker = Faker()
+  return _faker
+
+def __getattr__(name):
+  # Keeps `from src.utils.randomize import fake` working without an eager import
+  if name == 'fake':
+    return get_faker()
+  raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 def rand_str(min_chars = DEFAULT_MIN_CHARS, max_chars = DEFAULT_MAX_CHARS, prefix = None):
   """
   Generate a random string with specified length constraints.
@@ -19,7 +43,7 @@ def rand_str(min_chars = DEFAULT_MIN_CHARS, max_chars = DEFAULT_MAX_CHARS, prefi
   Returns:
     str: Random string with optional prefix
   """
-  random_part = fake.pystr(min_chars, max_chars)
+  random_part = get_faker().pystr(min_chars, max_chars)
   if prefix is None:
     return random_part
   else:
@@ -45,7 +69,7 @@ def rand_int(min=DEFAULT_MIN_INT, max=DEFAULT_MAX_INT):
   Returns:
     int: Random integer within the specified range
   """
-  return fake.random_int(min, max)
+  return get_faker().random_int(min, max)
 
 def random_image_url():
   """
@@ -53,4 +77,4 @@ def random_image_url():
   Returns:
     str: Random image URL
   """
-  return fake.image_url()
+  return get_faker().image_url()
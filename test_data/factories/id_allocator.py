@@ -0,0 +1,132 @@
+import itertools
+import os
+import re
+import secrets
+import threading
+from typing import List, Optional
+
+# Pet id layout, Snowflake-style, inside [DEFAULT_PET_ID_MIN, DEFAULT_PET_ID_MIN + 2^53):
+#   [ worker: 8 bits ][ session: 21 bits ][ sequence: 24 bits ]
+# The worker index gives each pytest-xdist worker of a run a disjoint slice, and the
+# random per-process session number separates concurrent runs and processes.
+WORKER_BITS = 8
+SESSION_BITS = 21
+SEQUENCE_BITS = 24
+MAX_WORKER = (1 << WORKER_BITS) - 1
+MAX_SESSION = (1 << SESSION_BITS) - 1
+MAX_SEQUENCE = (1 << SEQUENCE_BITS) - 1
+
+ID_WORKER = os.getenv('ID_WORKER')
+ID_SESSION = os.getenv('ID_SESSION')
+
+def worker_index() -> int:
+  """
+  Returns:
+    int: ID_WORKER if set, else the pytest-xdist worker number (gw3 -> 3), else 0
+  """
+  if ID_WORKER is not None:
+    return int(ID_WORKER)
+  match = re.fullmatch(r'gw(\d+)', os.getenv('PYTEST_XDIST_WORKER', ''))
+  return int(match.group(1)) if match else 0
+
+def new_session() -> int:
+  """
+  Returns:
+    int: ID_SESSION if set, else a random session number mixed with the process id
+  """
+  if ID_SESSION is not None:
+    return int(ID_SESSION)
+  return (secrets.randbits(SESSION_BITS) ^ os.getpid()) & MAX_SESSION
+
+class IdAllocator:
+  """
+  Hands out unique ids from a block reserved for one worker and session.
+
+  allocate() is a single next() on an itertools.count, which is atomic under
+  the GIL, so it is O(1) and needs no lock even when called from many threads.
+  Attributes:
+    base (int): First id of the reserved block
+    worker (int): Worker index encoded in the ids
+    session (int): Session number encoded in the ids
+  """
+  def __init__(self, base: int, worker: Optional[int] = None, session: Optional[int] = None) -> None:
+    self.worker = worker_index() if worker is None else worker
+    if not 0 <= self.worker <= MAX_WORKER:
+      raise ValueError(f"Worker index must be between 0 and {MAX_WORKER}, got {self.worker}")
+    if session is not None and not 0 <= session <= MAX_SESSION:
+      raise ValueError(f"Session number must be between 0 and {MAX_SESSION}, got {session}")
+    self._origin = base
+    self._fork_lock = threading.Lock()
+    self._start_session(new_session() if session is None else session)
+
+  def _start_session(self, session: int):
+    self.session = session
+    self.base = self._origin + (((self.worker << SESSION_BITS) | session) << SEQUENCE_BITS)
+    self._sequence = itertools.count()
+    self._issued: List[int] = []
+    self._pid = os.getpid()
+
+  def restart(self, session: int, worker: Optional[int] = None):
+    """
+    Move to the start of another block, so a known session number reproduces the same ids.
+    Args:
+      session (int): Session number of the new block
+      worker (int, optional): Worker index of the new block, defaults to the current one
+    Raises:
+      ValueError: If the worker index or session number is out of range
+    """
+    worker = self.worker if worker is None else worker
+    if not 0 <= worker <= MAX_WORKER:
+      raise ValueError(f"Worker index must be between 0 and {MAX_WORKER}, got {worker}")
+    if not 0 <= session <= MAX_SESSION:
+      raise ValueError(f"Session number must be between 0 and {MAX_SESSION}, got {session}")
+    with self._fork_lock:
+      self.worker = worker
+      self._start_session(session)
+
+  def _check_fork(self):
+    # A forked child would replay the parent's sequence, so it moves to a block of its own
+    if os.getpid() != self._pid:
+      with self._fork_lock:
+        if os.getpid() != self._pid:
+          self._start_session(new_session())
+
+  def allocate(self) -> int:
+    """
+    Returns:
+      int: Next unused id of the block
+    Raises:
+      RuntimeError: If all 2^24 ids of the block have been issued
+    """
+    self._check_fork()
+    sequence = next(self._sequence)
+    if sequence > MAX_SEQUENCE:
+      raise RuntimeError(f"Id block of worker {self.worker}, session {self.session} is exhausted")
+    id = self.base + sequence
+    self._issued.append(id)
+    return id
+
+  def allocate_many(self, count: int) -> List[int]:
+    """
+    Args:
+      count (int): Number of ids to allocate
+    Returns:
+      List[int]: Unique ids
+    """
+    return [self.allocate() for _ in range(count)]
+
+  def issued(self) -> List[int]:
+    """
+    Returns:
+      List[int]: Every id handed out so far, in allocation order
+    """
+    return list(self._issued)
+
+  def owns(self, id: int) -> bool:
+    """
+    Args:
+      id (int): Pet id
+    Returns:
+      bool: True if the id falls in this allocator's reserved block
+    """
+    return self.base <= id <= self.base + MAX_SEQUENCE
@@ -1,10 +1,13 @@
-from faker import Faker
-from typing import Dict, Any, Optional
+import dataclasses
+import json
+import random
+import string
+from typing import Dict, Any, Iterator, List, Optional, Union
 
-from src.api.pet.types import PetStatus
-from src.utils.randomize import rand_unique_str
-
-fake = Faker()
+from src.api.core.wire_model import is_wire_model, wire_keys
+from src.api.pet.types import Pet, PetStatus
+from test_data.factories.id_allocator import IdAllocator
+from src.utils.randomize import DEFAULT_DELIMITER, DEFAULT_UNIQUE_CHARS, get_faker, rand_unique_str
 
 # Global constants for pet data generation
 DEFAULT_PET_ID_MIN = 10000000000000
@@ -15,6 +18,19 @@ DEFAULT_TAG_ID_MIN = 1
 DEFAULT_TAG_ID_MAX = 1000
 DEFAULT_PHOTO_URLS_COUNT = 2
 DEFAULT_TAGS_COUNT = 1
+DEFAULT_BATCH_SIZE = 4096
+# Same shape as the URLs Faker's image_url() returns
+IMAGE_URL_FORMATS = (
+  'https://placekitten.com/{}/{}',
+  'https://dummyimage.com/{}x{}',
+  'https://picsum.photos/{}/{}'
+)
+IMAGE_SIZE_MIN = 1
+IMAGE_SIZE_MAX = 1024
+UNIQUE_STR_ALPHABET = string.ascii_letters
+
+# Collision-free pet ids, partitioned per worker and session (see id_allocator)
+pet_ids = IdAllocator(DEFAULT_PET_ID_MIN)
 
 def create_random_pet_body(overrides: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
   """
@@ -24,8 +40,9 @@ def create_random_pet_body(overrides: Optional[Dict[str, Any]] = None) -> Dict[s
   Returns:
     Dict[str, Any]: Pet object with random data
   """
+  fake = get_faker()
   default_payload = {
-    "id": fake.random_int(min=DEFAULT_PET_ID_MIN, max=DEFAULT_PET_ID_MAX),
+    "id": overrides["id"] if overrides and "id" in overrides else pet_ids.allocate(),
     "category": {
       "id": fake.random_int(min=DEFAULT_CATEGORY_ID_MIN, max=DEFAULT_CATEGORY_ID_MAX),
       "name": rand_unique_str('category')
@@ -50,21 +67,144 @@ def create_random_pet_body(overrides: Optional[Dict[str, Any]] = None) -> Dict[s
 
   return default_payload
 
-def update_pet_body(original: Dict[str, Any], overrides: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+def _wire_value(value):
+  # Overrides may mix wire-format dicts with models
+  if is_wire_model(type(value)):
+    return value.to_wire()
+  if isinstance(value, list):
+    return [_wire_value(item) for item in value]
+  return value
+
+def update_pet_body(original: Union[Dict[str, Any], Pet], overrides: Optional[Dict[str, Any]] = None) -> Union[Dict[str, Any], Pet]:
   """
   Update an existing pet object with new values.
   Args:
-    original (Dict[str, Any]): Original pet object
-    overrides (Dict[str, Any], optional): Dictionary of field overrides
+    original (Dict[str, Any] | Pet): Original pet object, as a wire-format dict or a Pet model
+    overrides (Dict[str, Any], optional): Dictionary of field overrides, keyed by wire name (e.g. photoUrls);
+      nested values may be wire-format dicts or models
   Returns:
-    Dict[str, Any]: Updated pet object
+    Dict[str, Any] | Pet: Updated pet object of the same kind as the original
+  Raises:
+    ValueError: If the original is a Pet and an override is not one of its wire keys or does not match the field's type
   """
+  if isinstance(original, Pet):
+    if not overrides:
+      return dataclasses.replace(original)
+    # from_wire ignores keys it does not know, which would silently drop the override
+    unknown = [key for key in overrides if key not in wire_keys(Pet)]
+    if unknown:
+      raise ValueError(f"Unknown Pet wire keys {', '.join(unknown)}, expected one of {', '.join(wire_keys(Pet))}")
+    # Round-trip through the wire format, so nested overrides become models like the rest of the pet
+    return Pet.from_wire({**original.to_wire(), **{key: _wire_value(value) for key, value in overrides.items()}})
+
   if overrides is None:
     return original.copy()
+  return {**original, **overrides}
+
+# Each generated field draws from its own stream, so how many values one field takes per
+# batch never shifts the values of another
+_DRAWN_FIELDS = ('id', 'category_id', 'category_name', 'name', 'photo_format', 'photo_width', 'photo_height', 'tag_id', 'tag_name')
+
+class _PetDraws:
+  """
+  Seeded bulk draws for generate_pet_bodies(), from random.Random streams derived from the seed, one per field.
+  """
+  def __init__(self, seed: Optional[int]) -> None:
+    root = random.Random(seed)
+    self._streams = {field: random.Random(root.getrandbits(64)) for field in _DRAWN_FIELDS}
+
+  def integers(self, field: str, low: int, high: int, count: int) -> List[int]:
+    rng = self._streams[field]
+    # choices() is one C-level loop, but it draws from 53-bit floats, so only use it for ranges it can cover
+    if high - low < 2 ** 53:
+      return rng.choices(range(low, high + 1), k=count)
+    randrange = rng.randrange
+    return [randrange(low, high + 1) for _ in range(count)]
+
+  def strings(self, field: str, length: int, count: int) -> List[str]:
+    chars = ''.join(self._streams[field].choices(UNIQUE_STR_ALPHABET, k=length * count))
+    return [chars[i:i + length] for i in range(0, length * count, length)]
+
+def _image_urls(draws: _PetDraws, count: int) -> List[str]:
+  formats = draws.integers('photo_format', 0, len(IMAGE_URL_FORMATS) - 1, count)
+  widths = draws.integers('photo_width', IMAGE_SIZE_MIN, IMAGE_SIZE_MAX, count)
+  heights = draws.integers('photo_height', IMAGE_SIZE_MIN, IMAGE_SIZE_MAX, count)
+  return [IMAGE_URL_FORMATS[f].format(w, h) for f, w, h in zip(formats, widths, heights)]
+
+def _unique_strs(draws: _PetDraws, field: str, prefix: str, count: int) -> List[str]:
+  prefix = prefix + DEFAULT_DELIMITER
+  return [prefix + chars for chars in draws.strings(field, DEFAULT_UNIQUE_CHARS, count)]
 
-  result = original.copy()
-  result.update(overrides)
-  return result
+def generate_pet_bodies(count: int, seed: Optional[int] = None, overrides: Optional[Dict[str, Any]] = None,
+                        batch_size: int = DEFAULT_BATCH_SIZE, ids: Optional[IdAllocator] = None) -> Iterator[Dict[str, Any]]:
+  """
+  Generate random pet objects in bulk, equivalent in shape to create_random_pet_body().
+  Every field is drawn for a whole batch at once from its own random.Random stream
+  derived from the seed, so a seed always yields the same sequence of pets, whatever
+  the batch_size.
+  Args:
+    count (int): Number of pet objects to generate
+    seed (int, optional): RNG seed, None for a random sequence
+    overrides (Dict[str, Any], optional): Field overrides applied to every pet, as in create_random_pet_body
+    batch_size (int): Number of pets drawn per batch, bounding memory use
+    ids (IdAllocator, optional): Take pet ids from an allocator (e.g. pet_ids) instead of the seeded RNG
+  Returns:
+    Iterator[Dict[str, Any]]: Pet objects, generated lazily batch by batch
+  """
+  draws = _PetDraws(seed)
+  status = PetStatus.AVAILABLE.value
+
+  for start in range(0, count, batch_size):
+    size = min(batch_size, count - start)
+    tags_total = size * DEFAULT_TAGS_COUNT
+    pet_id_batch = ids.allocate_many(size) if ids is not None else draws.integers('id', DEFAULT_PET_ID_MIN, DEFAULT_PET_ID_MAX, size)
+    category_ids = draws.integers('category_id', DEFAULT_CATEGORY_ID_MIN, DEFAULT_CATEGORY_ID_MAX, size)
+    category_names = _unique_strs(draws, 'category_name', 'category', size)
+    names = _unique_strs(draws, 'name', 'pet', size)
+    photo_urls = _image_urls(draws, size * DEFAULT_PHOTO_URLS_COUNT)
+    tag_ids = draws.integers('tag_id', DEFAULT_TAG_ID_MIN, DEFAULT_TAG_ID_MAX, tags_total)
+    tag_names = _unique_strs(draws, 'tag_name', 'tag', tags_total)
+
+    for i in range(size):
+      photos = i * DEFAULT_PHOTO_URLS_COUNT
+      tags = i * DEFAULT_TAGS_COUNT
+      payload = {
+        "id": pet_id_batch[i],
+        "category": {
+          "id": category_ids[i],
+          "name": category_names[i]
+        },
+        "name": names[i],
+        "photoUrls": photo_urls[photos:photos + DEFAULT_PHOTO_URLS_COUNT],
+        "tags": [
+          {"id": tag_ids[j], "name": tag_names[j]}
+          for j in range(tags, tags + DEFAULT_TAGS_COUNT)
+        ],
+        "status": status
+      }
+      if overrides:
+        payload.update(overrides)
+      yield payload
+
+def write_pet_bodies_jsonl(path: str, count: int, seed: Optional[int] = None, overrides: Optional[Dict[str, Any]] = None, **kwargs) -> int:
+  """
+  Stream generated pet objects to a JSONL file, one pet per line.
+  Args:
+    path (str): Output file path
+    count (int): Number of pet objects to write
+    seed (int, optional): RNG seed, None for a random sequence
+    overrides (Dict[str, Any], optional): Field overrides applied to every pet
+    **kwargs: Additional generate_pet_bodies options (batch_size, ids)
+  Returns:
+    int: Number of lines written
+  """
+  written = 0
+  encode = json.JSONEncoder(separators=(',', ':')).encode
+  with open(path, 'w', encoding='utf-8') as file:
+    for payload in generate_pet_bodies(count, seed=seed, overrides=overrides, **kwargs):
+      file.write(encode(payload) + '\n')
+      written += 1
+  return written
 
 def create_pet_with_status(status: PetStatus, overrides: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
   """
@@ -0,0 +1,39 @@
+import asyncio
+import allure
+
+from src.api.pet.async_pet_api import AsyncPetApi
+from src.api.pet.pet_assertions import PetAssertions
+from test_data.factories.pet_data_factory import create_random_pet_body
+
+FLOW_COUNT = 10
+
+async def create_and_get_pet(pet_api: AsyncPetApi):
+  payload = create_random_pet_body()
+  create_pet_res = await pet_api.create_pet(payload)
+  PetAssertions.assert_pet_created_successfully(create_pet_res)
+  pet_id = PetAssertions.get_pet_id(create_pet_res)
+  return payload, await pet_api.get_pet(pet_id)
+
+@allure.story('Async pet API')
+class TestAsyncPet:
+  def test_gather_create_pet_flows(self):
+    async def run():
+      async with AsyncPetApi(concurrency=5) as pet_api:
+        return await pet_api.gather(*(create_and_get_pet(pet_api) for _ in range(FLOW_COUNT)))
+
+    results = asyncio.run(run())
+    PetAssertions.is_equal(FLOW_COUNT, len(results))
+    for payload, get_pet_res in results:
+      PetAssertions.is_equal(payload['name'], PetAssertions.get_pet_name(get_pet_res))
+
+  def test_gather_returns_per_request_errors(self):
+    async def run():
+      async with AsyncPetApi(concurrency=2) as pet_api:
+        return await pet_api.gather(
+          pet_api.get_pet(9999999999999),
+          pet_api.get_pet(9999999999999, timeout='invalid')
+        )
+
+    not_found_res, error = asyncio.run(run())
+    PetAssertions.status_not_found(not_found_res.status_code)
+    PetAssertions.is_equal(ValueError, type(error))
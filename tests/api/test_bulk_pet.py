@@ -0,0 +1,30 @@
+import allure
+
+from src.api.core.types import BulkStatus
+from src.api.pet.pet_api import PetApi
+from src.api.pet.pet_assertions import PetAssertions
+from test_data.factories.pet_data_factory import create_random_pet_body
+
+pet_api = PetApi()
+
+BULK_SIZE = 10
+
+@allure.story('Bulk pet API')
+class TestBulkPet:
+  def test_create_pets_keeps_input_order(self):
+    payloads = [create_random_pet_body() for _ in range(BULK_SIZE)]
+    results = pet_api.create_pets(payloads)
+    PetAssertions.is_equal(list(range(BULK_SIZE)), [result.index for result in results])
+    for payload, result in zip(payloads, results):
+      PetAssertions.assert_pet_created_successfully(result.response)
+      PetAssertions.is_equal(payload['name'], PetAssertions.get_pet_name(result.response))
+    # Clean up created pets
+    pet_api.delete_pets([payload['id'] for payload in payloads])
+
+  def test_get_pets_stop_on_first_failure(self):
+    ids = [9999999999999] * BULK_SIZE
+    results = pet_api.get_pets(ids, max_workers=1, stop_on_failure=True)
+    PetAssertions.is_equal(BulkStatus.FAILED, results[0].status)
+    PetAssertions.status_not_found(results[0].response.status_code)
+    PetAssertions.is_equal([BulkStatus.SKIPPED] * (BULK_SIZE - 1), [result.status for result in results[1:]])
+
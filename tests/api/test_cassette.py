@@ -0,0 +1,49 @@
+import os
+import subprocess
+import sys
+import allure
+import pytest
+
+from src.api.core.cassette import Cassette, CassetteMissError
+from src.api.core.types import CassetteMode
+from src.api.pet.pet_api import PetApi
+from src.api.pet.pet_assertions import PetAssertions
+
+NON_EXISTENT_PET_ID = 9999999999999
+RECORDED_SUITE = ['tests/api/test_create_pet.py', 'tests/api/test_get_pet.py', 'tests/api/test_update_pet.py', 'tests/api/test_delete_pet.py']
+# Nothing listens there, so any request that is not replayed fails
+UNREACHABLE_BASE_URL = 'http://127.0.0.1:9/v2'
+
+def run_suite(cassette_path, mode, *options, env=None):
+  return subprocess.run(
+    [sys.executable, '-m', 'pytest', '-q', '-p', 'no:cacheprovider', *RECORDED_SUITE,
+     '--cassette-mode', mode, '--cassette', cassette_path, *options],
+    env={**os.environ, **(env or {})}, capture_output=True, text=True
+  )
+
+@allure.story('Record/replay API traffic')
+class TestCassette:
+  def test_replay_recorded_response(self, tmp_path):
+    cassette_path = str(tmp_path / 'pet.jsonl')
+    # Record a live response
+    recorded_res = PetApi(cassette=Cassette(cassette_path, CassetteMode.RECORD_MISSING)).get_pet(NON_EXISTENT_PET_ID)
+    # Replay it without network access
+    strict_cassette = Cassette(cassette_path, CassetteMode.STRICT)
+    replayed_res = PetApi(cassette=strict_cassette).get_pet(NON_EXISTENT_PET_ID)
+    PetAssertions.is_equal(recorded_res.status_code, replayed_res.status_code)
+    PetAssertions.is_equal(recorded_res.json(), replayed_res.json())
+    PetAssertions.is_equal(1, strict_cassette.hits)
+
+  def test_strict_cassette_rejects_unrecorded_request(self, tmp_path):
+    pet_api = PetApi(cassette=Cassette(str(tmp_path / 'empty.jsonl'), CassetteMode.STRICT))
+    with pytest.raises(CassetteMissError):
+      pet_api.get_pet(NON_EXISTENT_PET_ID)
+
+  def test_replay_recorded_suite_strict(self, tmp_path):
+    cassette_path = str(tmp_path / 'suite.jsonl')
+    # Record a real suite run against the emulator
+    recorded = run_suite(cassette_path, CassetteMode.RECORD_MISSING.value, '--api-emulator')
+    PetAssertions.is_equal(0, recorded.returncode)
+    # Replay it strictly, with no backend to fall back on
+    replayed = run_suite(cassette_path, CassetteMode.STRICT.value, env={'API_BASE_URL': UNREACHABLE_BASE_URL})
+    PetAssertions.is_equal(0, replayed.returncode)
@@ -3,7 +3,7 @@ import allure
 
 from src.api.pet.pet_api import PetApi
 from src.api.pet.pet_assertions import PetAssertions
-from src.api.pet.types import PetStatus
+from src.api.pet.types import Pet, PetStatus
 from src.utils.randomize import rand_unique_str, random_image_url
 from src.api.libs.utils.schema_validator import SchemaValidator
 
@@ -108,3 +108,20 @@ class TestCreatePet:
     pet_id = PetAssertions.get_pet_id(create_pet_res)
     get_pet_res = pet_api.get_pet(pet_id)
     PetAssertions.is_equal(images, PetAssertions.get_photo_urls(get_pet_res))
+
+  def test_create_pet_nested_fields(self):
+    # Create new pet
+    payload = create_random_pet_body()
+    create_pet_res = pet_api.create_pet(payload)
+    PetAssertions.assert_pet_created_successfully(create_pet_res)
+    PetAssertions.is_equal(payload['category']['name'], PetAssertions.get_value(create_pet_res, 'category.name'))
+    PetAssertions.is_equal(payload['tags'][0]['name'], PetAssertions.get_value(create_pet_res, 'tags[0].name'))
+    PetAssertions.is_equal(payload['photoUrls'][-1], PetAssertions.get_value(create_pet_res, 'photoUrls[-1]'))
+
+  def test_create_pet_from_model(self):
+    # Create new pet from a typed model
+    pet = Pet.from_wire(create_random_pet_body())
+    created = pet_api.create_pet(pet, as_model=True)
+    PetAssertions.is_equal(pet, created)
+    # Get created pet back as a model
+    PetAssertions.is_equal(pet, pet_api.get_pet(pet.id, as_model=True))
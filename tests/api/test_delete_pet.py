@@ -1,11 +1,17 @@
+import json
 import allure
 
+from src.api.core.types import ExpectedState
 from src.api.pet.pet_api import PetApi
 from src.api.pet.pet_assertions import PetAssertions
+from src.api.pet.pet_tracker import CreatedPetTracker
 from test_data.factories.pet_data_factory import create_random_pet_body
 
 pet_api = PetApi()
 
+def write_journal_entry(base_url, id):
+  return json.dumps({'op': 'add', 'id': id, 'base_url': base_url}) + '\n'
+
 @allure.story('Delete pet API')
 class TestDeletePet:
   @allure.testcase('https://diceus.atlassian.net/browse/TC-07')
@@ -35,3 +41,51 @@ class TestDeletePet:
   def test_delete_a_non_existent_pet(self):
     del_pet_res = pet_api.delete_pet(9999999999999)
     PetAssertions.status_not_found(del_pet_res.status_code)
+
+  def test_delete_a_pet_eventually(self):
+    # Create new pet
+    payload = create_random_pet_body()
+    create_pet_res = pet_api.create_pet(payload)
+    PetAssertions.assert_pet_created_successfully(create_pet_res)
+    pet_id = PetAssertions.get_pet_id(create_pet_res)
+    # Delete a pet once the backend has it
+    del_result = pet_api.delete_pet_eventually(pet_id)
+    PetAssertions.is_equal(True, del_result.converged)
+    PetAssertions.is_equal(str(pet_id), del_result.response.json()['message'])
+    # Wait until the deleted pet is gone
+    get_result = pet_api.get_pet_eventually(pet_id, expected=ExpectedState.ABSENT)
+    PetAssertions.is_equal(True, get_result.converged)
+
+  def test_cleanup_pets_left_by_aborted_run(self, tmp_path):
+    # Create a pet, then record it in the journal of a process that no longer exists
+    pet_id = PetAssertions.get_pet_id(pet_api.create_pet(create_random_pet_body()))
+    missing_id = 9999999999999
+    journal = ''.join(write_journal_entry(pet_api.base_url, id) for id in (pet_id, missing_id))
+    (tmp_path / 'pets-4194305.jsonl').write_text(journal)
+    # A new tracker adopts and deletes them
+    tracker = CreatedPetTracker(pet_api.base_url, str(tmp_path))
+    PetAssertions.is_equal(sorted([pet_id, missing_id]), tracker.pending())
+    report = tracker.cleanup(pet_api, retry_deadline=0.2)
+    PetAssertions.is_equal((1, 1, []), (report.deleted, report.absent, report.leftovers))
+    tracker.close()
+    PetAssertions.is_equal([], list(tmp_path.iterdir()))
+
+  def test_cleanup_keeps_pets_of_other_backends(self, tmp_path):
+    # An aborted run against another backend left a pet behind
+    other_base_url = 'https://other-backend.example/v2'
+    other_id = 9999999999999
+    (tmp_path / 'pets-4194305.jsonl').write_text(write_journal_entry(other_base_url, other_id))
+    # This run neither reports nor deletes it
+    tracker = CreatedPetTracker(pet_api.base_url, str(tmp_path))
+    PetAssertions.is_equal([], tracker.pending())
+    report = tracker.cleanup(pet_api, retry_deadline=0.2)
+    PetAssertions.is_equal((0, 0, []), (report.deleted, report.absent, report.leftovers))
+    tracker.close()
+    # It stays journaled for the next run against its own backend
+    PetAssertions.is_equal([other_id], CreatedPetTracker(other_base_url, str(tmp_path)).pending())
+
+  def test_tracker_writes_nothing_until_a_pet_is_tracked(self, tmp_path):
+    directory = tmp_path / 'pet_gc'
+    tracker = CreatedPetTracker(pet_api.base_url, str(directory))
+    tracker.close()
+    PetAssertions.is_equal(False, directory.exists())
@@ -1,9 +1,12 @@
 import allure
 
+from src.api.core.response_cache import ResponseCache
+from src.api.core.types import ExpectedState
 from src.api.pet.pet_api import PetApi
 from src.api.pet.pet_assertions import PetAssertions
-from test_data.factories.pet_data_factory import create_random_pet_body
+from test_data.factories.pet_data_factory import create_random_pet_body, update_pet_body
 from src.api.libs.utils.schema_validator import SchemaValidator
+from src.utils.randomize import rand_unique_str
 
 pet_api = PetApi()
 
@@ -25,3 +28,36 @@ class TestGetPet:
     get_pet_res = pet_api.get_pet(9999999999999)
     PetAssertions.status_not_found(get_pet_res.status_code)
     PetAssertions.is_equal('Pet not found', get_pet_res.json()['message'])
+
+  def test_get_pet_eventually_converges(self):
+    # Create new pet
+    payload = create_random_pet_body()
+    create_pet_res = pet_api.create_pet(payload)
+    PetAssertions.assert_pet_created_successfully(create_pet_res)
+    # Wait until the created pet is readable with the sent name
+    pet_id = PetAssertions.get_pet_id(create_pet_res)
+    result = pet_api.get_pet_eventually(pet_id, fields={'name': payload['name']})
+    PetAssertions.is_equal(True, result.converged)
+    PetAssertions.status_ok(result.response)
+    SchemaValidator.validate_response(result.response, 'pet.json')
+
+  def test_get_pet_eventually_absent(self):
+    result = pet_api.get_pet_eventually(9999999999999, expected=ExpectedState.ABSENT)
+    PetAssertions.is_equal(True, result.converged)
+    PetAssertions.is_equal(1, result.attempts)
+
+  def test_get_pet_from_cache(self):
+    cached_pet_api = PetApi(cache=ResponseCache())
+    # Create new pet, which seeds the cache
+    payload = create_random_pet_body()
+    create_pet_res = cached_pet_api.create_pet(payload)
+    PetAssertions.assert_pet_created_successfully(create_pet_res)
+    pet_id = PetAssertions.get_pet_id(create_pet_res)
+    # Get created pet from the cache
+    get_pet_res = cached_pet_api.get_pet(pet_id)
+    PetAssertions.is_equal(payload['name'], PetAssertions.get_pet_name(get_pet_res))
+    PetAssertions.is_equal(1, cached_pet_api.cache.stats()['hits'])
+    # Update pet, which invalidates the cached entry
+    update_payload = update_pet_body(payload, { 'name': rand_unique_str('new_name') })
+    cached_pet_api.update_pet(pet_id, update_payload)
+    PetAssertions.is_equal(0, len(cached_pet_api.cache))
@@ -0,0 +1,52 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import allure
+import pytest
+from requests import ConnectionError, Response
+
+from src.api.core.hedging import hedged_call
+from src.api.pet.pet_assertions import PetAssertions
+
+HEDGE_DELAY = 0.01
+
+def response(status_code: int) -> Response:
+  result = Response()
+  result.status_code = status_code
+  return result
+
+def attempts(primary, hedge):
+  """
+  Returns:
+    Callable: send() whose first call waits for the hedge to finish, then runs `primary`
+  """
+  hedge_done = threading.Event()
+  calls = iter(['primary', 'hedge'])
+  def send():
+    if next(calls) == 'hedge':
+      try:
+        return hedge()
+      finally:
+        hedge_done.set()
+    hedge_done.wait(timeout=5)
+    return primary()
+  return send
+
+def fail():
+  raise ConnectionError('connection reset')
+
+@allure.story('Hedged requests')
+class TestHedging:
+  def test_hedge_client_error_does_not_beat_primary(self):
+    send = attempts(lambda: response(200), lambda: response(404))
+    with ThreadPoolExecutor(max_workers=2) as executor:
+      PetAssertions.is_equal(200, hedged_call(send, HEDGE_DELAY, executor).status_code)
+
+  def test_hedge_client_error_returned_when_primary_fails(self):
+    send = attempts(fail, lambda: response(404))
+    with ThreadPoolExecutor(max_workers=2) as executor:
+      PetAssertions.is_equal(404, hedged_call(send, HEDGE_DELAY, executor).status_code)
+
+  def test_primary_error_raised_when_neither_answers(self):
+    send = attempts(fail, lambda: response(503))
+    with ThreadPoolExecutor(max_workers=2) as executor, pytest.raises(ConnectionError):
+      hedged_call(send, HEDGE_DELAY, executor)
@@ -0,0 +1,25 @@
+from concurrent.futures import ThreadPoolExecutor
+import allure
+
+from src.api.pet.pet_assertions import PetAssertions
+from test_data.factories.id_allocator import IdAllocator
+from test_data.factories.pet_data_factory import DEFAULT_PET_ID_MIN
+
+ALLOCATIONS = 1000
+
+@allure.story('Pet id allocation')
+class TestIdAllocator:
+  def test_id_allocator_is_collision_free(self):
+    first, second = IdAllocator(DEFAULT_PET_ID_MIN, worker=0), IdAllocator(DEFAULT_PET_ID_MIN, worker=1)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+      allocated = list(executor.map(lambda _: first.allocate(), range(ALLOCATIONS)))
+    PetAssertions.is_equal(ALLOCATIONS, len(set(allocated)))
+    PetAssertions.is_equal(sorted(allocated), sorted(first.issued()))
+    PetAssertions.is_equal([], [id for id in second.allocate_many(10) if first.owns(id)])
+
+  def test_restart_reproduces_ids(self):
+    allocator = IdAllocator(DEFAULT_PET_ID_MIN, worker=0)
+    allocator.restart(42)
+    ids = allocator.allocate_many(3)
+    allocator.restart(42)
+    PetAssertions.is_equal(ids, allocator.allocate_many(3))
@@ -0,0 +1,13 @@
+import allure
+
+from src.api.pet.pet_assertions import PetAssertions
+from src.utils.import_time import measure_imports
+
+HEAVY_MODULES = ['faker', 'jsonschema', 'selenium', 'webdriver_manager']
+
+@allure.story('Framework startup')
+class TestImportTime:
+  def test_api_modules_defer_heavy_imports(self):
+    report = measure_imports()
+    PetAssertions.is_equal([], [module for module in HEAVY_MODULES if report.loaded(module)])
+    PetAssertions.is_equal(True, report.total_ms > 0)
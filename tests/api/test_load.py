@@ -0,0 +1,14 @@
+import allure
+import pytest
+
+from src.api.pet.pet_assertions import PetAssertions
+
+@pytest.mark.load
+@allure.story('Pet API load')
+class TestPetLoad:
+  def test_crud_flow_mix_reaches_target_rate(self, pet_load):
+    report = pet_load(rate=20, duration=2, mix='crud=3,create_get=1')
+    # A flow stops at its first failed request, so every started flow either completes or records one error
+    failed_flows = sum(report.errors.values())
+    PetAssertions.is_equal(report.flows_started, report.flows_completed + failed_flows)
+    assert report.requests > 0, "No request was sent"
@@ -0,0 +1,64 @@
+import random
+import allure
+
+from src.api.core.metrics import BUCKET_COUNT, SUB_BUCKET_COUNT, SUB_BUCKET_HALF, ApiMetrics, LatencyHistogram
+from src.api.pet.pet_assertions import PetAssertions
+
+# Bucket width over its lowest value, the precision the histogram promises
+RELATIVE_ERROR = 1 / SUB_BUCKET_HALF
+
+@allure.story('API metrics')
+class TestLatencyHistogram:
+  def test_buckets_are_contiguous(self):
+    # Each bucket starts right after the highest value of the previous one
+    for index in range(BUCKET_COUNT - 1):
+      highest = LatencyHistogram._highest_value(index)
+      PetAssertions.is_equal(index, LatencyHistogram._index(highest))
+      PetAssertions.is_equal(index + 1, LatencyHistogram._index(highest + 1))
+
+  def test_bucket_value_within_relative_error(self):
+    rng = random.Random(1)
+    for value in list(range(SUB_BUCKET_COUNT)) + [rng.randrange(1, 1 << 36) for _ in range(2000)]:
+      highest = LatencyHistogram._highest_value(LatencyHistogram._index(value))
+      assert value <= highest <= value * (1 + RELATIVE_ERROR), f'{value} reported as {highest}'
+
+  def test_values_above_range_are_clamped(self):
+    PetAssertions.is_equal(BUCKET_COUNT - 1, LatencyHistogram._index(1 << 40))
+
+  def test_percentiles_within_relative_error(self):
+    rng = random.Random(7)
+    samples = sorted(int(rng.lognormvariate(10, 1)) for _ in range(20000))
+    histogram = LatencyHistogram()
+    for sample in samples:
+      histogram.record(sample)
+    for percentile in (50, 90, 99, 99.9):
+      exact = samples[round(percentile / 100 * len(samples)) - 1]
+      reported = histogram.percentile(percentile)
+      assert exact <= reported <= exact * (1 + RELATIVE_ERROR), f'p{percentile}: {reported}, exact {exact}'
+    PetAssertions.is_equal(samples[-1], histogram.percentile(100))
+    PetAssertions.is_equal(0, LatencyHistogram().percentile(50))
+
+  def test_merge_matches_recording_everything(self):
+    rng = random.Random(3)
+    samples = [rng.randrange(0, 5_000_000) for _ in range(5000)]
+    combined, first, second = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for position, sample in enumerate(samples):
+      combined.record(sample)
+      (first if position % 2 else second).record(sample)
+    first.merge(second)
+    first.merge(LatencyHistogram())
+    PetAssertions.is_equal(combined.to_dict(), first.to_dict())
+    PetAssertions.is_equal(combined.counts, LatencyHistogram.from_dict(combined.to_dict()).counts)
+
+  def test_exported_api_metrics_merge(self):
+    worker, controller = ApiMetrics(), ApiMetrics()
+    worker.record('GET', '/pet/{id}', 0.010, 200, bytes_in=100)
+    worker.record('GET', '/pet/{id}', 0.020, None)
+    worker.record_retries('GET', '/pet/{id}', 2)
+    controller.record('GET', '/pet/{id}', 0.030, 404, bytes_in=50)
+    controller.merge(worker.export())
+    (entry,) = controller.summary()
+    PetAssertions.is_equal(3, entry['count'])
+    PetAssertions.is_equal({'200': 1, '404': 1}, entry['statuses'])
+    PetAssertions.is_equal((150, 1, 2), (entry['bytes_in'], entry['errors'], entry['retries']))
+    PetAssertions.is_equal(30.0, entry['max_ms'])
@@ -0,0 +1,23 @@
+import json
+import allure
+import pytest
+
+from src.api.libs.utils.schema_validator import SchemaValidator
+from src.api.pet.pet_assertions import PetAssertions
+from test_data.factories.pet_data_factory import generate_pet_bodies, write_pet_bodies_jsonl
+
+@allure.story('Bulk pet data generation')
+class TestPetDataGenerator:
+  def test_generated_bodies_are_valid_and_seeded(self, tmp_path):
+    generated = tmp_path / 'generated.jsonl'
+    written = write_pet_bodies_jsonl(str(generated), 50, seed=7, overrides={ 'status': 'sold' })
+    PetAssertions.is_equal(50, written)
+    PetAssertions.is_equal(list(generate_pet_bodies(50, seed=7, overrides={ 'status': 'sold' })), [json.loads(line) for line in generated.read_text().splitlines()])
+
+    results = list(SchemaValidator.validate_jsonl(str(generated), 'pet.json', workers=2))
+    PetAssertions.is_equal([True] * 50, [result.valid for result in results])
+
+  @pytest.mark.parametrize('batch_size', [1, 7, 50])
+  def test_seeded_bodies_independent_of_batch_size(self, batch_size):
+    expected = list(generate_pet_bodies(50, seed=7))
+    PetAssertions.is_equal(expected, list(generate_pet_bodies(50, seed=7, batch_size=batch_size)))
@@ -0,0 +1,38 @@
+import allure
+from requests import Response
+
+from src.api.core.response_cache import ResponseCache
+from src.api.libs.utils.response_view import view
+from src.api.pet.pet_assertions import PetAssertions
+
+PET_URL = 'http://petstore.local/v2/pet/1'
+
+def response(body: str) -> Response:
+  result = Response()
+  result.status_code = 200
+  result._content = body.encode('utf-8')
+  result.encoding = 'utf-8'
+  result.url = PET_URL
+  return result
+
+@allure.story('Response cache')
+class TestResponseCache:
+  def test_cached_responses_are_not_shared(self):
+    cache = ResponseCache()
+    cache.put(PET_URL, response('{"name": "Buddy"}'))
+    view(cache.get(PET_URL)).json['name'] = 'changed'
+    cache.get(PET_URL).json()['name'] = 'changed'
+    PetAssertions.is_equal('Buddy', view(cache.get(PET_URL)).get('name'))
+    PetAssertions.is_equal(False, cache.get(PET_URL) is cache.get(PET_URL))
+
+  def test_put_after_invalidation_is_dropped(self):
+    cache = ResponseCache()
+    # A GET starts, then an update invalidates the URL before the GET's response is cached
+    generation = cache.generation(PET_URL)
+    cache.invalidate(PET_URL)
+    cache.put(PET_URL, response('{"name": "stale"}'), generation)
+    PetAssertions.is_equal(None, cache.get(PET_URL))
+    PetAssertions.is_equal(1, cache.stats()['stale_puts'])
+    # A GET started after the invalidation is cached
+    cache.put(PET_URL, response('{"name": "fresh"}'), cache.generation(PET_URL))
+    PetAssertions.is_equal('fresh', view(cache.get(PET_URL)).get('name'))
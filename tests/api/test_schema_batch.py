@@ -0,0 +1,31 @@
+import json
+import allure
+
+from src.api.core.types import ValidationMode
+from src.api.libs.utils.schema_validator import SchemaValidator
+from src.api.pet.pet_api import PetApi
+from src.api.pet.pet_assertions import PetAssertions
+from test_data.factories.pet_data_factory import create_random_pet_body
+
+pet_api = PetApi()
+
+@allure.story('Batch schema validation')
+class TestSchemaBatch:
+  def test_validate_captured_responses(self):
+    responses = [pet_api.create_pet(create_random_pet_body()) for _ in range(3)]
+    results = list(SchemaValidator.validate_many(responses, 'pet.json', workers=2))
+    PetAssertions.is_equal([0, 1, 2], sorted(result.index for result in results))
+    PetAssertions.is_equal([True] * 3, [result.valid for result in results])
+
+  def test_validate_jsonl_reports_all_errors(self, tmp_path):
+    captured = tmp_path / 'bodies.jsonl'
+    bodies = [
+      create_random_pet_body(),
+      create_random_pet_body({ 'status': 'unknown', 'photoUrls': [1] })
+    ]
+    captured.write_text(''.join(json.dumps(body) + '\n' for body in bodies))
+
+    results = sorted(SchemaValidator.validate_jsonl(str(captured), 'pet.json', mode=ValidationMode.EXHAUSTIVE, workers=2), key=lambda result: result.index)
+    PetAssertions.is_equal(True, results[0].valid)
+    PetAssertions.is_equal(['/photoUrls/0', '/status'], [pointer for pointer, _ in results[1].errors])
+
@@ -0,0 +1,57 @@
+import json
+import os
+import allure
+import pytest
+
+from src.api.libs.utils.schema_registry import SchemaRegistry
+from src.api.pet.pet_assertions import PetAssertions
+
+CATEGORY_SCHEMA = {
+  'definitions': {
+    'category': {'type': 'object', 'properties': {'id': {'type': 'integer'}}, 'required': ['id']}
+  }
+}
+PET_SCHEMA = {
+  'type': 'object',
+  'properties': {'category': {'$ref': 'common/category.json#/definitions/category'}}
+}
+
+def write_schema(path, schema):
+  path.parent.mkdir(parents=True, exist_ok=True)
+  path.write_text(json.dumps(schema))
+
+@allure.story('Schema registry')
+class TestSchemaRegistry:
+  def test_ref_resolved_across_files(self, tmp_path):
+    write_schema(tmp_path / 'common' / 'category.json', CATEGORY_SCHEMA)
+    write_schema(tmp_path / 'pet.json', PET_SCHEMA)
+    validator = SchemaRegistry(tmp_path).validator('pet.json')
+    PetAssertions.is_equal(True, validator.is_valid({'category': {'id': 1}}))
+    PetAssertions.is_equal(False, validator.is_valid({'category': {'id': 'one'}}))
+    PetAssertions.is_equal(False, validator.is_valid({'category': {}}))
+
+  def test_modified_schema_reloaded(self, tmp_path):
+    category_path = tmp_path / 'common' / 'category.json'
+    write_schema(category_path, CATEGORY_SCHEMA)
+    write_schema(tmp_path / 'pet.json', PET_SCHEMA)
+    registry = SchemaRegistry(tmp_path, check_interval=0)
+    PetAssertions.is_equal(False, registry.validator('pet.json').is_valid({'category': {'id': 'one'}}))
+    PetAssertions.is_equal(1, registry.loads)
+
+    # Unchanged files are not loaded again
+    registry.validator('pet.json')
+    PetAssertions.is_equal(1, registry.loads)
+
+    # The referenced file changes: ids become strings. Bump the mtime, as a rewrite can land in the same tick
+    write_schema(category_path, {'definitions': {'category': {'type': 'object', 'properties': {'id': {'type': 'string'}}}}})
+    stat = os.stat(category_path)
+    os.utime(category_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    PetAssertions.is_equal(True, registry.validator('pet.json').is_valid({'category': {'id': 'one'}}))
+    PetAssertions.is_equal(2, registry.loads)
+
+  def test_added_and_missing_schemas(self, tmp_path):
+    registry = SchemaRegistry(tmp_path, check_interval=0)
+    with pytest.raises(KeyError):
+      registry.validator('order.json')
+    write_schema(tmp_path / 'order.json', {'type': 'object'})
+    PetAssertions.is_equal(True, registry.validator('order.json').is_valid({}))
@@ -0,0 +1,61 @@
+import threading
+import allure
+import pytest
+
+from src.api.core import session_pool
+from src.api.core.session_pool import SessionPool, close_default_pool, get_default_pool
+from src.api.pet.pet_assertions import PetAssertions
+
+@pytest.fixture
+def isolated_default_pool(monkeypatch):
+  # Clients created at import time hold the suite's shared pool, which must stay open
+  monkeypatch.setattr(session_pool, '_default_pool', None)
+  yield
+  close_default_pool()
+
+@allure.story('Session pool')
+class TestSessionPool:
+  def test_one_session_per_thread(self):
+    pool = SessionPool()
+    sessions = []
+    threads = [threading.Thread(target=lambda: sessions.append(pool.session())) for _ in range(3)]
+    for thread in threads:
+      thread.start()
+    for thread in threads:
+      thread.join()
+    PetAssertions.is_equal(True, pool.session() is pool.session())
+    PetAssertions.is_equal(4, len({id(session) for session in sessions + [pool.session()]}))
+    pool.close()
+
+  def test_sessions_share_one_adapter(self):
+    pool = SessionPool(headers={'Accept': 'application/json'})
+    sessions = [pool.session()]
+    thread = threading.Thread(target=lambda: sessions.append(pool.session()))
+    thread.start()
+    thread.join()
+    adapters = {id(session.get_adapter(url)) for session in sessions for url in ('http://a.local', 'https://b.local')}
+    PetAssertions.is_equal({id(pool._adapter)}, adapters)
+    PetAssertions.is_equal('application/json', sessions[1].headers['Accept'])
+    pool.close()
+
+  def test_closed_pool_rejects_sessions(self):
+    pool = SessionPool()
+    pool.close()
+    pool.close()
+    with pytest.raises(RuntimeError):
+      pool.session()
+
+  def test_default_pool_recreated_after_close(self, isolated_default_pool):
+    pool = get_default_pool(pool_maxsize=4)
+    PetAssertions.is_equal(True, get_default_pool() is pool)
+    PetAssertions.is_equal(4, pool.pool_maxsize)
+
+    close_default_pool()
+    PetAssertions.is_equal(True, pool.closed)
+    recreated = get_default_pool()
+    PetAssertions.is_equal(False, recreated is pool)
+    PetAssertions.is_equal(False, recreated.closed)
+
+    # A pool closed directly is replaced as well
+    recreated.close()
+    PetAssertions.is_equal(False, get_default_pool() is recreated)
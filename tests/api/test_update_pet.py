@@ -1,7 +1,9 @@
 import allure
+import pytest
 
 from src.api.pet.pet_api import PetApi
 from src.api.pet.pet_assertions import PetAssertions
+from src.api.pet.types import Category, Pet, Tag
 from test_data.factories.pet_data_factory import (
   create_random_pet_body,
   update_pet_body
@@ -28,4 +30,23 @@ class TestUpdatePet:
     # Get updated pet
     get_pet_res = pet_api.get_pet(pet_id)
     PetAssertions.status_ok(get_pet_res)
-    PetAssertions.is_equal(update_payload['name'], get_pet_res.json()['name'])
\ No newline at end of file
+    PetAssertions.is_equal(update_payload['name'], get_pet_res.json()['name'])
+
+  def test_update_pet_model_nested_fields(self):
+    # Create new pet from a typed model
+    pet = pet_api.create_pet(Pet.from_wire(create_random_pet_body()), as_model=True)
+    # Override nested fields with wire-format dicts and models
+    new_tag_name = rand_unique_str('tag')
+    new_category = Category(name=rand_unique_str('category'))
+    updated = update_pet_body(pet, { 'tags': [{ 'name': new_tag_name }], 'category': new_category })
+    PetAssertions.is_equal([Tag(name=new_tag_name)], updated.tags)
+    PetAssertions.is_equal(new_category, updated.category)
+    # Update pet
+    PetAssertions.is_equal(updated, pet_api.update_pet(pet.id, updated, as_model=True))
+
+  def test_update_pet_model_rejects_unknown_keys(self):
+    pet = Pet.from_wire(create_random_pet_body())
+    # Overrides are keyed by wire name, so the attribute name photo_urls is not one
+    with pytest.raises(ValueError, match='photo_urls'):
+      update_pet_body(pet, { 'photo_urls': ['https://dummyimage.com/1x1'] })
+    PetAssertions.is_equal(['https://dummyimage.com/1x1'], update_pet_body(pet, { 'photoUrls': ['https://dummyimage.com/1x1'] }).photo_urls)
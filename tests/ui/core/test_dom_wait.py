@@ -0,0 +1,121 @@
+import allure
+import pytest
+from selenium.common.exceptions import JavascriptException, NoSuchElementException, TimeoutException
+from selenium.webdriver.common.by import By
+
+from src.ui.pages.core import dom_wait
+from src.ui.pages.core.dom_wait import MAX_SCRIPT_FAILURES, DomWaiter
+
+LOCATOR = (By.CSS_SELECTOR, 'div.position-list-item')
+
+class FakeClock:
+  """
+  Stands in for time.monotonic/time.sleep, so waits take no real time.
+  Attributes:
+    sleeps (List[float]): Every sleep requested, in order
+  """
+  def __init__(self) -> None:
+    self.now = 0.0
+    self.sleeps = []
+
+  def monotonic(self) -> float:
+    return self.now
+
+  def sleep(self, seconds: float):
+    self.sleeps.append(seconds)
+    self.now += seconds
+
+class StandInDriver:
+  """
+  Answers execute_async_script with queued results; exceptions in the queue are raised.
+  """
+  def __init__(self, *results) -> None:
+    self.results = list(results)
+    self.scripts = 0
+    self.script_timeouts = []
+
+  def execute_async_script(self, script, *args):
+    self.scripts += 1
+    result = self.results.pop(0)
+    if isinstance(result, Exception):
+      raise result
+    return result
+
+  def set_script_timeout(self, seconds):
+    self.script_timeouts.append(seconds)
+
+def after(calls: int, value='element'):
+  """
+  Returns:
+    Callable: Predicate that fails `calls` times, then returns `value`
+  """
+  attempts = []
+  def predicate(driver):
+    attempts.append(driver)
+    return value if len(attempts) > calls else None
+  return predicate
+
+@pytest.fixture
+def clock(monkeypatch):
+  clock = FakeClock()
+  monkeypatch.setattr(dom_wait.time, 'monotonic', clock.monotonic)
+  monkeypatch.setattr(dom_wait.time, 'sleep', clock.sleep)
+  return clock
+
+@allure.story('Event-driven waits')
+class TestDomWait:
+  def test_poll_backs_off_up_to_max_poll(self, clock):
+    waiter = DomWaiter(StandInDriver(), timeout=10, max_poll=0.1, event_driven=False)
+    assert waiter.poll(after(4)) == 'element'
+    assert clock.sleeps == pytest.approx([0.05, 0.075, 0.1, 0.1])
+
+  def test_poll_times_out_at_deadline(self, clock):
+    waiter = DomWaiter(StandInDriver(), timeout=10, event_driven=False)
+    with pytest.raises(TimeoutException, match='never'):
+      waiter.poll(after(1000), timeout=1, message='never')
+    assert sum(clock.sleeps) == pytest.approx(1)
+
+  def test_poll_ignores_missing_elements(self, clock):
+    def predicate(driver):
+      if not clock.sleeps:
+        raise NoSuchElementException('not yet')
+      return 'element'
+    assert DomWaiter(StandInDriver(), timeout=1, event_driven=False).poll(predicate) == 'element'
+
+  def test_event_wait_returns_script_result(self, clock):
+    driver = StandInDriver({'ok': True, 'value': 'element'}, {'ok': False})
+    waiter = DomWaiter(driver, timeout=10)
+    assert waiter.visible(LOCATOR, after(1000)) == 'element'
+    with pytest.raises(TimeoutException):
+      waiter.visible(LOCATOR, after(1000))
+    assert clock.sleeps == []
+
+  def test_script_failure_falls_back_to_polling(self, clock):
+    driver = StandInDriver(JavascriptException('navigated'))
+    waiter = DomWaiter(driver, timeout=10)
+    assert waiter.visible(LOCATOR, after(2)) == 'element'
+    assert (driver.scripts, len(clock.sleeps)) == (1, 2)
+    assert waiter.event_driven
+
+  def test_event_waits_off_after_repeated_failures(self, clock):
+    driver = StandInDriver(*[JavascriptException('no scripts')] * MAX_SCRIPT_FAILURES)
+    waiter = DomWaiter(driver, timeout=10)
+    for _ in range(MAX_SCRIPT_FAILURES):
+      waiter.visible(LOCATOR, after(0))
+    assert not waiter.event_driven
+    waiter.visible(LOCATOR, after(0))
+    assert driver.scripts == MAX_SCRIPT_FAILURES
+
+  def test_strategy_without_script_support_polls(self, clock):
+    driver = StandInDriver()
+    waiter = DomWaiter(driver, timeout=10)
+    assert waiter.visible((By.LINK_TEXT, 'Careers'), after(1)) == 'element'
+    assert driver.scripts == 0
+
+  def test_script_timeout_raised_for_longer_waits(self, clock):
+    driver = StandInDriver(*[{'ok': True, 'value': True}] * 3)
+    waiter = DomWaiter(driver, timeout=10)
+    waiter.ready(after(1000))
+    waiter.ready(after(1000), timeout=30)
+    waiter.ready(after(1000), timeout=5)
+    assert driver.script_timeouts == [15, 35]
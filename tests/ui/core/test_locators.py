@@ -0,0 +1,59 @@
+import allure
+import pytest
+from selenium.webdriver.common.by import By
+
+from src.ui.pages.core.locators import LocatorRegistry, xpath_to_css
+
+@allure.story('Locator registry')
+class TestLocators:
+  @pytest.mark.parametrize('xpath, css',
+    [
+      ("//div[@class='position-list-item']", 'div[class="position-list-item"]'),
+      ('//a/b', 'a > b'),
+      ("//ul[@class='navbar-nav']//a[@href]", 'ul[class="navbar-nav"] a[href]'),
+      ('//*[@id]', '[id]'),
+      ("//*[@id='x' and @data-k=\"v'q\"]", '[id="x"][data-k="v\'q"]'),
+      ("//a[@x='1'][@y]", 'a[x="1"][y]'),
+      ("//a[@title='he said \"hi\"']", 'a[title="he said \\"hi\\""]'),
+      ("//a[@x='and y']", 'a[x="and y"]'),
+      (".//x[@a='v']", 'x[a="v"]'),
+      ('//input[@type]', 'input[type]'),
+    ],
+    ids=['attribute', 'child', 'descendant', 'any tag', 'and', 'predicates', 'quotes', 'and in value', 'single-step relative',
+         'case-insensitive attribute presence']
+  )
+  def test_xpath_rewritten_to_css(self, xpath, css):
+    assert xpath_to_css(xpath) == css
+
+  @pytest.mark.parametrize('xpath',
+    [
+      "//a[contains(text(), 'x')]",
+      "//span[@id='a' and text()='b']",
+      "//a[@x='1' or @y='2']",
+      "//a[@x='1' and]",
+      "//a[@x='1' andy]",
+      '//a[]',
+      '//div[1]',
+      '//div[last()]',
+      './/a//b',
+      '/html/body',
+      '//a/following-sibling::b',
+      '//DIV',
+      "//input[@type='TEXT']",
+      "//html[@lang='en' and @id]",
+      '//a[@HREF]',
+    ],
+    ids=['text', 'and text', 'or', 'dangling and', 'not and', 'empty predicate', 'position', 'last',
+         'multi-step relative', 'absolute', 'axis', 'uppercase tag', 'case-insensitive value',
+         'case-insensitive value with and', 'uppercase attribute']
+  )
+  def test_xpath_without_css_equivalent_kept(self, xpath):
+    assert xpath_to_css(xpath) is None
+    # The registry keeps such locators as XPath
+    assert tuple(LocatorRegistry().compile(By.XPATH, xpath)) == (By.XPATH, xpath)
+
+  def test_parameterized_locator_memoized(self):
+    registry = LocatorRegistry()
+    template = registry.template(By.XPATH, "//li[@data-value='{}']")
+    assert template('Istanbul') is template('Istanbul')
+    assert tuple(template('Istanbul')) == (By.CSS_SELECTOR, 'li[data-value="Istanbul"]')
@@ -0,0 +1,124 @@
+import itertools
+import allure
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from src.ui.driver.driver_pool import RESET_URL, DriverPool, reset_driver
+
+class StandInDriver:
+  """
+  Records what the pool and reset_driver do to a session, without a browser.
+  Attributes:
+    history (Dict[str, List[str]]): URLs visited per window handle
+  """
+  _numbers = itertools.count()
+
+  def __init__(self, history=None, cdp=True) -> None:
+    self.number = next(self._numbers)
+    self.history = history or {'main': []}
+    self.current = next(iter(self.history))
+    self.cleared_origins = []
+    self.calls = []
+    self.quit_calls = 0
+    self.switch_to = self
+    if cdp:
+      self.execute_cdp_cmd = self._execute_cdp_cmd
+
+  @property
+  def window_handles(self):
+    return list(self.history)
+
+  def window(self, handle):
+    self.current = handle
+
+  def close(self):
+    del self.history[self.current]
+
+  def execute_script(self, script, *args):
+    self.calls.append('script')
+    return []
+
+  def _execute_cdp_cmd(self, command, params):
+    if command == 'Page.getNavigationHistory':
+      return {'entries': [{'url': url} for url in self.history[self.current]]}
+    if command == 'Storage.clearDataForOrigin':
+      self.cleared_origins.append(params['origin'])
+    self.calls.append(command)
+    return {}
+
+  def delete_all_cookies(self):
+    self.calls.append('delete_all_cookies')
+
+  def get(self, url):
+    self.history[self.current].append(url)
+
+  def quit(self):
+    self.quit_calls += 1
+
+def failing_reset(driver):
+  raise WebDriverException('browser not reachable')
+
+@allure.story('Browser session pool')
+class TestDriverPool:
+  def test_released_session_is_reset_and_reused(self):
+    reset = []
+    pool = DriverPool(StandInDriver, size=1, max_uses=0, reset=reset.append)
+    first = pool.acquire()
+    pool.release(first)
+    assert pool.acquire() is first
+    assert reset == [first]
+    assert pool.stats()['created'] == 1
+
+  def test_session_replaced_after_max_uses(self):
+    pool = DriverPool(StandInDriver, size=1, max_uses=2, reset=lambda driver: None)
+    first = pool.acquire()
+    pool.release(first)
+    assert pool.acquire() is first
+    pool.release(first)
+    assert pool.acquire() is not first
+    assert first.quit_calls == 1
+    assert (pool.created, pool.recycled) == (2, 1)
+
+  def test_session_replaced_when_reset_fails(self):
+    pool = DriverPool(StandInDriver, size=1, max_uses=0, reset=failing_reset)
+    first = pool.acquire()
+    pool.release(first)
+    assert first.quit_calls == 1
+    assert pool.acquire() is not first
+
+  def test_acquire_times_out_when_pool_is_busy(self):
+    pool = DriverPool(StandInDriver, size=1, reset=lambda driver: None)
+    pool.acquire()
+    with pytest.raises(TimeoutError):
+      pool.acquire(timeout=0.01)
+
+  def test_prewarm_launches_sessions_in_background(self):
+    pool = DriverPool(StandInDriver, size=2, reset=lambda driver: None)
+    threads = pool.prewarm(5)
+    for thread in threads:
+      thread.join(timeout=5)
+    assert len(threads) == 2
+    drivers = [pool.acquire(timeout=0.01) for _ in range(2)]
+    assert len({id(driver) for driver in drivers}) == 2
+    assert pool.created == 2
+    pool.close()
+    for driver in drivers:
+      pool.release(driver)
+    assert [driver.quit_calls for driver in drivers] == [1, 1]
+
+  def test_reset_clears_every_visited_origin(self):
+    driver = StandInDriver({
+      'main': ['https://diceus.com/', 'https://diceus.com/careers', 'https://jobs.lever.co/diceus'],
+      'popup': ['https://www.linkedin.com/company/diceus', 'about:blank']
+    })
+    reset_driver(driver)
+    assert driver.cleared_origins == ['https://diceus.com', 'https://jobs.lever.co', 'https://www.linkedin.com']
+    assert driver.window_handles == ['main']
+    assert driver.history['main'][-1] == RESET_URL
+    assert driver.calls[-1] == 'Network.clearBrowserCookies'
+
+  def test_reset_without_cdp_clears_open_windows(self):
+    driver = StandInDriver({'main': ['https://diceus.com/'], 'popup': ['https://diceus.com/careers']}, cdp=False)
+    reset_driver(driver)
+    assert driver.calls == ['script', 'script', 'delete_all_cookies']
+    assert driver.window_handles == ['main']
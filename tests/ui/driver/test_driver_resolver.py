@@ -0,0 +1,97 @@
+import json
+import threading
+import allure
+import pytest
+
+from src.ui.driver import driver_resolver
+from src.ui.driver.driver_resolver import INDEX_FILE, resolve_driver_path
+
+@pytest.fixture
+def installed(monkeypatch, tmp_path):
+  """
+  Chrome 131 installed, chromedriver downloads counted instead of fetched.
+  Returns:
+    dict: 'version' of the installed browser and the 'downloads' made so far
+  """
+  state = {'version': '131.0.6778.85', 'downloads': []}
+
+  def download(browser):
+    path = tmp_path / 'bin' / f"{browser}driver-{state['version']}"
+    path.parent.mkdir(exist_ok=True)
+    path.write_text('')
+    state['downloads'].append(str(path))
+    return str(path)
+
+  monkeypatch.setattr(driver_resolver, '_download', download)
+  monkeypatch.setattr(driver_resolver, 'browser_version', lambda browser: state['version'])
+  monkeypatch.setattr(driver_resolver, '_resolved', {})
+  monkeypatch.delenv('CHROMEDRIVER_PATH', raising=False)
+  return state
+
+def read_index(cache_dir):
+  return json.loads((cache_dir / INDEX_FILE).read_text())
+
+@allure.story('Driver binary resolution')
+class TestDriverResolver:
+  def test_resolved_driver_recorded_in_index(self, installed, tmp_path, monkeypatch):
+    cache_dir = tmp_path / 'cache'
+    path = resolve_driver_path('Chrome', cache_dir=str(cache_dir))
+    assert installed['downloads'] == [path]
+    [(key, entry)] = read_index(cache_dir).items()
+    assert key.endswith('/chrome/131')
+    assert (entry['path'], entry['browser_version']) == (path, '131.0.6778.85')
+    # Another process finds it in the index without downloading
+    monkeypatch.setattr(driver_resolver, '_resolved', {})
+    assert resolve_driver_path('chrome', cache_dir=str(cache_dir)) == path
+    assert len(installed['downloads']) == 1
+
+  def test_new_major_version_downloads_again(self, installed, tmp_path, monkeypatch):
+    cache_dir = tmp_path / 'cache'
+    resolve_driver_path('chrome', cache_dir=str(cache_dir))
+    installed['version'] = '132.0.6834.57'
+    monkeypatch.setattr(driver_resolver, '_resolved', {})
+    resolve_driver_path('chrome', cache_dir=str(cache_dir))
+    assert len(installed['downloads']) == 2
+    assert len(read_index(cache_dir)) == 2
+
+  def test_concurrent_resolutions_download_once(self, installed, tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    paths = []
+    # Each thread opens the lock file itself, so they contend on the file lock like worker processes do
+    threads = [threading.Thread(target=lambda: paths.append(resolve_driver_path('chrome', cache_dir=cache_dir))) for _ in range(8)]
+    for thread in threads:
+      thread.start()
+    for thread in threads:
+      thread.join(timeout=10)
+    assert len(installed['downloads']) == 1
+    assert set(paths) == set(installed['downloads'])
+
+  def test_offline_falls_back_to_latest_cached_driver(self, installed, tmp_path, monkeypatch):
+    cache_dir = tmp_path / 'cache'
+    path = resolve_driver_path('chrome', cache_dir=str(cache_dir))
+    installed['version'] = '132.0.6834.57'
+    assert resolve_driver_path('chrome', offline=True, cache_dir=str(cache_dir)) == path
+    assert len(installed['downloads']) == 1
+
+  def test_offline_without_cached_driver_fails(self, installed, tmp_path):
+    with pytest.raises(RuntimeError, match='CHROMEDRIVER_PATH'):
+      resolve_driver_path('chrome', offline=True, cache_dir=str(tmp_path / 'empty'))
+    assert installed['downloads'] == []
+
+  def test_memo_is_per_cache_dir_and_mode(self, installed, tmp_path):
+    first = resolve_driver_path('chrome', cache_dir=str(tmp_path / 'first'))
+    # A different cache directory has its own index, and offline mode must not see this process's resolution there
+    with pytest.raises(RuntimeError):
+      resolve_driver_path('chrome', offline=True, cache_dir=str(tmp_path / 'second'))
+    resolve_driver_path('chrome', cache_dir=str(tmp_path / 'second'))
+    assert len(installed['downloads']) == 2
+    assert resolve_driver_path('chrome', cache_dir=str(tmp_path / 'first')) == first
+
+  def test_explicit_path_wins(self, installed, tmp_path, monkeypatch):
+    monkeypatch.setenv('CHROMEDRIVER_PATH', '/opt/chromedriver')
+    assert resolve_driver_path('chrome', offline=True, cache_dir=str(tmp_path)) == '/opt/chromedriver'
+    assert installed['downloads'] == []
+
+  def test_unsupported_browser(self):
+    with pytest.raises(ValueError):
+      resolve_driver_path('safari')
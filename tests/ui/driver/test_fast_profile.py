@@ -0,0 +1,50 @@
+import json
+import allure
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from src.ui.driver.fast_profile import DEFAULT_ESTIMATED_BYTES, ESTIMATED_RESOURCE_BYTES, BlockingStats, collect_blocking_stats
+
+class StandInDriver:
+  def __init__(self, events) -> None:
+    self.events = events
+
+  def get_log(self, log_type):
+    assert log_type == 'performance'
+    return [{'message': json.dumps({'message': {'method': method, 'params': params}})} for method, params in self.events]
+
+def sent(request_id, resource_type):
+  return 'Network.requestWillBeSent', {'requestId': request_id, 'type': resource_type}
+
+def failed(request_id, reason='inspector', resource_type=None):
+  params = {'requestId': request_id, 'blockedReason': reason}
+  if resource_type:
+    params['type'] = resource_type
+  return 'Network.loadingFailed', params
+
+def finished(request_id, size):
+  return 'Network.loadingFinished', {'requestId': request_id, 'encodedDataLength': size}
+
+@allure.story('Fast browser profile')
+class TestFastProfile:
+  @pytest.mark.parametrize('events, expected',
+    [
+      ([failed('1', resource_type='Image')], BlockingStats(1, ESTIMATED_RESOURCE_BYTES['Image'], 0)),
+      ([sent('1', 'Font'), failed('1')], BlockingStats(1, ESTIMATED_RESOURCE_BYTES['Font'], 0)),
+      ([sent('1', 'Font'), failed('1', resource_type='Media')], BlockingStats(1, ESTIMATED_RESOURCE_BYTES['Media'], 0)),
+      ([failed('1')], BlockingStats(1, DEFAULT_ESTIMATED_BYTES, 0)),
+      ([sent('1', 'Image'), failed('1', reason='mixed-content'), failed('2', reason=None)], BlockingStats(0, 0, 0)),
+      ([sent('1', 'Document'), finished('1', 1500.0), finished('2', 500)], BlockingStats(0, 0, 2000)),
+      ([('Network.responseReceived', {'requestId': '1'}), ('Page.loadEventFired', {})], BlockingStats(0, 0, 0)),
+    ],
+    ids=['blocked with type', 'type from request', 'own type wins', 'unknown type', 'not blocked by pattern',
+         'loaded bytes', 'other events']
+  )
+  def test_blocking_stats_from_performance_log(self, events, expected):
+    assert collect_blocking_stats(StandInDriver(events)) == expected
+
+  def test_no_stats_without_performance_log(self):
+    class NoLogDriver:
+      def get_log(self, log_type):
+        raise WebDriverException('log type performance not found')
+    assert collect_blocking_stats(NoLogDriver()) is None